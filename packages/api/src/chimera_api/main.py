@@ -80,6 +80,11 @@ async def lifespan(app: FastAPI):
         print(f"Warning: Model registry initialization failed: {e}")
         # Non-fatal - API will work without pre-cached models
 
+    # Build deferred VSP event schemas before the first request streams
+    from chimera_core.ui.vsp_events import build_vsp_models
+
+    build_vsp_models()
+
     yield
 
     # Shutdown
@@ -101,6 +106,14 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Close pooled provider HTTP connections
+    try:
+        from chimera_core.models import close_registry
+
+        await close_registry()
+    except Exception:
+        pass
+
 
 app = FastAPI(title="Chimera v4 Backend", lifespan=lifespan)
 
@@ -6,28 +6,140 @@ Uses connection pooling and supports TTL-based expiration.
 
 import asyncio
 import fnmatch
+import functools
+import heapq
 import json
 import logging
 import os
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Default SCAN COUNT hint for RedisCache.keys (keys examined per round-trip)
+DEFAULT_SCAN_COUNT = int(os.getenv("REDIS_SCAN_COUNT", "1000"))
+
+# Connection pool tuning for RedisCache
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))  # seconds
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))  # seconds
+
+# Reconnect backoff after a failed connection attempt (doubles up to the cap)
+RECONNECT_BACKOFF_INITIAL_NS = 500_000_000  # 0.5s
+RECONNECT_BACKOFF_MAX_NS = 30_000_000_000  # 30s
+
+# In-process cache of decoded get_json values in CacheClient
+JSON_LOCAL_CACHE_SIZE = int(os.getenv("CACHE_JSON_LOCAL_SIZE", "512"))
+JSON_LOCAL_CACHE_TTL = float(os.getenv("CACHE_JSON_LOCAL_TTL", "5"))  # seconds
+
+
+def encode_json(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when installed.
+
+    Values JSON can't represent are converted with str(); non-string dict
+    keys are stringified as the json module does.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode()
+
+
+def decode_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> Callable[[str], Optional[re.Match[str]]]:
+    """Compile a glob pattern to a regex matcher, cached by pattern."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+# Store size above which keys() hands matching to Hyperscan (if installed)
+HYPERSCAN_MIN_KEYS = 10_000
+
+# Separator between keys in the buffer scanned by Hyperscan
+_KEY_SEP = "\x00"
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_hyperscan(pattern: str) -> Optional[Any]:
+    """Compile a glob into a Hyperscan block-mode database, cached by pattern.
+
+    The database matches whole keys inside a NUL-separated buffer. Returns None
+    when hyperscan isn't installed or the pattern uses character classes, in
+    which case callers use the compiled-regex path.
+    """
+    if "[" in pattern or _KEY_SEP in pattern:
+        return None
+    try:
+        import hyperscan  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    any_char = "[^\\x00]"
+    body = "".join(
+        any_char + "*" if c == "*" else any_char if c == "?" else re.escape(c) for c in pattern
+    )
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[f"\\x00{body}\\x00".encode()],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    except Exception as e:
+        logger.debug("Hyperscan compile failed for %r: %s", pattern, e)
+        return None
+    return db
+
+
+def _hyperscan_filter(db: Any, keys: list[str]) -> Optional[list[str]]:
+    """Match keys against a Hyperscan database in one scan call.
+
+    Keys are joined into a single NUL-separated buffer and each match's
+    offsets slice the matched key back out. Returns None if a key contains NUL.
+    """
+    data = (_KEY_SEP + _KEY_SEP.join(keys) + _KEY_SEP).encode()
+    if data.count(0) != len(keys) + 1:
+        return None
+
+    matched: list[str] = []
+
+    def on_match(_id: int, start: int, end: int, _flags: int, _context: Any) -> None:
+        matched.append(data[start + 1 : end - 1].decode())
+
+    db.scan(data, match_event_handler=on_match)
+    return matched
+
 
 class CacheBackend(ABC):
     """Abstract cache backend interface."""
 
     @abstractmethod
-    async def get(self, key: str) -> Optional[str]:
-        """Get value by key."""
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get raw value bytes by key."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Set raw value bytes with optional TTL in seconds."""
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
-        """Set value with optional TTL in seconds."""
+    async def expire(self, key: str, ttl: int) -> bool:
+        """Reset the TTL of an existing key; False if the key doesn't exist."""
         pass
 
     @abstractmethod
@@ -41,8 +153,8 @@ class CacheBackend(ABC):
         pass
 
     @abstractmethod
-    async def keys(self, pattern: str) -> list[str]:
-        """Get keys matching pattern."""
+    async def keys(self, pattern: str, key_type: Optional[str] = None) -> list[str]:
+        """Get keys matching pattern, optionally only those of a Redis data type."""
         pass
 
     @abstractmethod
@@ -61,10 +173,24 @@ class InMemoryCache(CacheBackend):
 
     Used as fallback when Redis is unavailable.
     Data is lost on restart.
+
+    Expiry uses monotonic nanoseconds and a min-heap of (expiry, key). Reads
+    check expiry per entry; bulk cleanup runs in a background task started by
+    a TTL'd set and stopped once the heap drains, so request latency doesn't
+    depend on cache size and an idle cache doesn't keep waking up.
     """
 
+    # Seconds between background purge passes
+    EXPIRY_INTERVAL = 1.0
+    # Max heap entries popped per lock acquisition
+    EXPIRY_BATCH = 1024
+
     def __init__(self):
-        self._store: dict[str, tuple[str, Optional[float]]] = {}  # key -> (value, expiry_time)
+        # key -> (value, expiry_ns); expiry_ns is time.monotonic_ns() based
+        self._store: dict[str, tuple[bytes, Optional[int]]] = {}
+        # (expiry_ns, key) entries; stale after overwrite/delete, checked on pop
+        self._expiry: list[tuple[int, str]] = []
+        self._expiry_task: Optional[asyncio.Task[None]] = None
         self._lock: Optional[asyncio.Lock] = None
 
     def _get_lock(self) -> asyncio.Lock:
@@ -73,20 +199,90 @@ class InMemoryCache(CacheBackend):
             self._lock = asyncio.Lock()
         return self._lock
 
-    async def get(self, key: str) -> Optional[str]:
+    def _ensure_expiry_task(self) -> None:
+        """Start the background purge task if it isn't running."""
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expiry_loop())
+
+    async def _expiry_loop(self) -> None:
+        """Periodically purge expired entries in bounded batches.
+
+        Exits once nothing is left to expire; the next TTL'd write restarts it.
+        """
+        while True:
+            await asyncio.sleep(self.EXPIRY_INTERVAL)
+            more = True
+            while more:
+                async with self._get_lock():
+                    more = self._purge_expired(time.monotonic_ns(), self.EXPIRY_BATCH)
+                    if not more:
+                        self._compact_expiry()
+                        if not self._expiry:
+                            # Under the lock, so a concurrent set sees None and restarts us
+                            self._expiry_task = None
+                            return
+                # Let other tasks run between batches
+                await asyncio.sleep(0)
+
+    def _purge_expired(self, now_ns: int, limit: int) -> bool:
+        """Drop up to `limit` expired heap entries (caller holds lock).
+
+        Returns True if expired entries remain.
+        """
+        heap = self._expiry
+        store = self._store
+        for _ in range(limit):
+            if not heap or heap[0][0] > now_ns:
+                return False
+            exp_ns, key = heapq.heappop(heap)
+            entry = store.get(key)
+            # Skip tombstones left by overwrites and deletes
+            if entry is not None and entry[1] == exp_ns:
+                del store[key]
+        return bool(heap) and heap[0][0] <= now_ns
+
+    def _compact_expiry(self) -> None:
+        """Rebuild the heap once stale entries dominate it (caller holds lock)."""
+        if len(self._expiry) > 2 * len(self._store) + 64:
+            self._expiry = [(e, k) for k, (_, e) in self._store.items() if e is not None]
+            heapq.heapify(self._expiry)
+
+    def _live_entry(self, key: str) -> Optional[tuple[bytes, Optional[int]]]:
+        """Return the entry for key, evicting it if expired (caller holds lock)."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        exp_ns = entry[1]
+        if exp_ns is not None and exp_ns <= time.monotonic_ns():
+            del self._store[key]
+            return None
+        return entry
+
+    async def get(self, key: str) -> Optional[bytes]:
         async with self._get_lock():
-            if key not in self._store:
-                return None
-            value, expiry = self._store[key]
-            if expiry is not None and time.time() > expiry:
-                del self._store[key]
-                return None
-            return value
+            entry = self._live_entry(key)
+            return entry[0] if entry is not None else None
 
-    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
         async with self._get_lock():
-            expiry = time.time() + ttl if ttl else None
-            self._store[key] = (value, expiry)
+            if ttl:
+                exp_ns = time.monotonic_ns() + ttl * 1_000_000_000
+                self._store[key] = (value, exp_ns)
+                heapq.heappush(self._expiry, (exp_ns, key))
+                self._ensure_expiry_task()
+            else:
+                self._store[key] = (value, None)
+            return True
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        async with self._get_lock():
+            entry = self._live_entry(key)
+            if entry is None:
+                return False
+            exp_ns = time.monotonic_ns() + ttl * 1_000_000_000
+            self._store[key] = (entry[0], exp_ns)
+            heapq.heappush(self._expiry, (exp_ns, key))
+            self._ensure_expiry_task()
             return True
 
     async def delete(self, key: str) -> bool:
@@ -98,82 +294,139 @@ class InMemoryCache(CacheBackend):
 
     async def exists(self, key: str) -> bool:
         async with self._get_lock():
-            if key not in self._store:
-                return False
-            value, expiry = self._store[key]
-            if expiry is not None and time.time() > expiry:
-                del self._store[key]
-                return False
-            return True
+            return self._live_entry(key) is not None
 
-    async def keys(self, pattern: str) -> list[str]:
-        """Pattern matching using fnmatch (glob-style)."""
-        async with self._get_lock():
-            # Clean expired keys first
-            now = time.time()
-            expired = [k for k, (_, exp) in self._store.items() if exp is not None and now > exp]
-            for k in expired:
-                del self._store[k]
+    async def keys(self, pattern: str, key_type: Optional[str] = None) -> list[str]:
+        """Glob-style pattern matching (fnmatch semantics).
 
-            # Glob-style pattern matching
-            return [k for k in self._store if fnmatch.fnmatch(k, pattern)]
+        Expired entries not yet purged are skipped. Large stores are matched
+        with Hyperscan when it is installed. Every value here is a string, so
+        any other key_type matches nothing.
+        """
+        if key_type is not None and key_type != "string":
+            return []
+        async with self._get_lock():
+            now_ns = time.monotonic_ns()
+            items = self._store.items()
+            if len(self._store) >= HYPERSCAN_MIN_KEYS:
+                db = _compile_hyperscan(pattern)
+                if db is not None:
+                    live = [k for k, (_, e) in items if e is None or e > now_ns]
+                    matched = _hyperscan_filter(db, live)
+                    if matched is not None:
+                        return matched
+
+            match = _compile_glob(pattern)
+            return [k for k, (_, e) in items if (e is None or e > now_ns) and match(k)]
 
     async def close(self) -> None:
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
         self._store.clear()
+        self._expiry.clear()
 
     def is_connected(self) -> bool:
         return True
 
 
 class RedisCache(CacheBackend):
-    """Redis cache backend using redis-py async."""
+    """Redis cache backend using redis-py async.
+
+    Uses a bounded blocking connection pool: callers wait for a free
+    connection (up to the socket timeout) instead of opening unbounded
+    sockets, and idle connections are health-checked before reuse.
+
+    Reconnects are serialized: one coroutine attempts while others wait and
+    share its result, and failed attempts back off exponentially.
+    """
 
     def __init__(self, url: str):
         self._url = url
+        # Redact credentials from URL for logging
+        parsed = urlparse(url)
+        self._safe_url = f"{parsed.hostname}:{parsed.port or 6379}"
         self._redis: Optional[Any] = None
+        self._pool: Optional[Any] = None
         self._connected = False
+        self._conn_lock: Optional[asyncio.Lock] = None
+        self._last_fail_ns: Optional[int] = None
+        self._backoff_ns = RECONNECT_BACKOFF_INITIAL_NS
+
+    def _get_conn_lock(self) -> asyncio.Lock:
+        """Get or create the reconnect lock for the current event loop."""
+        if self._conn_lock is None:
+            self._conn_lock = asyncio.Lock()
+        return self._conn_lock
 
     async def _ensure_connection(self) -> bool:
         """Ensure Redis connection is established."""
         if self._redis is not None and self._connected:
             return True
 
+        async with self._get_conn_lock():
+            # Another coroutine may have connected while we waited
+            if self._redis is not None and self._connected:
+                return True
+            if (
+                self._last_fail_ns is not None
+                and time.monotonic_ns() - self._last_fail_ns < self._backoff_ns
+            ):
+                return False
+
+            if await self._connect():
+                self._last_fail_ns = None
+                self._backoff_ns = RECONNECT_BACKOFF_INITIAL_NS
+                return True
+
+            if self._last_fail_ns is not None:
+                self._backoff_ns = min(self._backoff_ns * 2, RECONNECT_BACKOFF_MAX_NS)
+            self._last_fail_ns = time.monotonic_ns()
+            return False
+
+    async def _connect(self) -> bool:
+        """Build the connection pool and verify it with PING (caller holds lock)."""
         try:
             import redis.asyncio as redis  # type: ignore[import-untyped]
 
-            self._redis = redis.from_url(
+            if self._pool is not None:
+                # Drop sockets from a previous failed connection
+                await self._pool.disconnect()
+            self._pool = redis.BlockingConnectionPool.from_url(
                 self._url,
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_SOCKET_TIMEOUT,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                socket_keepalive=True,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
             )
+            self._redis = redis.Redis(connection_pool=self._pool)
             # Test connection
             await self._redis.ping()
             self._connected = True
-            # Redact credentials from URL for logging
-            parsed = urlparse(self._url)
-            safe_url = f"{parsed.hostname}:{parsed.port or 6379}"
-            logger.info(f"Connected to Redis at {safe_url}")
+            logger.info("Connected to Redis at %s", self._safe_url)
             return True
         except ImportError:
             logger.warning("redis package not installed, falling back to in-memory cache")
             return False
         except Exception as e:
-            logger.warning(f"Failed to connect to Redis: {e}, falling back to in-memory cache")
+            logger.warning("Failed to connect to Redis: %s, falling back to in-memory cache", e)
             self._connected = False
             return False
 
-    async def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[bytes]:
         if not await self._ensure_connection():
             return None
         try:
-            result: Optional[str] = await self._redis.get(key)  # type: ignore[union-attr]
+            result: Optional[bytes] = await self._redis.get(key)  # type: ignore[union-attr]
             return result
         except Exception as e:
-            logger.error(f"Redis GET error: {e}")
+            logger.error("Redis GET error: %s", e)
             self._connected = False
             return None
 
-    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
         if not await self._ensure_connection():
             return False
         try:
@@ -183,7 +436,17 @@ class RedisCache(CacheBackend):
                 await self._redis.set(key, value)  # type: ignore[union-attr]
             return True
         except Exception as e:
-            logger.error(f"Redis SET error: {e}")
+            logger.error("Redis SET error: %s", e)
+            self._connected = False
+            return False
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        if not await self._ensure_connection():
+            return False
+        try:
+            return bool(await self._redis.expire(key, ttl))  # type: ignore[union-attr]
+        except Exception as e:
+            logger.error("Redis EXPIRE error: %s", e)
             self._connected = False
             return False
 
@@ -194,7 +457,7 @@ class RedisCache(CacheBackend):
             result: int = await self._redis.delete(key)  # type: ignore[union-attr]
             return result > 0
         except Exception as e:
-            logger.error(f"Redis DELETE error: {e}")
+            logger.error("Redis DELETE error: %s", e)
             self._connected = False
             return False
 
@@ -205,34 +468,69 @@ class RedisCache(CacheBackend):
             result: int = await self._redis.exists(key)  # type: ignore[union-attr]
             return result > 0
         except Exception as e:
-            logger.error(f"Redis EXISTS error: {e}")
+            logger.error("Redis EXISTS error: %s", e)
             self._connected = False
             return False
 
-    async def keys(self, pattern: str) -> list[str]:
+    async def keys(
+        self,
+        pattern: str,
+        key_type: Optional[str] = None,
+        count: int = DEFAULT_SCAN_COUNT,
+    ) -> list[str]:
+        """Get keys via SCAN, filtering by pattern and data type server-side.
+
+        Args:
+            pattern: Glob-style MATCH pattern.
+            key_type: Optional Redis type (e.g. "string", "hash") passed as TYPE.
+            count: SCAN COUNT hint; larger values mean fewer round-trips.
+        """
         if not await self._ensure_connection():
             return []
         try:
             # Use SCAN instead of KEYS to avoid blocking Redis
-            result: list[str] = []
-            cursor: int = 0
-            while True:
-                cursor, keys = await self._redis.scan(  # type: ignore[union-attr]
-                    cursor, match=pattern, count=100
-                )
-                result.extend(keys)
-                if cursor == 0:
-                    break
-            return result
+            return [key async for key in self.scan_iter(pattern, key_type, count)]
         except Exception as e:
-            logger.error(f"Redis SCAN error: {e}")
+            logger.error("Redis SCAN error: %s", e)
             self._connected = False
             return []
 
+    async def scan_iter(
+        self,
+        pattern: str,
+        key_type: Optional[str] = None,
+        count: int = DEFAULT_SCAN_COUNT,
+    ) -> AsyncIterator[str]:
+        """Yield keys via SCAN, fetching the next page while this one is consumed.
+
+        Assumes an established connection (see keys()); Redis errors propagate.
+        """
+        redis: Any = self._redis
+
+        def fetch(cursor: int) -> asyncio.Future[tuple[int, list[bytes]]]:
+            return asyncio.ensure_future(
+                redis.scan(cursor, match=pattern, count=count, _type=key_type)
+            )
+
+        pending: Optional[asyncio.Future[tuple[int, list[bytes]]]] = fetch(0)
+        try:
+            while pending is not None:
+                cursor, page = await pending
+                # Next page goes on the wire before this one is handed out
+                pending = fetch(cursor) if cursor != 0 else None
+                for key in page:
+                    yield key.decode()
+        finally:
+            # Drop an unconsumed prefetch; retrieve its error if it already failed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
     async def close(self) -> None:
         if self._redis:
             await self._redis.close()
             self._connected = False
+        if self._pool is not None:
+            await self._pool.disconnect()
 
     def is_connected(self) -> bool:
         return self._connected
@@ -245,13 +543,28 @@ class CacheClient:
     1. Tries Redis first if REDIS_URL is configured
     2. Falls back to in-memory cache if Redis fails
     3. Supports JSON serialization for complex objects
+    4. Coalesces concurrent reads of the same key into one backend call
+    5. Keeps recently decoded JSON values in a small in-process LRU
+
+    The local JSON cache is bounded by JSON_LOCAL_CACHE_TTL, so writes made
+    by other processes become visible within that window. Writes and deletes
+    through this client invalidate it immediately.
     """
 
     def __init__(self, redis_url: Optional[str] = None):
         self._redis_url = redis_url or os.getenv("REDIS_URL")
         self._backend: Optional[CacheBackend] = None
+        self._redis: Optional[RedisCache] = None
         self._fallback: InMemoryCache = InMemoryCache()
         self._using_fallback = False
+        # In-flight reads keyed by cache key (single-flight); raw and decoded
+        # values are tracked separately so JSON decoding is shared too.
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._inflight_json: dict[str, asyncio.Future[Any]] = {}
+        # key -> (monotonic expiry, decoded value), least recently used first
+        self._jsoncache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Bumped on invalidation so reads that started earlier don't store stale values
+        self._json_generation = 0
 
     async def _get_backend(self) -> CacheBackend:
         """Get the appropriate cache backend."""
@@ -260,11 +573,13 @@ class CacheClient:
                 return self._backend
             # Backend disconnected, try to reconnect or fall back
 
-        # Try Redis if URL is configured
+        # Try Redis if URL is configured; reuse one instance so its
+        # reconnect lock and backoff apply across callers
         if self._redis_url:
-            redis_backend = RedisCache(self._redis_url)
-            if await redis_backend._ensure_connection():
-                self._backend = redis_backend
+            if self._redis is None:
+                self._redis = RedisCache(self._redis_url)
+            if await self._redis._ensure_connection():
+                self._backend = self._redis
                 self._using_fallback = False
                 return self._backend
 
@@ -275,37 +590,136 @@ class CacheClient:
         self._backend = self._fallback
         return self._backend
 
-    async def get(self, key: str) -> Optional[str]:
-        """Get string value by key."""
+    async def _single_flight(
+        self,
+        inflight: dict[str, asyncio.Future[Any]],
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run fetch() once per key; concurrent callers await the same result.
+
+        If the leading call is cancelled, waiting callers fall back to
+        issuing their own fetch instead of inheriting the cancellation.
+        """
+        pending = inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            return await fetch()
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved so a lone caller doesn't log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if inflight.get(key) is future:
+                del inflight[key]
+
+    async def _backend_get(self, key: str) -> Optional[bytes]:
         backend = await self._get_backend()
         return await backend.get(key)
 
-    async def get_json(self, key: str) -> Optional[Any]:
-        """Get JSON-deserialized value by key."""
-        value = await self.get(key)
-        if value is None:
+    async def _decode_json(self, key: str) -> Optional[Any]:
+        raw = await self.get_bytes(key)
+        if raw is None:
             return None
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return decode_json(raw)
+        except ValueError:  # JSONDecodeError or invalid UTF-8
             return None
 
-    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
-        """Set string value with optional TTL."""
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get raw value bytes by key."""
+        result: Optional[bytes] = await self._single_flight(
+            self._inflight, key, lambda: self._backend_get(key)
+        )
+        return result
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get string value by key."""
+        raw = await self.get_bytes(key)
+        return raw.decode() if raw is not None else None
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Get JSON-deserialized value by key.
+
+        Concurrent callers, and callers within JSON_LOCAL_CACHE_TTL, share
+        one decoded object, so treat the result as read-only.
+        """
+        cached = self._jsoncache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._jsoncache.move_to_end(key)
+                return cached[1]
+            del self._jsoncache[key]
+
+        generation = self._json_generation
+        value = await self._single_flight(self._inflight_json, key, lambda: self._decode_json(key))
+        if value is not None and generation == self._json_generation:
+            self._remember_json(key, value, JSON_LOCAL_CACHE_TTL)
+        return value
+
+    def _remember_json(self, key: str, value: Any, ttl: float) -> None:
+        self._jsoncache[key] = (time.monotonic() + ttl, value)
+        self._jsoncache.move_to_end(key)
+        if len(self._jsoncache) > JSON_LOCAL_CACHE_SIZE:
+            self._jsoncache.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop a key (or every key) from the local JSON cache."""
+        self._json_generation += 1
+        if key is None:
+            self._jsoncache.clear()
+        else:
+            self._jsoncache.pop(key, None)
+
+    async def set(self, key: str, value: str | bytes, ttl: Optional[int] = None) -> bool:
+        """Set string (or raw bytes) value with optional TTL."""
+        data = value.encode() if isinstance(value, str) else value
+        self.invalidate(key)
         backend = await self._get_backend()
-        return await backend.set(key, value, ttl)
+        return await backend.set(key, data, ttl)
 
     async def set_json(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set JSON-serialized value with optional TTL."""
+        """Set JSON-serialized value with optional TTL.
+
+        The local JSON cache is populated with the value as it will decode,
+        so a following get_json() on this client skips the backend.
+        """
         try:
-            json_str = json.dumps(value, default=str)
-            return await self.set(key, json_str, ttl)
+            data = encode_json(value)
         except (TypeError, ValueError) as e:
-            logger.error(f"JSON serialization error: {e}")
+            logger.error("JSON serialization error: %s", e)
+            return False
+        if not await self.set(key, data, ttl):
             return False
+        # Cache the round-tripped value (tuples become lists, etc.), not the input
+        local_ttl = min(ttl, JSON_LOCAL_CACHE_TTL) if ttl else JSON_LOCAL_CACHE_TTL
+        self._remember_json(key, decode_json(data), local_ttl)
+        return True
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        """Reset the TTL of an existing key without rewriting its value."""
+        backend = await self._get_backend()
+        return await backend.expire(key, ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete key."""
+        self.invalidate(key)
         backend = await self._get_backend()
         return await backend.delete(key)
 
@@ -314,15 +728,16 @@ class CacheClient:
         backend = await self._get_backend()
         return await backend.exists(key)
 
-    async def keys(self, pattern: str) -> list[str]:
-        """Get keys matching pattern."""
+    async def keys(self, pattern: str, key_type: Optional[str] = None) -> list[str]:
+        """Get keys matching pattern, optionally filtered by Redis data type."""
         backend = await self._get_backend()
-        return await backend.keys(pattern)
+        return await backend.keys(pattern, key_type)
 
     async def close(self) -> None:
         """Close all connections."""
-        if self._backend:
-            await self._backend.close()
+        self.invalidate()
+        if self._redis:
+            await self._redis.close()
         await self._fallback.close()
 
     def is_using_redis(self) -> bool:
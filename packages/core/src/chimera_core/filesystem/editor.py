@@ -7,14 +7,115 @@ The design allows for alternative implementations (cloud storage, git, etc.) by
 subclassing BaseFileEditor.
 """
 
+import contextlib
 import difflib
+import functools
+import mmap
+import os
+import secrets
+import stat
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+def _normalize_newlines(text: str) -> str:
+    """Translate CRLF and CR line endings to LF."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 bytes with universal newlines, matching Path.read_text."""
+    return _normalize_newlines(raw.decode("utf-8"))
+
+
+# (exclusive upper bound, seconds per unit, unit name) for relative times
+_RELATIVE_TIME_UNITS = (
+    (3600, 60, "minute"),
+    (86400, 3600, "hour"),
+    (604800, 86400, "day"),
+    (2592000, 604800, "week"),
+    (31536000, 2592000, "month"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _ago(count: int, unit: str) -> str:
+    """Build (and reuse) labels like "3 minutes ago"."""
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split on newlines, keeping line endings."""
+    lines = text.split("\n")
+    last = lines.pop()
+    result = [line + "\n" for line in lines]
+    if last:
+        result.append(last)
+    return result
+
+
+def _line_start(content: str, offset: int, lines_back: int) -> int:
+    """Offset of the line starting `lines_back` lines before the one at offset."""
+    for _ in range(lines_back):
+        offset = content.rfind("\n", 0, offset - 1) + 1
+    return offset
+
+
+def _line_end(content: str, offset: int, lines_forward: int) -> int:
+    """Offset just past `lines_forward` whole lines starting at offset."""
+    for _ in range(lines_forward):
+        nl = content.find("\n", offset)
+        offset = len(content) if nl == -1 else nl + 1
+    return offset
+
+
+def _format_range(start: int, length: int) -> str:
+    """Unified diff range ("start,length"), as difflib formats it."""
+    beginning = start + 1
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _create_temp(target: Path) -> tuple[int, Path]:
+    """Create a new temp file beside target, never reusing a name or following a symlink.
+
+    Mode 0o666 leaves a new file's permissions to the umask, as open() would.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW | os.O_CLOEXEC
+    for _ in range(100):
+        tmp = target.with_name(f"{target.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temp file name beside {target}")
+
+
+def _copy_xattrs(src: Path, dst_fd: int) -> None:
+    """Copy src's extended attributes to dst_fd, where the platform has them."""
+    if not hasattr(os, "listxattr"):
+        return
+    try:
+        names = os.listxattr(src)
+    except OSError:
+        return
+    for name in names:
+        # Some namespaces (e.g. security.*) need privileges; copy what we can
+        with contextlib.suppress(OSError):
+            os.setxattr(dst_fd, name, os.getxattr(src, name))
+
+
 @dataclass
 class FileReadResult:
     """Result from a file read operation."""
@@ -34,6 +135,25 @@ class FileWriteResult:
     was_created: bool  # True if new file, False if overwritten
 
 
+@dataclass
+class FileStat:
+    """Result from a single stat of a path."""
+
+    path: str  # Absolute path
+    size_bytes: int
+    is_file: bool  # False for directories and other non-regular files
+
+
+class FileTooLargeError(ValueError):
+    """Raised by read_file_limited when a file exceeds the size limit."""
+
+    def __init__(self, path: str, size_bytes: int, max_size: int):
+        super().__init__(f"File too large: {path} ({size_bytes:,} > {max_size:,} bytes)")
+        self.path = path
+        self.size_bytes = size_bytes
+        self.max_size = max_size
+
+
 @dataclass
 class PathInfo:
     """Information about a file or directory."""
@@ -89,6 +209,24 @@ class BaseFileEditor(ABC):
         """
         pass
 
+    @abstractmethod
+    def write_bytes(self, path: str, data: bytes | memoryview) -> FileWriteResult:
+        """Write raw bytes to a file (create new or overwrite existing).
+
+        Callers that already hold encoded data skip write_file's UTF-8 encode.
+
+        Args:
+            path: Absolute path to file
+            data: Bytes to write
+
+        Returns:
+            FileWriteResult with metadata
+
+        Raises:
+            PermissionError: If access denied
+        """
+        pass
+
     @abstractmethod
     def edit_file(
         self, path: str, old_string: str, new_string: str, replace_all: bool = False
@@ -135,6 +273,45 @@ class BaseFileEditor(ABC):
         """
         pass
 
+    @abstractmethod
+    def try_stat(self, path: str) -> Optional[FileStat]:
+        """Get existence, type and size of a path in one call.
+
+        Args:
+            path: Absolute path to check
+
+        Returns:
+            FileStat, or None if the path doesn't exist
+        """
+        pass
+
+    def read_file_limited(self, path: str, max_size: int) -> FileReadResult:
+        """Read a file unless it is larger than max_size bytes.
+
+        The size is checked before any content is read. This default stats
+        the path and then calls read_file; implementations that can reuse
+        one stat for both should override it.
+
+        Args:
+            path: Absolute path to file
+            max_size: Largest allowed file size in bytes
+
+        Returns:
+            FileReadResult with content and metadata
+
+        Raises:
+            FileNotFoundError: If the path is missing or not a regular file
+            FileTooLargeError: If the file is larger than max_size
+            UnicodeDecodeError: If file is binary
+            PermissionError: If access denied
+        """
+        file_stat = self.try_stat(path)
+        if file_stat is None or not file_stat.is_file:
+            raise FileNotFoundError(f"File not found: {path}")
+        if file_stat.size_bytes > max_size:
+            raise FileTooLargeError(path, file_stat.size_bytes, max_size)
+        return self.read_file(path)
+
     @abstractmethod
     def create_directory(self, path: str) -> None:
         """Create a directory (and parent directories if needed).
@@ -155,14 +332,27 @@ class LocalFileEditor(BaseFileEditor):
     No security constraints - path validation happens in AgentFileTools.
     """
 
-    def __init__(self, base_path: Optional[str] = None):
+    # Decoded contents of recently read/written files, keyed by path
+    CONTENT_CACHE_SIZE = 128
+    # Files larger than this are decoded straight from an mmap
+    MMAP_THRESHOLD = 1024 * 1024
+    # Threads used to scan directories for recursive list_paths
+    LIST_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+    def __init__(self, base_path: Optional[str] = None, fsync: bool = False):
         """Initialize LocalFileEditor.
 
         Args:
             base_path: Optional base directory for relative path resolution.
                       If not provided, paths must be absolute.
+            fsync: If True, fdatasync written files before they replace the
+                   original (durable across power loss, but slower).
         """
         self.base_path = Path(base_path).resolve() if base_path else None
+        self.fsync = fsync
+        # path -> (st_mtime_ns, st_size, st_ino, content); reused while the stat matches
+        self._content_cache: OrderedDict[str, tuple[int, int, int, str]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _resolve_path(self, path: str) -> Path:
         """Convert path to absolute Path object.
@@ -185,35 +375,62 @@ class LocalFileEditor(BaseFileEditor):
         """Read file from local filesystem."""
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        # One stat covers both the existence and regular-file checks
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {path}")
 
-        # Read with UTF-8 encoding (will raise UnicodeDecodeError for binary files)
-        content = file_path.read_text(encoding="utf-8")
+        return self._read_result(file_path, st)
+
+    def read_file_limited(self, path: str, max_size: int) -> FileReadResult:
+        """Read file from local filesystem, using one stat for every check."""
+        file_path = self._resolve_path(path)
+        try:
+            st = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {path}") from None
+
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"File not found: {path}")
+        if st.st_size > max_size:
+            raise FileTooLargeError(path, st.st_size, max_size)
 
+        return self._read_result(file_path, st)
+
+    def _read_result(self, file_path: Path, st: os.stat_result) -> FileReadResult:
+        """Build the FileReadResult for a regular file that was just stat'ed."""
         return FileReadResult(
-            content=content,
+            content=self._read_text(file_path, st),
             path=str(file_path),
-            size_bytes=len(content.encode("utf-8")),
+            size_bytes=st.st_size,
             encoding="utf-8",
         )
 
     def write_file(self, path: str, content: str) -> FileWriteResult:
         """Write content to local filesystem."""
+        # Encode once; the same buffer is written and measured
+        result = self.write_bytes(path, content.encode("utf-8"))
+        self._remember(Path(result.path), content)
+        return result
+
+    def write_bytes(self, path: str, data: bytes | memoryview) -> FileWriteResult:
+        """Write raw bytes to local filesystem."""
         file_path = self._resolve_path(path)
-        was_created = not file_path.exists()
 
         # Create parent directories if needed
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write content
-        file_path.write_text(content, encoding="utf-8")
+        was_created = self._write_atomic(file_path, data)
+        # The text of raw writes isn't known; drop any stale entry
+        with self._cache_lock:
+            self._content_cache.pop(str(file_path), None)
 
         return FileWriteResult(
-            path=str(file_path), bytes_written=len(content.encode("utf-8")), was_created=was_created
+            path=str(file_path), bytes_written=memoryview(data).nbytes, was_created=was_created
         )
 
     def edit_file(
@@ -222,34 +439,48 @@ class LocalFileEditor(BaseFileEditor):
         """Perform exact string replacement in file."""
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
         if old_string == new_string:
             raise ValueError("old_string and new_string must be different")
 
-        # Read current content
-        content = file_path.read_text(encoding="utf-8")
-
-        # Check if old_string exists
-        occurrences = content.count(old_string)
-        if occurrences == 0:
-            raise ValueError(f"old_string not found in file: {path}")
-
-        if not replace_all and occurrences > 1:
-            raise ValueError(
-                f"old_string appears {occurrences} times in file. "
-                "Either provide a more specific old_string or use replace_all=True"
-            )
-
-        # Perform replacement
-        new_content = content.replace(old_string, new_string)
+        # Read current content (reused from the cache across successive edits)
+        content = self._read_text(file_path, st)
+
+        if not old_string:
+            # Empty needle matches between every character; keep the
+            # count/replace/difflib path for its exact semantics
+            occurrences = content.count(old_string)
+            self._check_occurrences(occurrences, replace_all, path)
+            new_content = content.replace(old_string, new_string)
+            self._write_atomic(file_path, new_content.encode("utf-8"))
+            self._remember(file_path, new_content)
+            return self._generate_diff(content, new_content, str(file_path))
+
+        # Locate every match in one find() pass
+        offsets = []
+        pos = content.find(old_string)
+        while pos != -1:
+            offsets.append(pos)
+            if not replace_all and len(offsets) > 1:
+                # Only the total is still needed for the error message
+                rest = content.count(old_string, pos + len(old_string))
+                self._check_occurrences(len(offsets) + rest, replace_all, path)
+            pos = content.find(old_string, pos + len(old_string))
+        self._check_occurrences(len(offsets), replace_all, path)
+
+        # Build the new content and the diff from the same match offsets
+        new_content, diff = self._replace_with_diff(
+            content, offsets, old_string, new_string, str(file_path)
+        )
 
         # Write back
-        file_path.write_text(new_content, encoding="utf-8")
+        self._write_atomic(file_path, new_content.encode("utf-8"))
+        self._remember(file_path, new_content)
 
-        # Generate unified diff
-        diff = self._generate_diff(content, new_content, str(file_path))
         return diff
 
     def list_paths(self, base_path: str, recursive: bool = False) -> list[PathInfo]:
@@ -262,69 +493,343 @@ class LocalFileEditor(BaseFileEditor):
         if not base_path_obj.is_dir():
             raise ValueError(f"Path is not a directory: {base_path}")
 
-        items = []
-        now = datetime.now()
+        root = str(base_path_obj)
+        if recursive:
+            rows = self._walk_parallel(root)
+        else:
+            rows, _ = self._scan_dir(root, "")
+
+        now_ts = time.time()
+        items = [
+            PathInfo(
+                path=rel_path,
+                type="directory" if is_dir else "file",
+                last_modified=self._format_relative_time(now_ts, mtime_ts),
+            )
+            for rel_path, is_dir, mtime_ts in rows
+        ]
 
-        # Choose iteration method
-        iterator = base_path_obj.rglob("*") if recursive else base_path_obj.iterdir()
+        items.sort(key=lambda x: x.path)
+        return items
 
-        for item in iterator:
+    def _scan_dir(
+        self, dir_path: str, prefix: str
+    ) -> tuple[list[tuple[str, bool, float]], list[tuple[str, str]]]:
+        """Scan one directory with os.scandir.
+
+        Returns (rel_path, is_dir, mtime) rows for its entries and the
+        (dir_path, rel_path) subdirectories to descend into. Like Path.rglob,
+        symlinked directories aren't descended and unreadable directories are
+        skipped; entries whose stat fails are left out.
+        """
+        rows: list[tuple[str, bool, float]] = []
+        subdirs: list[tuple[str, str]] = []
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return rows, subdirs
+
+        for entry in entries:
+            rel_path = prefix + entry.name
             try:
-                # Get relative path from base_path
-                rel_path = item.relative_to(base_path_obj)
-
-                # Get modification time
-                mtime = datetime.fromtimestamp(item.stat().st_mtime)
-                time_str = self._format_relative_time(now, mtime)
-
-                items.append(
-                    PathInfo(
-                        path=str(rel_path),
-                        type="directory" if item.is_dir() else "file",
-                        last_modified=time_str,
-                    )
-                )
-            except (OSError, ValueError):
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, rel_path + os.sep))
+            except OSError:
+                pass
+            try:
+                # DirEntry caches d_type; stat() is a single syscall
+                rows.append((rel_path, entry.is_dir(), entry.stat().st_mtime))
+            except OSError:
                 # Skip files with errors (permissions, etc.)
                 continue
+        return rows, subdirs
+
+    def _walk_parallel(self, root: str) -> list[tuple[str, bool, float]]:
+        """Recursively scan root, one directory per task on a thread pool.
 
-        return sorted(items, key=lambda x: x.path)
+        scandir/stat release the GIL, so stat latency on cold caches or network
+        filesystems overlaps across subtrees. Subdirectories are submitted as
+        their parent's scan completes; the caller sorts the rows.
+        """
+        rows, subdirs = self._scan_dir(root, "")
+        if not subdirs:
+            return rows
+
+        with ThreadPoolExecutor(max_workers=self.LIST_WORKERS) as pool:
+            pending = {pool.submit(self._scan_dir, *subdir) for subdir in subdirs}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_rows, subdirs = future.result()
+                    rows.extend(dir_rows)
+                    pending.update(pool.submit(self._scan_dir, *subdir) for subdir in subdirs)
+        return rows
 
     def file_exists(self, path: str) -> bool:
         """Check if file exists in local filesystem."""
+        # is_file() is False for missing paths too, so one stat is enough
+        return self._resolve_path(path).is_file()
+
+    def try_stat(self, path: str) -> Optional[FileStat]:
+        """Stat a path in local filesystem."""
         file_path = self._resolve_path(path)
-        return file_path.exists() and file_path.is_file()
+        try:
+            st = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return FileStat(
+            path=str(file_path), size_bytes=st.st_size, is_file=stat.S_ISREG(st.st_mode)
+        )
 
     def create_directory(self, path: str) -> None:
         """Create directory in local filesystem."""
         dir_path = self._resolve_path(path)
         dir_path.mkdir(parents=True, exist_ok=True)
 
-    def _format_relative_time(self, now: datetime, then: datetime) -> str:
-        """Format time difference as human-readable relative time."""
-        diff = now - then
-        seconds = diff.total_seconds()
-
+    def _format_relative_time(self, now_ts: float, mtime_ts: float) -> str:
+        """Format time difference (epoch seconds) as human-readable relative time."""
+        seconds = int(now_ts - mtime_ts)
         if seconds < 60:
             return "just now"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days} day{'s' if days != 1 else ''} ago"
-        elif seconds < 2592000:
-            weeks = int(seconds / 604800)
-            return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-        elif seconds < 31536000:
-            months = int(seconds / 2592000)
-            return f"{months} month{'s' if months != 1 else ''} ago"
-        else:
-            years = int(seconds / 31536000)
-            return f"{years} year{'s' if years != 1 else ''} ago"
+        for limit, unit_seconds, unit in _RELATIVE_TIME_UNITS:
+            if seconds < limit:
+                return _ago(seconds // unit_seconds, unit)
+        return _ago(seconds // 31536000, "year")
+
+    def _read_text(self, file_path: Path, st: os.stat_result) -> str:
+        """Return decoded file content, reusing the cache while the stat matches.
+
+        Content written by another process is picked up because its mtime,
+        size or inode (os.replace swaps inodes) no longer match the entry.
+        """
+        key = str(file_path)
+        with self._cache_lock:
+            cached = self._content_cache.get(key)
+            if cached is not None:
+                if cached[:3] == (st.st_mtime_ns, st.st_size, st.st_ino):
+                    self._content_cache.move_to_end(key)
+                    return cached[3]
+                del self._content_cache[key]
+
+        # Will raise UnicodeDecodeError for binary files
+        with open(file_path, "rb") as f:
+            if st.st_size > self.MMAP_THRESHOLD:
+                # Decode from the page cache without an intermediate bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = _normalize_newlines(str(mm, "utf-8"))
+            else:
+                content = _decode_text(f.read())
+
+        self._store_cached(key, st, content)
+        return content
+
+    def _remember(self, file_path: Path, content: str) -> None:
+        """Cache content just written to file_path under its new stat."""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return
+        # Cache what a read would return, not the raw text written
+        self._store_cached(str(file_path), st, _normalize_newlines(content))
+
+    def _store_cached(self, key: str, st: os.stat_result, content: str) -> None:
+        with self._cache_lock:
+            self._content_cache[key] = (st.st_mtime_ns, st.st_size, st.st_ino, content)
+            self._content_cache.move_to_end(key)
+            if len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+
+    def _write_atomic(self, file_path: Path, data: bytes | memoryview) -> bool:
+        """Write data via a sibling temp file and os.replace.
+
+        Readers see either the old or the new file, never a partial write.
+        Symlinks are written through to their target. A new file gets the
+        umask-derived mode; an existing file keeps its mode, owner and
+        extended attributes. A file with other hard links, or whose owner
+        can't be restored, is overwritten in place instead, since replacing
+        it would break the link or take it over. Returns True if the file
+        was newly created.
+        """
+        target = Path(os.path.realpath(file_path)) if file_path.is_symlink() else file_path
+        try:
+            st: Optional[os.stat_result] = os.stat(target)
+        except FileNotFoundError:
+            st = None
+        if st is not None and st.st_nlink > 1:
+            self._write_in_place(target, data)
+            return False
+
+        fd, tmp = _create_temp(target)
+        try:
+            try:
+                if st is not None:
+                    tmp_st = os.fstat(fd)
+                    if (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+                        os.fchown(fd, st.st_uid, st.st_gid)
+                    # After fchown, which clears setuid/setgid bits
+                    os.fchmod(fd, stat.S_IMODE(st.st_mode))
+                    _copy_xattrs(target, fd)
+                self._write_fd(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, target)
+        except PermissionError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            if st is None:
+                raise
+            # Not allowed to give the new file the old owner
+            self._write_in_place(target, data)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        return st is None
+
+    def _write_in_place(self, target: Path, data: bytes | memoryview) -> None:
+        """Truncate and rewrite target through its existing inode (not atomic)."""
+        fd = os.open(target, os.O_WRONLY | os.O_TRUNC | os.O_CLOEXEC)
+        try:
+            self._write_fd(fd, data)
+        finally:
+            os.close(fd)
+
+    def _write_fd(self, fd: int, data: bytes | memoryview) -> None:
+        """Write all of data to fd, then sync it if self.fsync is set."""
+        # Byte-wise view so partial writes slice by bytes for any buffer format
+        view = memoryview(data).cast("B")
+        while view:
+            view = view[os.write(fd, view) :]
+        if self.fsync:
+            # fdatasync isn't available on macOS
+            getattr(os, "fdatasync", os.fsync)(fd)
+
+    def _check_occurrences(self, occurrences: int, replace_all: bool, path: str) -> None:
+        """Raise if old_string is missing, or ambiguous without replace_all."""
+        if occurrences == 0:
+            raise ValueError(f"old_string not found in file: {path}")
+
+        if not replace_all and occurrences > 1:
+            raise ValueError(
+                f"old_string appears {occurrences} times in file. "
+                "Either provide a more specific old_string or use replace_all=True"
+            )
+
+    def _replace_with_diff(
+        self,
+        content: str,
+        offsets: list[int],
+        old_string: str,
+        new_string: str,
+        filename: str,
+        context_lines: int = 2,
+    ) -> tuple[str, str]:
+        """Apply replacements at known offsets and emit a unified diff.
+
+        The layout matches difflib.unified_diff(..., lineterm="") joined with
+        "" (headers, hunk ranges, context_lines of context), and the hunks
+        apply to the old content to give the new one. It is not byte-identical
+        to difflib, though: each changed region is emitted as all of its old
+        lines followed by all of its new lines, without difflib's search for
+        unchanged lines inside the region. Hunks come straight from the match
+        offsets, so only the lines touching a match (plus context) are split,
+        instead of both full versions of the file.
+        """
+        old_len = len(old_string)
+        # If a line-terminated match becomes unterminated text, the line after
+        # it gets joined onto the replacement and belongs to the region too
+        joins_next = old_string.endswith("\n") and not new_string.endswith("\n")
+
+        # Group matches into changed regions of whole lines:
+        # [start offset, end offset, first line, last line, matches]
+        regions: list[list] = []
+        line = 0
+        scanned = 0
+        for pos in offsets:
+            end = pos + old_len
+            if regions and pos <= regions[-1][1]:
+                # Match starts on (or right after) the previous region's lines
+                region = regions[-1]
+            else:
+                line += content.count("\n", scanned, pos)
+                scanned = pos
+                region = [content.rfind("\n", 0, pos) + 1, 0, line, line, []]
+                regions.append(region)
+            last_char = min(end, len(content) - 1) if joins_next else end - 1
+            line_end = content.find("\n", last_char)
+            line_end = len(content) if line_end == -1 else line_end + 1
+            if line_end > region[1]:
+                line += content.count("\n", scanned, last_char)
+                scanned = last_char
+                region[1] = line_end
+                region[3] = line
+            region[4].append(pos)
+
+        total_lines = content.count("\n") + (0 if content.endswith("\n") else 1)
+
+        # Build replaced text per region and the full new content
+        parts: list[str] = []
+        prev = 0
+        old_region_lines: list[list[str]] = []
+        new_region_lines: list[list[str]] = []
+        for start, stop, _, _, matches in regions:
+            pieces = []
+            cursor = start
+            for pos in matches:
+                pieces.append(content[cursor:pos])
+                pieces.append(new_string)
+                cursor = pos + old_len
+            pieces.append(content[cursor:stop])
+            new_text = "".join(pieces)
+            parts.append(content[prev:start])
+            parts.append(new_text)
+            prev = stop
+            old_region_lines.append(_split_lines(content[start:stop]))
+            new_region_lines.append(_split_lines(new_text))
+        parts.append(content[prev:])
+        new_content = "".join(parts)
+
+        # Group regions into hunks that share context (gap <= 2n lines)
+        hunks: list[list[int]] = []
+        for i, region in enumerate(regions):
+            if hunks and region[2] - regions[hunks[-1][-1]][3] - 1 <= 2 * context_lines:
+                hunks[-1].append(i)
+            else:
+                hunks.append([i])
+
+        out = [f"--- a/{filename}", f"+++ b/{filename}"]
+        delta = 0  # new line number minus old line number so far
+        for hunk in hunks:
+            first, last = regions[hunk[0]], regions[hunk[-1]]
+            old_start = max(0, first[2] - context_lines)
+            old_stop = min(total_lines, last[3] + 1 + context_lines)
+
+            body: list[str] = []
+            # Leading context
+            ctx_start = _line_start(content, first[0], first[2] - old_start)
+            body.extend(" " + ln for ln in _split_lines(content[ctx_start : first[0]]))
+            new_count = old_stop - old_start
+            for j, i in enumerate(hunk):
+                if j:
+                    gap = content[regions[hunk[j - 1]][1] : regions[i][0]]
+                    body.extend(" " + ln for ln in _split_lines(gap))
+                body.extend("-" + ln for ln in old_region_lines[i])
+                body.extend("+" + ln for ln in new_region_lines[i])
+                new_count += len(new_region_lines[i]) - len(old_region_lines[i])
+            # Trailing context
+            ctx_end = _line_end(content, last[1], old_stop - last[3] - 1)
+            body.extend(" " + ln for ln in _split_lines(content[last[1] : ctx_end]))
+
+            new_start = old_start + delta
+            out.append(
+                f"@@ -{_format_range(old_start, old_stop - old_start)}"
+                f" +{_format_range(new_start, new_count)} @@"
+            )
+            out.extend(body)
+            delta += new_count - (old_stop - old_start)
+
+        return new_content, "".join(out)
 
     def _generate_diff(
         self, old_content: str, new_content: str, filename: str, context_lines: int = 2
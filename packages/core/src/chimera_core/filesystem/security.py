@@ -9,14 +9,160 @@ This module wraps BaseFileEditor with security constraints:
 The security layer is where we enforce the sandbox boundary.
 """
 
-import fnmatch
+import asyncio
+import ctypes
+import errno
+import functools
+import os
+import posixpath
+import re
+import stat
+import sys
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import pathspec
 from pydantic_ai.exceptions import ModelRetry
 
-from chimera_core.filesystem.editor import BaseFileEditor, PathInfo
+from chimera_core.filesystem.editor import BaseFileEditor, FileTooLargeError, PathInfo
+
+# "*.md": matches any path component ending in ".md"
+_EXTENSION_PATTERN = re.compile(r"\*\.[A-Za-z0-9_]+")
+# "node_modules" or "cache/": matches a path component by name (with a
+# trailing slash, only directories)
+_NAME_PATTERN = re.compile(r"(?!\.+/?$)[\w.-]+/?")
+
+
+class _PatternSet:
+    """Include or exclude patterns, matched with gitignore semantics.
+
+    Most patterns are plain extensions or names; those are checked with a
+    set lookup per path component, and only the rest go through a compiled
+    PathSpec. Lists with negations ("!x") depend on pattern order, so they
+    are matched by the PathSpec alone.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.extensions: dict[str, str] = {}  # ".md" -> "*.md"
+        self.names: dict[str, str] = {}  # "build" -> "build"
+        self.dir_names: dict[str, str] = {}  # "cache" -> "cache/"
+        rest = patterns
+        if not any(p.startswith("!") for p in patterns):
+            rest = []
+            for pattern in patterns:
+                if _EXTENSION_PATTERN.fullmatch(pattern):
+                    self.extensions.setdefault(pattern[1:], pattern)
+                elif _NAME_PATTERN.fullmatch(pattern):
+                    if pattern.endswith("/"):
+                        self.dir_names.setdefault(pattern[:-1], pattern)
+                    else:
+                        self.names.setdefault(pattern, pattern)
+                else:
+                    rest.append(pattern)
+        self._has_literals = bool(self.extensions or self.names or self.dir_names)
+        self.spec = pathspec.PathSpec.from_lines("gitignore", rest) if rest else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[str]:
+        """Return a pattern matching the normalized path, or None if none does."""
+        if self._has_literals:
+            parts = path.split("/")
+            last = len(parts) - 1
+            for i, part in enumerate(parts):
+                dot = part.rfind(".")
+                if dot != -1 and part[dot:] in self.extensions:
+                    return self.extensions[part[dot:]]
+                if part in self.names:
+                    return self.names[part]
+                if part in self.dir_names and (i < last or is_dir):
+                    return self.dir_names[part]
+
+        if self.spec is not None:
+            # Trailing slash so directory-only patterns match directories
+            check_path = path + "/" if is_dir else path
+            if self.spec.match_file(check_path):
+                return _deciding_pattern(self.spec, check_path)
+        return None
+
+
+# openat2(2), Linux 5.6+: open a path beneath a directory fd, with every
+# component resolved by the kernel and symlinks refused
+_SYS_OPENAT2 = 437
+_RESOLVE_NO_SYMLINKS = 0x04
+_RESOLVE_BENEATH = 0x08
+
+
+class _OpenHow(ctypes.Structure):
+    _fields_ = [
+        ("flags", ctypes.c_uint64),
+        ("mode", ctypes.c_uint64),
+        ("resolve", ctypes.c_uint64),
+    ]
+
+
+def _load_syscall() -> Optional[Callable[..., int]]:
+    """Return libc's syscall() on Linux, or None where openat2 can't be used."""
+    if not sys.platform.startswith("linux") or not hasattr(os, "O_PATH"):
+        return None
+    try:
+        syscall = ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+    syscall.restype = ctypes.c_long
+    return syscall
+
+
+_syscall = _load_syscall()
+
+
+def _openat2_beneath(dir_fd: int, rel_path: str) -> int:
+    """Check rel_path exists beneath dir_fd with no symlinks, in one syscall.
+
+    Returns 0 on success, otherwise the errno (ENOENT if missing, ELOOP for
+    a symlink, EXDEV for an escape, ENOSYS/EPERM if openat2 is unavailable).
+    """
+    if _syscall is None:
+        return errno.ENOSYS
+    how = _OpenHow(flags=os.O_PATH | os.O_CLOEXEC, resolve=_RESOLVE_BENEATH | _RESOLVE_NO_SYMLINKS)
+    fd = _syscall(
+        ctypes.c_long(_SYS_OPENAT2),
+        ctypes.c_int(dir_fd),
+        ctypes.c_char_p(os.fsencode(rel_path)),
+        ctypes.byref(how),
+        ctypes.c_size_t(ctypes.sizeof(how)),
+    )
+    if fd < 0:
+        return ctypes.get_errno()
+    os.close(fd)
+    return 0
+
+
+@functools.lru_cache(maxsize=256)
+def _load_gitignore(path: str, mtime_ns: int) -> Optional[pathspec.PathSpec]:
+    """Parse a .gitignore file, shared until its mtime changes."""
+    try:
+        with open(path, "r") as f:
+            return pathspec.PathSpec.from_lines("gitignore", f)
+    except Exception:
+        # Silently ignore errors reading .gitignore
+        return None
+
+
+def _gitignore_verdict(spec: pathspec.PathSpec, path: str) -> Optional[bool]:
+    """True if spec ignores path, False if a negation re-includes it, else None."""
+    verdict = None
+    for pattern in spec.patterns:
+        if pattern.include is not None and pattern.match_file(path) is not None:
+            verdict = pattern.include
+    return verdict
+
+
+def _deciding_pattern(spec: pathspec.PathSpec, path: str) -> str:
+    """Return the pattern that made spec match path (the last matching one)."""
+    for pattern in reversed(spec.patterns):
+        if pattern.include is not None and pattern.match_file(path) is not None:
+            return str(pattern.pattern)
+    return ""
 
 
 class SecurityError(Exception):
@@ -32,8 +178,11 @@ class SecurityError(Exception):
 class AgentFileTools:
     """Security wrapper for BaseFileEditor with sandboxing and validation.
 
+    Include/exclude patterns and .gitignore are read once at construction
+    and treated as immutable; pattern checks are memoized per path.
+
     This class enforces:
-    1. Path sandboxing - all operations restricted to base_path
+    1. Path sandboxing - all operations restricted to base_path, symlinks rejected
     2. Pattern filtering - include/exclude patterns for fine-grained control
     3. Size limits - prevent reading files that are too large
     4. Agent-friendly errors - ModelRetry for retryable errors
@@ -45,7 +194,7 @@ class AgentFileTools:
             base_path="/Users/me/agent_workspace",
             max_file_size=200_000,
             include_patterns=["*.txt", "*.md"],
-            exclude_patterns=["*/archive/*", ".git/*"]
+            exclude_patterns=["archive/", ".git/"]
         )
 
         # This will work (within base_path, matches patterns)
@@ -58,6 +207,9 @@ class AgentFileTools:
         content = tools.read_file("binary.exe")
     """
 
+    # Memoized _check_patterns results per instance
+    PATTERN_CACHE_SIZE = 10_000
+
     def __init__(
         self,
         editor: BaseFileEditor,
@@ -72,27 +224,38 @@ class AgentFileTools:
             editor: BaseFileEditor implementation to wrap
             base_path: Base directory for sandboxing (all paths must be within this)
             max_file_size: Maximum file size in bytes (default 200KB)
-            include_patterns: Optional whitelist of glob patterns (e.g., ["*.txt", "docs/*"])
-            exclude_patterns: Optional blacklist of glob patterns (e.g., ["*.exe", ".git/*"])
+            include_patterns: Optional whitelist of gitignore-style patterns
+                (e.g., ["*.txt", "docs/"])
+            exclude_patterns: Optional blacklist of gitignore-style patterns
+                (e.g., ["*.exe", ".git/"])
         """
         self.editor = editor
         self.base_path = Path(base_path).resolve()
+        # Resolved base_path with a trailing separator, for prefix checks
+        self._base_prefix = os.path.join(str(self.base_path), "")
+        self._sep_is_slash = os.sep == "/"
         self.max_file_size = max_file_size
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        # Patterns are fixed after construction and compiled once, using the
+        # same gitignore semantics as .gitignore
+        self._include_set = _PatternSet(self.include_patterns) if self.include_patterns else None
+        self._exclude_set = _PatternSet(self.exclude_patterns) if self.exclude_patterns else None
+
+        # Like a git work tree, a .gitignore in base_path or any directory
+        # below it applies; each directory's file is loaded lazily the first
+        # time a path below it is checked. dir (relative, "/"-separated) -> spec or None.
+        self._gitignore_specs: dict[str, Optional[pathspec.PathSpec]] = {}
+        self.gitignore_spec = self._gitignore_in("")
+        self._dir_gitignored = functools.lru_cache(maxsize=self.PATTERN_CACHE_SIZE)(
+            self._is_gitignored
+        )
 
-        # Load .gitignore if it exists
-        self.gitignore_spec = None
-        gitignore_path = self.base_path / ".gitignore"
-        if gitignore_path.exists() and gitignore_path.is_file():
-            try:
-                with open(gitignore_path, "r") as f:
-                    self.gitignore_spec = pathspec.PathSpec.from_lines(
-                        pathspec.patterns.gitwildmatch.GitWildMatchPattern, f
-                    )
-            except Exception:
-                # Silently ignore errors reading .gitignore
-                pass
+        # (path, is_dir) -> error message or None. Caches a message rather
+        # than the exception so callers never share a raised instance.
+        self._pattern_error = functools.lru_cache(maxsize=self.PATTERN_CACHE_SIZE)(
+            self._find_pattern_error
+        )
 
         # Validate base_path exists
         if not self.base_path.exists():
@@ -100,9 +263,21 @@ class AgentFileTools:
         if not self.base_path.is_dir():
             raise ValueError(f"Base path must be a directory: {base_path}")
 
+        # On Linux, existing paths are checked by the kernel via openat2
+        # relative to this fd; None where that's unavailable
+        self._base_fd = self._open_base_fd()
+
     def _resolve_and_validate_path(self, path: str) -> Path:
         """Resolve path and validate it's within base_path.
 
+        Symlinks are rejected rather than followed. On Linux, openat2 with
+        RESOLVE_BENEATH | RESOLVE_NO_SYMLINKS checks the path, or for one not
+        created yet its nearest existing ancestor. Otherwise the path itself
+        is lstat'ed before anything could follow it, and its parent must be
+        its own realpath. With no symlinks
+        involved the lexically normalized path is the resolved one, so
+        Path.resolve() isn't needed.
+
         Args:
             path: Relative path from base_path
 
@@ -110,21 +285,68 @@ class AgentFileTools:
             Absolute Path object
 
         Raises:
-            SecurityError: If path is outside base_path
+            SecurityError: If path is outside base_path or involves a symlink
         """
-        # Resolve path relative to base_path
-        file_path = (self.base_path / path).resolve()
+        full_path = os.path.normpath(os.path.join(self._base_prefix, path))
+        if not (full_path + os.sep).startswith(self._base_prefix):
+            raise SecurityError(
+                f"Path '{path}' resolves outside allowed base path. "
+                f"Attempted to access: {full_path}"
+            )
+
+        err = None
+        if self._base_fd is not None:
+            rel_path = full_path[len(self._base_prefix) :] or os.curdir
+            err = _openat2_beneath(self._base_fd, rel_path)
+            # Not created yet (e.g. write_file): check the nearest existing ancestor
+            while err == errno.ENOENT and rel_path != os.curdir:
+                rel_path = os.path.dirname(rel_path) or os.curdir
+                err = _openat2_beneath(self._base_fd, rel_path)
+            if err == 0:
+                # The kernel resolved every existing component beneath base_path, no symlinks
+                return Path(full_path)
+            # Refused or unavailable: the checks below decide and explain
 
-        # Check if resolved path is within base_path
         try:
-            file_path.relative_to(self.base_path)
-        except ValueError:
+            is_link = stat.S_ISLNK(os.lstat(full_path).st_mode)
+        except OSError:
+            # Not created yet (e.g. write_file); the operation reports other errors
+            is_link = False
+        if is_link:
+            raise SecurityError(f"Path '{path}' is a symlink. Symlinks are not followed.")
+
+        if not self._is_real_dir(os.path.dirname(full_path)):
             raise SecurityError(
-                f"Path '{path}' resolves outside allowed base path. "
-                f"Attempted to access: {file_path}"
+                f"Path '{path}' is inside a symlinked directory. Symlinks are not followed."
             )
+        if err in (errno.ELOOP, errno.EXDEV):
+            # The kernel's refusal stands even if the path changed since
+            raise SecurityError(f"Path '{path}' involves a symlink. Symlinks are not followed.")
 
-        return file_path
+        return Path(full_path)
+
+    def _open_base_fd(self) -> Optional[int]:
+        """Open base_path as an O_PATH fd if openat2 works here, else None."""
+        if _syscall is None:
+            return None
+        try:
+            fd = os.open(self.base_path, os.O_PATH | os.O_DIRECTORY | os.O_CLOEXEC)
+        except OSError:
+            return None
+        # Older kernels lack openat2 (ENOSYS); some sandboxes filter it (EPERM)
+        if _openat2_beneath(fd, os.curdir) != 0:
+            os.close(fd)
+            return None
+        weakref.finalize(self, os.close, fd)
+        return fd
+
+    def _is_real_dir(self, dir_path: str) -> bool:
+        """True if dir_path contains no symlinks (it is its own realpath).
+
+        Deliberately not cached: any ancestor can be swapped for a symlink
+        without changing what lstat reports for dir_path itself.
+        """
+        return os.path.realpath(dir_path) == dir_path
 
     def _check_patterns(self, path: str, is_dir: bool = False) -> None:
         """Check if path matches include/exclude patterns.
@@ -136,33 +358,99 @@ class AgentFileTools:
         Raises:
             SecurityError: If path doesn't match patterns
         """
-        # Normalize path for pattern matching (forward slashes)
-        normalized_path = str(Path(path).as_posix())
-
-        # If it's a directory, append slash for .gitignore directory matching
-        check_path = normalized_path + "/" if is_dir else normalized_path
+        error = self._pattern_error(path, is_dir)
+        if error is not None:
+            raise SecurityError(error)
 
-        # Check exclude patterns first (blacklist takes precedence)
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(normalized_path, pattern):
-                raise SecurityError(f"Path '{path}' matches exclude pattern '{pattern}'")
-
-        # Check .gitignore if present
-        if self.gitignore_spec:
-            if self.gitignore_spec.match_file(check_path):
-                raise SecurityError(f"Path '{path}' is ignored by .gitignore")
+    def _find_pattern_error(self, path: str, is_dir: bool) -> Optional[str]:
+        """Return why path is rejected by the patterns, or None if it's allowed."""
+        error = self._exclusion_error(path, is_dir)
+        if error is not None:
+            return error
 
         # If include patterns specified, must match at least one (whitelist)
-        if self.include_patterns:
-            matches = any(
-                fnmatch.fnmatch(normalized_path, pattern) for pattern in self.include_patterns
-            )
-            if not matches:
-                raise SecurityError(
+        if self._include_set:
+            if self._include_set.match(self._posix_path(path), is_dir) is None:
+                return (
                     f"Path '{path}' does not match any include pattern. "
                     f"Allowed patterns: {', '.join(self.include_patterns)}"
                 )
 
+        return None
+
+    def _gitignore_in(self, dir_rel: str) -> Optional[pathspec.PathSpec]:
+        """Return the .gitignore spec of a directory relative to base_path, if any."""
+        try:
+            return self._gitignore_specs[dir_rel]
+        except KeyError:
+            pass
+        gitignore_path = os.path.join(self._base_prefix, dir_rel, ".gitignore")
+        try:
+            st = os.stat(gitignore_path)
+        except OSError:
+            spec = None
+        else:
+            # Parsed specs are shared across instances while the file is unchanged
+            spec = (
+                _load_gitignore(gitignore_path, st.st_mtime_ns)
+                if stat.S_ISREG(st.st_mode)
+                else None
+            )
+        self._gitignore_specs[dir_rel] = spec
+        return spec
+
+    def _is_gitignored(self, path: str, is_dir: bool = True) -> bool:
+        """True if .gitignore files in base_path or path's parents ignore path.
+
+        As in git, the deepest .gitignore with a matching pattern decides, and
+        nothing inside an ignored directory can be re-included.
+        """
+        parts = path.split("/")
+        if len(parts) > 1 and self._dir_gitignored("/".join(parts[:-1])):
+            return True
+
+        suffix = "/" if is_dir else ""
+        ignored = False
+        for depth in range(len(parts)):
+            spec = self._gitignore_in("/".join(parts[:depth]))
+            if spec is not None:
+                verdict = _gitignore_verdict(spec, "/".join(parts[depth:]) + suffix)
+                if verdict is not None:
+                    ignored = verdict
+        return ignored
+
+    def _posix_path(self, path: str) -> str:
+        """Normalize path for pattern matching (forward slashes, no "." or "//").
+
+        String-only, so no Path object is built per check. ".." is collapsed
+        the same way _resolve_and_validate_path does, so patterns see the path
+        that is actually accessed.
+        """
+        if not self._sep_is_slash:
+            path = path.replace(os.sep, "/")
+        return posixpath.normpath(path)
+
+    def _exclusion_error(self, path: str, is_dir: bool) -> Optional[str]:
+        """Return why path is excluded (exclude patterns or .gitignore), or None.
+
+        Unlike include patterns, exclusions apply to a directory's contents
+        too, so list_all_paths doesn't descend into excluded directories.
+        """
+        normalized_path = self._posix_path(path)
+
+        # Check exclude patterns first (blacklist takes precedence). Kept apart
+        # from .gitignore so its negations can't re-include an excluded path.
+        if self._exclude_set:
+            pattern = self._exclude_set.match(normalized_path, is_dir)
+            if pattern is not None:
+                return f"Path '{path}' matches exclude pattern '{pattern}'"
+
+        # Check .gitignore files, which may exist at any level below base_path
+        if self._is_gitignored(normalized_path, is_dir):
+            return f"Path '{path}' is ignored by .gitignore"
+
+        return None
+
     def read_file(self, path: str) -> str:
         """Read a file with security checks.
 
@@ -180,24 +468,16 @@ class AgentFileTools:
             file_path = self._resolve_and_validate_path(path)
             self._check_patterns(path)
 
-            # Check file exists
-            if not self.editor.file_exists(str(file_path)):
-                raise ModelRetry(f"File not found: {path}")
-
-            # Read file
-            result = self.editor.read_file(str(file_path))
-
-            # Check size limit
-            if result.size_bytes > self.max_file_size:
-                raise ModelRetry(
-                    f"File '{path}' is too large ({result.size_bytes:,} bytes). "
-                    f"Maximum size is {self.max_file_size:,} bytes."
-                )
-
-            return result.content
+            # The editor checks existence and size before reading anything
+            return self.editor.read_file_limited(str(file_path), self.max_file_size).content
 
         except SecurityError as e:
             raise ModelRetry(f"Access denied: {str(e)}")
+        except FileTooLargeError as e:
+            raise ModelRetry(
+                f"File '{path}' is too large ({e.size_bytes:,} bytes). "
+                f"Maximum size is {self.max_file_size:,} bytes."
+            )
         except FileNotFoundError:
             raise ModelRetry(f"File not found: {path}")
         except UnicodeDecodeError:
@@ -285,6 +565,10 @@ class AgentFileTools:
     def list_all_paths(self, recursive: bool = True, prefix: str = "") -> list[PathInfo]:
         """List all accessible paths (respects include/exclude patterns).
 
+        Directories matched by exclude patterns or .gitignore are not
+        descended into, so none of their contents are listed. Directories
+        are listed one after another; list_all_paths_async overlaps them.
+
         Args:
             recursive: If True, list recursively
             prefix: Optional prefix to filter results (e.g., "docs" to list only docs/)
@@ -296,40 +580,44 @@ class AgentFileTools:
             ModelRetry: If listing fails
         """
         try:
-            # Determine starting path
-            if prefix:
-                # Validate prefix path
-                start_path = self._resolve_and_validate_path(prefix)
-            else:
-                start_path = self.base_path
+            # Walk one directory at a time so excluded subtrees are never listed
+            filtered: list[PathInfo] = []
+            pending = [self._listing_start(prefix)]
+            while pending:
+                entries, subdirs = self._list_dir(*pending.pop(), recursive)
+                filtered.extend(entries)
+                pending.extend(subdirs)
+
+            filtered.sort(key=lambda x: x.path)
+            return filtered
 
-            # List all paths
-            all_paths = self.editor.list_paths(str(start_path), recursive=recursive)
+        except SecurityError as e:
+            raise ModelRetry(f"Access denied: {str(e)}")
+        except Exception as e:
+            raise ModelRetry(f"Error listing paths: {str(e)}")
 
-            # Filter by patterns
-            filtered = []
-            for path_info in all_paths:
-                # Construct full relative path from base_path
-                if prefix:
-                    full_rel_path = str(Path(prefix) / path_info.path)
-                else:
-                    full_rel_path = path_info.path
-
-                try:
-                    is_dir = path_info.type == "directory"
-                    self._check_patterns(full_rel_path, is_dir=is_dir)
-                    # Update path_info with full relative path
-                    filtered.append(
-                        PathInfo(
-                            path=full_rel_path,
-                            type=path_info.type,
-                            last_modified=path_info.last_modified,
-                        )
-                    )
-                except SecurityError:
-                    # Skip paths that don't match patterns
-                    continue
+    async def list_all_paths_async(
+        self, recursive: bool = True, prefix: str = ""
+    ) -> list[PathInfo]:
+        """Async variant of list_all_paths.
 
+        The directories of each level of the walk are listed concurrently in
+        worker threads, so per-directory latency (cold caches, network
+        filesystems) overlaps instead of adding up.
+        """
+        try:
+            filtered: list[PathInfo] = []
+            level = [self._listing_start(prefix)]
+            while level:
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(self._list_dir, *d, recursive) for d in level)
+                )
+                level = []
+                for entries, subdirs in results:
+                    filtered.extend(entries)
+                    level.extend(subdirs)
+
+            filtered.sort(key=lambda x: x.path)
             return filtered
 
         except SecurityError as e:
@@ -337,6 +625,62 @@ class AgentFileTools:
         except Exception as e:
             raise ModelRetry(f"Error listing paths: {str(e)}")
 
+    def _listing_start(self, prefix: str) -> tuple[str, str]:
+        """Validate prefix and return (absolute dir, relative dir) to list from."""
+        if not prefix:
+            return str(self.base_path), ""
+
+        start_path = self._resolve_and_validate_path(prefix)
+        # Relative prefix normalized once; entries are joined onto it as strings
+        prefix_rel = os.path.normpath(prefix)
+        if prefix_rel == os.curdir:
+            prefix_rel = ""
+        return str(start_path), prefix_rel
+
+    def _list_dir(
+        self, dir_path: str, dir_rel: str, recursive: bool
+    ) -> tuple[list[PathInfo], list[tuple[str, str]]]:
+        """List one directory for list_all_paths.
+
+        Returns the entries that pass the pattern checks (with paths relative
+        to base_path) and the (absolute, relative) subdirectories to descend
+        into when recursive.
+        """
+        entries: list[PathInfo] = []
+        subdirs: list[tuple[str, str]] = []
+        for path_info in self.editor.list_paths(dir_path, recursive=False):
+            # Construct full relative path from base_path
+            if dir_rel:
+                full_rel_path = f"{dir_rel}{os.sep}{path_info.path}"
+            else:
+                full_rel_path = path_info.path
+            is_dir = path_info.type == "directory"
+
+            # Like git, skip excluded directories instead of filtering
+            # their contents; symlinked directories aren't followed
+            if recursive and is_dir:
+                child_path = os.path.join(dir_path, path_info.path)
+                if (
+                    not os.path.islink(child_path)
+                    and self._exclusion_error(full_rel_path, is_dir=True) is None
+                ):
+                    subdirs.append((child_path, full_rel_path))
+
+            try:
+                self._check_patterns(full_rel_path, is_dir=is_dir)
+            except SecurityError:
+                # Skip paths that don't match patterns
+                continue
+            # Update path_info with full relative path
+            entries.append(
+                PathInfo(
+                    path=full_rel_path,
+                    type=path_info.type,
+                    last_modified=path_info.last_modified,
+                )
+            )
+        return entries, subdirs
+
     def file_exists(self, path: str) -> bool:
         """Check if a file exists (with security validation).
 
@@ -10,6 +10,7 @@ from .registry import (
 )
 from .registry_service import (
     ModelRegistryService,
+    close_registry,
     get_registry_service,
     initialize_registry,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "Provider",
     # Registry service
     "ModelRegistryService",
+    "close_registry",
     "get_registry_service",
     "initialize_registry",
 ]
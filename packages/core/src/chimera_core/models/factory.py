@@ -85,16 +85,13 @@ def _validate_model_name(model_name: str) -> None:
         from .registry_service import get_registry_service
 
         service = get_registry_service()
-        # Use sync local cache check
-        if model_name not in service._local_cache:
-            # Also check by provider_model_id
-            found = any(m.provider_model_id == model_name for m in service._local_cache.values())
-            if not found:
-                logger.warning(
-                    f"Model '{model_name}' not found in registry. "
-                    "Proceeding with creation anyway. "
-                    "Run initialize_registry() to populate the cache."
-                )
+        # Sync local cache check, by full ID or provider_model_id (both indexed)
+        if service._lookup_local(model_name) is None:
+            logger.warning(
+                f"Model '{model_name}' not found in registry. "
+                "Proceeding with creation anyway. "
+                "Run initialize_registry() to populate the cache."
+            )
     except ImportError:
         # Registry not available, skip validation
         pass
@@ -11,13 +11,27 @@ occur when historical tool IDs are malformed.
 See: _meta/agents/blueprints/kimi-k2.md for details on the issue.
 """
 
+import contextvars
+import functools
+from typing import Optional
+
 from openai.types.chat import ChatCompletionMessageFunctionToolCallParam
 from pydantic_ai.messages import (
     ModelMessage,
+    RetryPromptPart,
     ToolCallPart,
+    ToolReturnPart,
 )
+from pydantic_ai.models import ModelRequestParameters
 from pydantic_ai.models.openai import OpenAIChatModel
 
+# (model, [(message, mapped messages)]) for the history last mapped in this
+# context. Each run has its own context, so concurrent runs sharing a model
+# instance don't evict each other's entries.
+_mapped_history: contextvars.ContextVar[
+    Optional[tuple["KimiChatModel", list[tuple[ModelMessage, list]]]]
+] = contextvars.ContextVar("kimi_mapped_history", default=None)
+
 
 class KimiChatModel(OpenAIChatModel):
     """OpenAI-compatible chat model wrapper for Kimi K2 with tool ID normalization.
@@ -33,11 +47,15 @@ class KimiChatModel(OpenAIChatModel):
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_tool_id_for_kimi(tool_id: str, tool_name: str) -> str:
         """Normalize a tool ID to Kimi K2's expected format.
 
         Kimi expects: `functions.{tool_name}:{index}`
 
+        History is re-mapped every turn, so the same (tool_id, tool_name)
+        pairs recur; results are cached.
+
         Args:
             tool_id: Original tool ID (e.g., "message_claude_code:0", "call_abc123")
             tool_name: The function name for this tool
@@ -84,15 +102,55 @@ class KimiChatModel(OpenAIChatModel):
             function={"name": t.tool_name, "arguments": t.args_as_json_str()},
         )
 
-    async def _map_messages(self, messages: list[ModelMessage]) -> list:
+    async def _map_messages(
+        self, messages: list[ModelMessage], model_request_parameters: ModelRequestParameters
+    ) -> list:
         """Map messages with tool ID normalization for Kimi K2.
 
         Overrides to normalize tool IDs in:
         - ToolReturnPart (tool results from history)
         - RetryPromptPart (retry prompts with tool context)
+
+        Within a run the history grows by appending to the same message
+        objects, so mapped output is kept per message and only the messages
+        after the last identical prefix are mapped again.
         """
+        state = _mapped_history.get()
+        cached = state[1] if state is not None and state[0] is self else []
+        prefix_len = 0
+        for (cached_message, _), message in zip(cached, messages):
+            if cached_message is not message:
+                break
+            prefix_len += 1
+
+        mapped_history = cached[:prefix_len]
+        for message in messages[prefix_len:]:
+            mapped_history.append(
+                (message, await self._map_message(message, model_request_parameters))
+            )
+        _mapped_history.set((self, mapped_history))
+
+        openai_messages = [item for _, mapped in mapped_history for item in mapped]
+        if instructions := self._get_instructions(messages, model_request_parameters):
+            openai_messages.insert(0, {"role": "system", "content": instructions})
+        return openai_messages
+
+    async def _map_message(
+        self, message: ModelMessage, model_request_parameters: ModelRequestParameters
+    ) -> list:
+        """Map a single message and normalize tool IDs in its tool results."""
         # First get the standard OpenAI message mapping
-        openai_messages = await super()._map_messages(messages)
+        openai_messages = await super()._map_messages([message], model_request_parameters)
+        # Instructions are added once for the whole history in _map_messages
+        if self._get_instructions([message], model_request_parameters):
+            openai_messages = openai_messages[1:]
+
+        # Tool result messages don't carry the tool name; take it from the parts
+        tool_names = {
+            part.tool_call_id: part.tool_name
+            for part in getattr(message, "parts", ())
+            if isinstance(part, (ToolReturnPart, RetryPromptPart)) and part.tool_name
+        }
 
         # Now post-process to normalize tool IDs in tool result messages
         # This ensures historical tool calls have the correct format
@@ -100,7 +158,7 @@ class KimiChatModel(OpenAIChatModel):
             # Tool result messages have role='tool'
             if isinstance(msg, dict) and msg.get("role") == "tool":
                 tool_call_id = msg.get("tool_call_id")
-                tool_name = msg.get("name")
+                tool_name = msg.get("name") or tool_names.get(tool_call_id)
 
                 if tool_call_id and tool_name:
                     msg["tool_call_id"] = self.normalize_tool_id_for_kimi(tool_call_id, tool_name)
@@ -4,9 +4,16 @@ Each adapter implements the ProviderAdapter protocol to fetch model
 metadata from a specific provider's API.
 """
 
-from .base import ProviderAdapter
+from .base import ProviderAdapter, close_shared_http_client, get_shared_http_client
 from .gemini import GeminiAdapter
 from .kimi import KimiAdapter
 from .openrouter import OpenRouterAdapter
 
-__all__ = ["ProviderAdapter", "OpenRouterAdapter", "GeminiAdapter", "KimiAdapter"]
+__all__ = [
+    "ProviderAdapter",
+    "OpenRouterAdapter",
+    "GeminiAdapter",
+    "KimiAdapter",
+    "close_shared_http_client",
+    "get_shared_http_client",
+]
@@ -1,14 +1,50 @@
 """Base protocol for provider adapters."""
 
-from typing import Protocol, runtime_checkable
+import asyncio
+import weakref
+from typing import Protocol
+
+import httpx
 
 from chimera_core.models.registry import ModelMetadata, Provider
 
+# Pooled clients shared by adapters, one per event loop since httpx
+# connections cannot be reused across loops.
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive HTTP client shared by provider adapters.
+
+    Reusing one client lets repeated registry refreshes skip the TCP and
+    TLS handshake for each provider.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            timeout=30.0,
+        )
+        _shared_http_clients[loop] = client
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client for the running event loop."""
+    client = _shared_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
-@runtime_checkable
 class ProviderAdapter(Protocol):
     """Protocol for provider adapters.
 
+    Used for static typing only; adapters are looked up by Provider rather
+    than checked with isinstance.
+
     Each provider adapter is responsible for:
     1. Fetching available models from the provider's API
     2. Transforming provider-specific responses to ModelMetadata
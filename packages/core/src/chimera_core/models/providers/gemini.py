@@ -10,11 +10,23 @@ Multimodal support is inferred from model names.
 
 import logging
 import os
+import re
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from chimera_core.models.providers.base import get_shared_http_client
 from chimera_core.models.registry import (
     ModelCapabilities,
     ModelMetadata,
@@ -25,12 +37,21 @@ logger = logging.getLogger(__name__)
 
 GEMINI_MODELS_URL = "https://generativelanguage.googleapis.com/v1beta/models"
 
+# Name markers used to infer capabilities. "2.0-flash" is listed before "2.0"
+# so the alternation reports it as one marker.
+_CAPABILITY_MARKERS = re.compile(r"2\.0-flash|1\.5|2\.0|2\.5|pro-vision|flash|imagen")
+
 
 class GeminiAdapter:
     """Adapter for fetching model metadata from Google Gemini API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self._api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        self._http_client = http_client
 
     @property
     def provider(self) -> Provider:
@@ -51,15 +72,26 @@ class GeminiAdapter:
             logger.warning("Gemini API key not configured, skipping Gemini models")
             return []
 
+        models = []
+        now = datetime.now(timezone.utc)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    GEMINI_MODELS_URL,
-                    params={"key": self._api_key},
-                    timeout=30.0,
-                )
+            client = self._http_client or get_shared_http_client()
+            async with client.stream(
+                "GET",
+                GEMINI_MODELS_URL,
+                params={"key": self._api_key},
+                timeout=30.0,
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
+                async for model_data in self._iter_models(response):
+                    try:
+                        metadata = self._parse_model(model_data, now)
+                        if metadata:
+                            models.append(metadata)
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to parse Gemini model {model_data.get('name')}: {e}"
+                        )
         except httpx.HTTPError as e:
             logger.error(f"Gemini API error: {e}")
             raise
@@ -67,20 +99,33 @@ class GeminiAdapter:
             logger.error(f"Unexpected error fetching Gemini models: {e}")
             raise
 
-        models = []
-        for model_data in data.get("models", []):
-            try:
-                metadata = self._parse_model(model_data)
-                if metadata:
-                    models.append(metadata)
-            except Exception as e:
-                logger.warning(f"Failed to parse Gemini model {model_data.get('name')}: {e}")
-
         logger.info(f"Fetched {len(models)} models from Gemini")
         return models
 
-    def _parse_model(self, data: dict[str, Any]) -> Optional[ModelMetadata]:
-        """Parse Gemini model data into ModelMetadata."""
+    async def _iter_models(self, response: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+        """Yield model entries from a streamed models.list response.
+
+        With ijson installed, each entry is parsed as soon as its bytes arrive
+        so the full response is never held in memory. Otherwise the body is
+        read and decoded in one go, with orjson when available.
+        """
+        if ijson is None:
+            body = await response.aread()
+            data = orjson.loads(body) if orjson is not None else response.json()
+            for model_data in data.get("models", []):
+                yield model_data
+            return
+
+        async for model_data in ijson.items_async(
+            _ByteStreamReader(response.aiter_bytes()), "models.item", use_float=True
+        ):
+            yield model_data
+
+    def _parse_model(self, data: dict[str, Any], now: datetime) -> Optional[ModelMetadata]:
+        """Parse Gemini model data into ModelMetadata.
+
+        `now` is the fetch time, shared by every model in the response.
+        """
         # Gemini model names are like "models/gemini-1.5-pro"
         full_name = data.get("name", "")
         if not full_name:
@@ -111,7 +156,7 @@ class GeminiAdapter:
             max_context_window=input_limit,
             max_output_tokens=output_limit,
             is_available=True,
-            last_updated=datetime.now(timezone.utc),
+            last_updated=now,
         )
 
     def _parse_capabilities(self, model_id: str, data: dict[str, Any]) -> ModelCapabilities:
@@ -122,20 +167,23 @@ class GeminiAdapter:
         2. supportedGenerationMethods array
         """
         methods = data.get("supportedGenerationMethods", [])
-        model_lower = model_id.lower()
+        # One scan collects every capability marker in the model name
+        markers = set(_CAPABILITY_MARKERS.findall(model_id.lower()))
+
+        # Gemini 1.5, 2.0 and 2.5 models support vision, audio and video input
+        modern = not markers.isdisjoint(("1.5", "2.0", "2.5", "2.0-flash"))
 
         # Vision models
-        # Gemini 1.5 and 2.0 models support vision
-        image_input = any(x in model_lower for x in ["1.5", "2.0", "2.5", "pro-vision", "flash"])
+        image_input = modern or not markers.isdisjoint(("pro-vision", "flash"))
 
         # Audio input - Gemini 1.5+ and 2.0+ support audio
-        audio_input = any(x in model_lower for x in ["1.5", "2.0", "2.5"])
+        audio_input = modern
 
         # Video input - Gemini 1.5+ supports video
-        video_input = any(x in model_lower for x in ["1.5", "2.0", "2.5"])
+        video_input = modern
 
         # Image output - Gemini 2.0 Flash can generate images
-        image_output = "2.0-flash" in model_lower or "imagen" in model_lower
+        image_output = not markers.isdisjoint(("2.0-flash", "imagen"))
 
         # Function calling - most Gemini models support it
         function_calling = "generateContent" in methods
@@ -156,3 +204,20 @@ class GeminiAdapter:
             json_mode=function_calling,
             system_prompt=True,
         )
+
+
+class _ByteStreamReader:
+    """File-like wrapper exposing an async byte iterator to ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the data type with read(0) before parsing
+        if size == 0:
+            return b""
+        # Chunks of any length are accepted; an empty result marks EOF
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
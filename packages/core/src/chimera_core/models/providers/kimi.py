@@ -7,6 +7,7 @@ This adapter provides hardcoded model definitions that should be updated
 manually when new models are released.
 """
 
+import functools
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -112,57 +113,65 @@ class KimiAdapter:
         Note: These are hardcoded since Moonshot doesn't provide a models API.
         Update KIMI_MODELS when new models are released.
         """
-        models = []
-        for model_data in KIMI_MODELS:
-            try:
-                metadata = self._parse_model(model_data)
-                if metadata:
-                    models.append(metadata)
-            except Exception as e:
-                logger.warning(f"Failed to parse Kimi model {model_data.get('id')}: {e}")
-
+        models = list(_parsed_kimi_models())
         logger.info(f"Loaded {len(models)} static Kimi model definitions")
         return models
 
-    def _parse_model(self, data: dict) -> Optional[ModelMetadata]:
-        """Parse static model definition into ModelMetadata."""
-        model_id = data.get("id")
-        if not model_id:
-            return None
-
-        caps_data = data.get("capabilities", {})
-        capabilities = ModelCapabilities(
-            text_input=True,
-            image_input=caps_data.get("image_input", False),
-            audio_input=caps_data.get("audio_input", False),
-            video_input=caps_data.get("video_input", False),
-            text_output=True,
-            image_output=False,
-            audio_output=False,
-            function_calling=caps_data.get("function_calling", False),
-            streaming=True,
-            json_mode=caps_data.get("function_calling", False),
-            system_prompt=True,
-        )
 
-        pricing_data = data.get("pricing")
-        pricing = None
-        if pricing_data:
-            pricing = ModelPricing(
-                input_cost_per_million=pricing_data.get("input", 0),
-                output_cost_per_million=pricing_data.get("output", 0),
-            )
-
-        return ModelMetadata(
-            id=f"kimi:{model_id}",
-            provider=Provider.KIMI,
-            provider_model_id=model_id,
-            display_name=data.get("display_name", model_id),
-            description=data.get("description"),
-            capabilities=capabilities,
-            pricing=pricing,
-            max_context_window=data.get("context_window", 8192),
-            max_output_tokens=data.get("max_output"),
-            is_available=True,
-            last_updated=datetime.now(timezone.utc),
+@functools.lru_cache(maxsize=1)
+def _parsed_kimi_models() -> tuple[ModelMetadata, ...]:
+    """Parse KIMI_MODELS once; the definitions are static."""
+    models = []
+    now = datetime.now(timezone.utc)
+    for model_data in KIMI_MODELS:
+        try:
+            metadata = _parse_model(model_data, now)
+            if metadata:
+                models.append(metadata)
+        except Exception as e:
+            logger.warning(f"Failed to parse Kimi model {model_data.get('id')}: {e}")
+    return tuple(models)
+
+
+def _parse_model(data: dict, now: datetime) -> Optional[ModelMetadata]:
+    """Parse static model definition into ModelMetadata, stamped with `now`."""
+    model_id = data.get("id")
+    if not model_id:
+        return None
+
+    caps_data = data.get("capabilities", {})
+    capabilities = ModelCapabilities(
+        text_input=True,
+        image_input=caps_data.get("image_input", False),
+        audio_input=caps_data.get("audio_input", False),
+        video_input=caps_data.get("video_input", False),
+        text_output=True,
+        image_output=False,
+        audio_output=False,
+        function_calling=caps_data.get("function_calling", False),
+        streaming=True,
+        json_mode=caps_data.get("function_calling", False),
+        system_prompt=True,
+    )
+
+    pricing_data = data.get("pricing")
+    pricing = None
+    if pricing_data:
+        pricing = ModelPricing(
+            input_cost_per_million=pricing_data.get("input", 0),
+            output_cost_per_million=pricing_data.get("output", 0),
         )
+
+    return ModelMetadata(
+        id=f"kimi:{model_id}",
+        provider=Provider.KIMI,
+        provider_model_id=model_id,
+        display_name=data.get("display_name", model_id),
+        description=data.get("description"),
+        capabilities=capabilities,
+        pricing=pricing,
+        max_context_window=data.get("context_window", 8192),
+        max_output_tokens=data.get("max_output"),
+        is_available=True,
+        last_updated=now,
+    )
@@ -7,13 +7,21 @@ OpenRouter provides the richest metadata of all providers:
 - RSS feed for model updates (unique among providers)
 """
 
+import functools
 import logging
 import os
+import re
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from chimera_core.models.providers.base import get_shared_http_client
 from chimera_core.models.registry import (
     ModelCapabilities,
     ModelMetadata,
@@ -25,12 +33,59 @@ logger = logging.getLogger(__name__)
 
 OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
 
+# Known function-calling models/families
+FUNCTION_CALLING_PATTERNS = [
+    "claude",
+    "gpt-4",
+    "gpt-3.5",
+    "gemini",
+    "mistral",
+    "mixtral",
+    "llama-3",
+    "qwen",
+    "command",
+    "deepseek",
+]
+# All patterns in one regex, so each model ID is scanned once
+_FUNCTION_CALLING_FAMILIES = re.compile("|".join(map(re.escape, FUNCTION_CALLING_PATTERNS)))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_modality(modality: str) -> tuple[bool, bool, bool, bool, bool]:
+    """Parse a modality string into (image_in, audio_in, video_in, image_out, audio_out).
+
+    OpenRouter uses a handful of distinct modality strings, so results are cached.
+    """
+    # Parse input modalities (before ->)
+    input_part, output_part = "text", "text"
+    if "->" in modality:
+        parts = modality.split("->")
+        input_part = parts[0] if len(parts) > 0 else "text"
+        output_part = parts[1] if len(parts) > 1 else "text"
+
+    return (
+        "image" in input_part,
+        "audio" in input_part,
+        "video" in input_part,
+        "image" in output_part,
+        "audio" in output_part,
+    )
+
 
 class OpenRouterAdapter:
     """Adapter for fetching model metadata from OpenRouter."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self._api_key = api_key or os.getenv("OPENROUTER_API_KEY")
+        self._http_client = http_client
+        # Validators and models from the last full response, for conditional GETs
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_models: list[ModelMetadata] = []
 
     @property
     def provider(self) -> Provider:
@@ -47,16 +102,27 @@ class OpenRouterAdapter:
         - Modality (text, image, audio capabilities)
         - Pricing per token type
         - Context window and output limits
+
+        Repeat fetches send the last ETag / Last-Modified validators; a 304
+        response returns the previously parsed models without a download.
         """
         headers = {}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(OPENROUTER_MODELS_URL, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
+            client = self._http_client or get_shared_http_client()
+            response = await client.get(OPENROUTER_MODELS_URL, headers=headers, timeout=30.0)
+            if response.status_code == 304:
+                logger.info("OpenRouter model list not modified")
+                return list(self._last_models)
+            response.raise_for_status()
+            # orjson parses the raw body bytes without decoding to str first
+            data = orjson.loads(response.content) if orjson is not None else response.json()
         except httpx.HTTPError as e:
             logger.error(f"OpenRouter API error: {e}")
             raise
@@ -65,19 +131,27 @@ class OpenRouterAdapter:
             raise
 
         models = []
+        now = datetime.now(timezone.utc)
         for model_data in data.get("data", []):
             try:
-                metadata = self._parse_model(model_data)
+                metadata = self._parse_model(model_data, now)
                 if metadata:
                     models.append(metadata)
             except Exception as e:
                 logger.warning(f"Failed to parse OpenRouter model {model_data.get('id')}: {e}")
 
+        self._etag = response.headers.get("etag")
+        self._last_modified = response.headers.get("last-modified")
+        self._last_models = models
+
         logger.info(f"Fetched {len(models)} models from OpenRouter")
         return models
 
-    def _parse_model(self, data: dict[str, Any]) -> Optional[ModelMetadata]:
-        """Parse OpenRouter model data into ModelMetadata."""
+    def _parse_model(self, data: dict[str, Any], now: datetime) -> Optional[ModelMetadata]:
+        """Parse OpenRouter model data into ModelMetadata.
+
+        `now` is the fetch time, shared by every model in the response.
+        """
         model_id = data.get("id")
         if not model_id:
             return None
@@ -103,7 +177,7 @@ class OpenRouterAdapter:
             max_context_window=context_length,
             max_output_tokens=max_output,
             is_available=True,
-            last_updated=datetime.now(timezone.utc),
+            last_updated=now,
         )
 
     def _parse_capabilities(self, data: dict[str, Any]) -> ModelCapabilities:
@@ -117,21 +191,9 @@ class OpenRouterAdapter:
         """
         modality = data.get("architecture", {}).get("modality", "text->text")
 
-        # Parse input modalities (before ->)
-        input_part, output_part = "text", "text"
-        if "->" in modality:
-            parts = modality.split("->")
-            input_part = parts[0] if len(parts) > 0 else "text"
-            output_part = parts[1] if len(parts) > 1 else "text"
-
-        # Determine input capabilities
-        image_input = "image" in input_part
-        audio_input = "audio" in input_part
-        video_input = "video" in input_part
-
-        # Determine output capabilities
-        image_output = "image" in output_part
-        audio_output = "audio" in output_part
+        image_input, audio_input, video_input, image_output, audio_output = _parse_modality(
+            modality
+        )
 
         # Function calling - check if model supports it
         # OpenRouter doesn't expose this directly, infer from model family
@@ -157,21 +219,7 @@ class OpenRouterAdapter:
         Most modern models support function calling. This is a heuristic
         until OpenRouter exposes this directly.
         """
-        # Known function-calling models/families
-        fc_patterns = [
-            "claude",
-            "gpt-4",
-            "gpt-3.5",
-            "gemini",
-            "mistral",
-            "mixtral",
-            "llama-3",
-            "qwen",
-            "command",
-            "deepseek",
-        ]
-        model_lower = model_id.lower()
-        return any(pattern in model_lower for pattern in fc_patterns)
+        return _FUNCTION_CALLING_FAMILIES.search(model_id.lower()) is not None
 
     def _parse_pricing(self, data: dict[str, Any]) -> Optional[ModelPricing]:
         """Parse OpenRouter pricing into ModelPricing.
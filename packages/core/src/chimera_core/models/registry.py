@@ -39,6 +39,10 @@ class ModelCapabilities(BaseModel):
     system_prompt: bool = Field(default=True, description="Supports system prompts")
 
 
+# Capability names accepted by ModelMetadata.supports()
+_CAPABILITY_FIELDS = frozenset(ModelCapabilities.model_fields)
+
+
 class ModelPricing(BaseModel):
     """Model pricing information in USD.
 
@@ -108,9 +112,11 @@ class ModelMetadata(BaseModel):
         Returns:
             True if capability is supported, False otherwise
         """
-        if hasattr(self.capabilities, capability):
-            return bool(getattr(self.capabilities, capability))
-        return False
+        # Field values live in the instance __dict__; reading it directly
+        # skips attribute lookup on the Pydantic model
+        return capability in _CAPABILITY_FIELDS and bool(
+            self.capabilities.__dict__.get(capability, False)
+        )
 
 
 class ModelListResponse(BaseModel):
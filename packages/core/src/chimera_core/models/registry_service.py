@@ -9,19 +9,34 @@ from multiple providers. Features:
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
 import os
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import chain
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from chimera_core.cache import CacheClient, get_cache_client
+from chimera_core.cache.redis_client import encode_json
 from chimera_core.models.providers import (
     GeminiAdapter,
     KimiAdapter,
     OpenRouterAdapter,
     ProviderAdapter,
+    close_shared_http_client,
 )
 from chimera_core.models.registry import (
+    ModelCapabilities,
     ModelMetadata,
     ModelPricing,
     Provider,
@@ -31,12 +46,55 @@ logger = logging.getLogger(__name__)
 
 # Cache keys
 CACHE_KEY_ALL_MODELS = "models:all"
+CACHE_KEY_ALL_MODELS_MSGPACK = "models:all:msgpack"
 CACHE_KEY_PROVIDER = "models:provider:{provider}"
 CACHE_KEY_MODEL = "models:meta:{model_id}"
 
 # Default TTL in seconds
 DEFAULT_CACHE_TTL = int(os.getenv("MODEL_REGISTRY_CACHE_TTL", "300"))  # 5 minutes
 
+# Encoding of the cached model list: "msgpack" (used when installed) or "json",
+# which is easier to inspect in Redis
+CACHE_FORMAT = os.getenv("MODEL_REGISTRY_CACHE_FORMAT", "msgpack")
+
+
+def _use_msgpack() -> bool:
+    return msgpack is not None and CACHE_FORMAT == "msgpack"
+
+
+@functools.lru_cache(maxsize=1)
+def _litellm_model_cost() -> Optional[dict[str, Any]]:
+    """Return LiteLLM's model registry, or None if LiteLLM isn't installed.
+
+    Imported on first use (litellm is slow to import) and remembered, so
+    later refreshes don't retry the import.
+    """
+    try:
+        from litellm import model_cost  # type: ignore[import-not-found]
+    except ImportError:
+        logger.debug("LiteLLM not installed, skipping enrichment")
+        return None
+    return model_cost  # type: ignore[no-any-return]
+
+
+def _model_from_cache(data: dict) -> ModelMetadata:
+    """Rebuild ModelMetadata from its cached model_dump(mode="json") form.
+
+    The cache only holds data this service dumped from validated models, so
+    validation is skipped; only the enum, datetime and nested models are
+    restored. The cached dict is left unmodified.
+    """
+    pricing = data.get("pricing")
+    return ModelMetadata.model_construct(
+        **{
+            **data,
+            "provider": Provider(data["provider"]),
+            "capabilities": ModelCapabilities.model_construct(**data["capabilities"]),
+            "pricing": ModelPricing.model_construct(**pricing) if pricing else None,
+            "last_updated": datetime.fromisoformat(data["last_updated"]),
+        }
+    )
+
 
 class ModelRegistryService:
     """Central service for model metadata management.
@@ -49,16 +107,26 @@ class ModelRegistryService:
         self,
         cache_client: Optional[CacheClient] = None,
         cache_ttl: int = DEFAULT_CACHE_TTL,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self._cache = cache_client or get_cache_client()
         self._cache_ttl = cache_ttl
-        self._adapters: list[ProviderAdapter] = [
-            OpenRouterAdapter(),
-            GeminiAdapter(),
-            KimiAdapter(),
-        ]
+        self._adapters: dict[Provider, ProviderAdapter] = {
+            Provider.OPENROUTER: OpenRouterAdapter(http_client=http_client),
+            Provider.GEMINI: GeminiAdapter(http_client=http_client),
+            Provider.KIMI: KimiAdapter(),
+        }
         self._local_cache: dict[str, ModelMetadata] = {}  # Fast lookup cache
+        self._by_provider_model_id: dict[str, ModelMetadata] = {}
+        self._by_provider: dict[Provider, list[ModelMetadata]] = {}
+        self._by_capability: dict[str, list[ModelMetadata]] = {}
         self._last_refresh: Optional[datetime] = None
+        # time.monotonic() when the local indexes were last rebuilt
+        self._indexed_at: Optional[float] = None
+        # Refresh in progress, shared by concurrent callers
+        self._refresh_future: Optional[asyncio.Future[list[ModelMetadata]]] = None
+        # (cache key, digest) of the model list last written to the cache
+        self._last_payload_digest: Optional[tuple[str, bytes]] = None
 
     async def get_all_models(self, force_refresh: bool = False) -> list[ModelMetadata]:
         """Get all available models from all providers.
@@ -71,21 +139,55 @@ class ModelRegistryService:
         """
         if not force_refresh:
             # Try cache first
-            cached = await self._cache.get_json(CACHE_KEY_ALL_MODELS)
+            cached = await self._read_cached_models()
             if cached:
-                models = [ModelMetadata(**m) for m in cached]
+                models = [_model_from_cache(m) for m in cached]
                 self._update_local_cache(models)
                 return models
 
+        return await self._refresh()
+
+    async def _refresh(self) -> list[ModelMetadata]:
+        """Refresh from providers; concurrent callers share one refresh.
+
+        If the leading call is cancelled, waiting callers fall back to
+        running their own refresh instead of inheriting the cancellation.
+        """
+        pending = self._refresh_future
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            return await self._fetch_and_cache()
+
+        future: asyncio.Future[list[ModelMetadata]] = asyncio.get_running_loop().create_future()
+        self._refresh_future = future
+        try:
+            models = await self._fetch_and_cache()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved so a lone caller doesn't log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(models)
+            return models
+        finally:
+            if self._refresh_future is future:
+                self._refresh_future = None
+
+    async def _fetch_and_cache(self) -> list[ModelMetadata]:
+        """Fetch from all providers, then update the shared and local caches."""
         # Fetch from all providers
         models = await self._fetch_all_providers()
 
         # Cache results
-        await self._cache.set_json(
-            CACHE_KEY_ALL_MODELS,
-            [m.model_dump(mode="json") for m in models],
-            ttl=self._cache_ttl,
-        )
+        await self._write_cached_models(models)
 
         self._update_local_cache(models)
         self._last_refresh = datetime.now(timezone.utc)
@@ -102,14 +204,10 @@ class ModelRegistryService:
         Returns:
             ModelMetadata if found, None otherwise.
         """
-        # Check local cache first
-        if model_id in self._local_cache:
-            return self._local_cache[model_id]
-
-        # Check for provider_model_id match
-        for cached_model in self._local_cache.values():
-            if cached_model.provider_model_id == model_id:
-                return cached_model
+        # Check local cache first, by full ID then provider_model_id
+        cached_model = self._lookup_local(model_id)
+        if cached_model:
+            return cached_model
 
         # Try individual model cache
         cached = await self._cache.get_json(CACHE_KEY_MODEL.format(model_id=model_id))
@@ -133,8 +231,8 @@ class ModelRegistryService:
         Returns:
             List of models from the specified provider.
         """
-        all_models = await self.get_all_models()
-        return [m for m in all_models if m.provider == provider]
+        await self._ensure_fresh_indexes()
+        return list(self._by_provider.get(provider, ()))
 
     async def get_models_by_capability(self, capability: str) -> list[ModelMetadata]:
         """Get all models that support a specific capability.
@@ -145,8 +243,8 @@ class ModelRegistryService:
         Returns:
             List of models supporting the capability.
         """
-        all_models = await self.get_all_models()
-        return [m for m in all_models if m.supports(capability)]
+        await self._ensure_fresh_indexes()
+        return list(self._by_capability.get(capability, ()))
 
     async def validate_model(self, model_id: str) -> bool:
         """Check if a model ID is valid and available.
@@ -170,15 +268,10 @@ class ModelRegistryService:
         Returns:
             True if model supports capability, False if not or unknown.
         """
-        model = self._local_cache.get(model_id)
+        model = self._lookup_local(model_id)
         if model:
             return model.supports(capability)
 
-        # Check by provider_model_id
-        for cached_model in self._local_cache.values():
-            if cached_model.provider_model_id == model_id:
-                return cached_model.supports(capability)
-
         return False
 
     async def refresh_cache(self) -> int:
@@ -187,23 +280,61 @@ class ModelRegistryService:
         Returns:
             Number of models fetched.
         """
+        self.invalidate_local_cache()
         models = await self.get_all_models(force_refresh=True)
         return len(models)
 
+    async def _read_cached_models(self) -> Optional[list[dict]]:
+        """Read the cached model list as model_dump(mode="json") dicts."""
+        if not _use_msgpack():
+            return await self._cache.get_json(CACHE_KEY_ALL_MODELS)  # type: ignore[no-any-return]
+
+        raw = await self._cache.get_bytes(CACHE_KEY_ALL_MODELS_MSGPACK)
+        if raw is None:
+            return None
+        try:
+            return msgpack.unpackb(raw)  # type: ignore[no-any-return]
+        except ValueError as e:
+            logger.warning(f"Ignoring undecodable cached model list: {e}")
+            return None
+
+    async def _write_cached_models(self, models: list[ModelMetadata]) -> None:
+        """Write the model list to the cache in the configured encoding.
+
+        When the model list matches the last one written, only the TTL is
+        refreshed instead of sending the whole list again. ``last_updated`` is
+        left out of that comparison because providers restamp it on every
+        fetch; the cached copy keeps the timestamps of its last full write.
+        """
+        payload = [m.model_dump(mode="json") for m in models]
+        if _use_msgpack():
+            key, data = CACHE_KEY_ALL_MODELS_MSGPACK, msgpack.packb(payload)
+        else:
+            key, data = CACHE_KEY_ALL_MODELS, encode_json(payload)
+
+        content = [{k: v for k, v in d.items() if k != "last_updated"} for d in payload]
+        digest = (key, hashlib.blake2b(encode_json(content), digest_size=16).digest())
+        if digest == self._last_payload_digest and await self._cache.expire(key, self._cache_ttl):
+            return
+
+        if await self._cache.set(key, data, ttl=self._cache_ttl):
+            self._last_payload_digest = digest
+
     async def _fetch_all_providers(self) -> list[ModelMetadata]:
-        """Fetch models from all providers concurrently."""
-        tasks = [self._fetch_provider(adapter) for adapter in self._adapters]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """Fetch models from all providers concurrently.
 
-        all_models: list[ModelMetadata] = []
-        for result, adapter in zip(results, self._adapters):
-            if isinstance(result, BaseException):
-                logger.error(f"Failed to fetch from {adapter.get_provider_name()}: {result}")
-            elif isinstance(result, list):
-                all_models.extend(result)
+        _fetch_provider turns provider failures into empty results, so one
+        failing provider doesn't cancel the others in the task group.
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._fetch_provider(adapter)) for adapter in self._adapters.values()
+            ]
 
-        # Enrich with LiteLLM if available
-        all_models = await self._enrich_with_litellm(all_models)
+        all_models = list(chain.from_iterable(task.result() for task in tasks))
+
+        # Enrich with LiteLLM if available, off the event loop
+        all_models = await asyncio.to_thread(self._enrich_with_litellm, all_models)
 
         return all_models
 
@@ -217,16 +348,17 @@ class ModelRegistryService:
             logger.error(f"Provider {adapter.get_provider_name()} fetch failed: {e}")
             return []
 
-    async def _enrich_with_litellm(self, models: list[ModelMetadata]) -> list[ModelMetadata]:
+    def _enrich_with_litellm(self, models: list[ModelMetadata]) -> list[ModelMetadata]:
         """Enrich model metadata with LiteLLM registry data.
 
         LiteLLM maintains a comprehensive registry of model capabilities and pricing.
         We use it as a secondary source to fill in missing information.
+
+        Synchronous so it can run in a worker thread; the lookups and copies
+        for hundreds of models would otherwise stall the event loop.
         """
-        try:
-            from litellm import model_cost  # type: ignore[import-not-found]
-        except ImportError:
-            logger.debug("LiteLLM not installed, skipping enrichment")
+        model_cost = _litellm_model_cost()
+        if model_cost is None:
             return models
 
         enriched = []
@@ -248,33 +380,34 @@ class ModelRegistryService:
         # Try common patterns
         provider_model = model.provider_model_id
 
-        if model.provider == Provider.OPENROUTER:
+        if model.provider is Provider.OPENROUTER:
             # OpenRouter models might be indexed by provider/model format
             return provider_model
-        elif model.provider == Provider.GEMINI:
+        elif model.provider is Provider.GEMINI:
             # Gemini models use gemini-* format
             return provider_model
-        elif model.provider == Provider.KIMI:
+        elif model.provider is Provider.KIMI:
             # Kimi models might be under moonshot-*
             return provider_model
 
         return None
 
     def _apply_litellm_enrichment(self, model: ModelMetadata, litellm_data: dict) -> ModelMetadata:
-        """Apply LiteLLM data to enhance model metadata."""
+        """Apply LiteLLM data to enhance model metadata.
+
+        Changes are collected first so the model is copied at most once.
+        """
+        updates: dict[str, Any] = {}
+
         # Update pricing if not already set
         if model.pricing is None and (
             litellm_data.get("input_cost_per_token") or litellm_data.get("output_cost_per_token")
         ):
             input_cost = litellm_data.get("input_cost_per_token", 0) * 1_000_000
             output_cost = litellm_data.get("output_cost_per_token", 0) * 1_000_000
-            model = model.model_copy(
-                update={
-                    "pricing": ModelPricing(
-                        input_cost_per_million=input_cost,
-                        output_cost_per_million=output_cost,
-                    )
-                }
+            updates["pricing"] = ModelPricing(
+                input_cost_per_million=input_cost,
+                output_cost_per_million=output_cost,
             )
 
         # Update capabilities from LiteLLM
@@ -288,26 +421,60 @@ class ModelRegistryService:
             caps_updates["function_calling"] = True
 
         if caps_updates:
-            new_caps = model.capabilities.model_copy(update=caps_updates)
-            model = model.model_copy(update={"capabilities": new_caps})
+            updates["capabilities"] = model.capabilities.model_copy(update=caps_updates)
 
         # Update context window if LiteLLM has better info
         litellm_context = litellm_data.get("max_tokens") or litellm_data.get("max_input_tokens")
         if litellm_context and litellm_context > model.max_context_window:
-            model = model.model_copy(update={"max_context_window": litellm_context})
+            updates["max_context_window"] = litellm_context
+
+        return model.model_copy(update=updates) if updates else model
 
-        return model
+    def invalidate_local_cache(self) -> None:
+        """Drop the local indexes; the next query reloads them."""
+        self._local_cache = {}
+        self._by_provider_model_id = {}
+        self._by_provider = {}
+        self._by_capability = {}
+        self._indexed_at = None
+
+    async def _ensure_fresh_indexes(self) -> None:
+        """Reload the local indexes if they are missing or older than the cache TTL."""
+        indexed_at = self._indexed_at
+        if indexed_at is None or time.monotonic() - indexed_at >= self._cache_ttl:
+            await self.get_all_models()
+
+    def _lookup_local(self, model_id: str) -> Optional[ModelMetadata]:
+        """Look up a model in the local cache by full ID or provider_model_id."""
+        return self._local_cache.get(model_id) or self._by_provider_model_id.get(model_id)
 
     def _update_local_cache(self, models: list[ModelMetadata]) -> None:
         """Update local cache with fetched models.
 
-        Only indexes by model.id to avoid collision when multiple providers
-        expose the same provider_model_id. Lookups by provider_model_id
-        iterate over values (see get_model, supports_capability).
+        Indexes by model.id, plus a secondary index by provider_model_id.
+        When multiple providers expose the same provider_model_id, the first
+        model fetched wins. Models are also grouped by provider and by each
+        supported capability, in fetch order.
+
+        New indexes are built aside and then swapped in, so readers on other
+        threads (supports_capability is sync) never see a half-filled index.
         """
-        self._local_cache.clear()
+        local_cache: dict[str, ModelMetadata] = {}
+        by_provider_model_id: dict[str, ModelMetadata] = {}
+        by_provider: dict[Provider, list[ModelMetadata]] = defaultdict(list)
+        by_capability: dict[str, list[ModelMetadata]] = defaultdict(list)
         for model in models:
-            self._local_cache[model.id] = model
+            local_cache[model.id] = model
+            by_provider_model_id.setdefault(model.provider_model_id, model)
+            by_provider[model.provider].append(model)
+            for capability, supported in model.capabilities:
+                if supported:
+                    by_capability[capability].append(model)
+        self._local_cache = local_cache
+        self._by_provider_model_id = by_provider_model_id
+        self._by_provider = dict(by_provider)
+        self._by_capability = dict(by_capability)
+        self._indexed_at = time.monotonic()
 
 
 # Global service instance
@@ -332,3 +499,8 @@ async def initialize_registry() -> int:
     """
     service = get_registry_service()
     return await service.refresh_cache()
+
+
+async def close_registry() -> None:
+    """Close the HTTP connections kept open for provider fetches."""
+    await close_shared_http_client()
@@ -24,7 +24,7 @@ Usage examples:
     from chimera_core.primitives.bash import LocalBashExecutor, AgentBashTools
     from pathlib import Path
 
-    executor = LocalBashExecutor()
+    executor = LocalBashExecutor.default()
     tools = AgentBashTools.create_whitelist(
         executor=executor,
         allowed_patterns=["^git ", "^ls ", "^pwd$"],
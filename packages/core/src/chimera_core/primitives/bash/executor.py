@@ -8,11 +8,15 @@ subclassing BaseBashExecutor.
 """
 
 import asyncio
+import os
+import shlex
+import signal
 import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 
 @dataclass
@@ -36,10 +40,51 @@ class BashResult:
         output = self.stdout
         if self.stderr:
             output += "\n[STDERR]\n" + self.stderr
+        return self._format_combined(output)
+
+    def _format_combined(self, output: str) -> str:
+        """Prefix a non-zero exit code and normalize empty output."""
         if self.exit_code != 0:
             output = f"[Exit code: {self.exit_code}]\n{output}"
         return output.strip() if output else "(no output)"
 
+    @classmethod
+    def from_bytes(
+        cls, stdout: bytes, stderr: bytes, exit_code: int, command: str, cwd: str
+    ) -> "BashResult":
+        """Build a result from raw output, decoding UTF-8 only when it is read."""
+        return _LazyBashResult(stdout, stderr, exit_code, command, cwd)
+
+
+class _LazyBashResult(BashResult):
+    """BashResult holding raw output bytes until stdout/stderr are accessed.
+
+    Callers that only check ``success`` or ``exit_code`` never pay for decoding.
+    """
+
+    def __init__(self, stdout: bytes, stderr: bytes, exit_code: int, command: str, cwd: str):
+        self._stdout_bytes = stdout
+        self._stderr_bytes = stderr
+        self.exit_code = exit_code
+        self.command = command
+        self.cwd = cwd
+
+    @cached_property
+    def stdout(self) -> str:
+        return self._stdout_bytes.decode("utf-8", "replace")
+
+    @cached_property
+    def stderr(self) -> str:
+        return self._stderr_bytes.decode("utf-8", "replace")
+
+    @property
+    def combined_output(self) -> str:
+        # Join the raw streams so the output is decoded once, not twice
+        output = self._stdout_bytes
+        if self._stderr_bytes:
+            output += b"\n[STDERR]\n" + self._stderr_bytes
+        return self._format_combined(output.decode("utf-8", "replace"))
+
 
 class BaseBashExecutor(ABC):
     """Abstract base class for bash command execution.
@@ -59,14 +104,14 @@ class BaseBashExecutor(ABC):
     async def execute(
         self,
         command: str,
-        cwd: Optional[Path] = None,
+        cwd: Optional[Union[str, Path]] = None,
         timeout: int = 60,
     ) -> BashResult:
         """Execute a bash command.
 
         Args:
             command: Shell command to execute
-            cwd: Working directory (defaults to current directory)
+            cwd: Working directory as a path or string (defaults to current directory)
             timeout: Timeout in seconds (default 60)
 
         Returns:
@@ -78,29 +123,63 @@ class BaseBashExecutor(ABC):
         """
         pass
 
+    async def execute_argv(
+        self,
+        argv: list[str],
+        cwd: Optional[Union[str, Path]] = None,
+        timeout: int = 60,
+    ) -> BashResult:
+        """Execute a program directly from an argument vector, without a shell.
+
+        The default quotes ``argv`` back into a command line for ``execute``,
+        so implementations only need to override this when they can skip the shell.
+
+        Args:
+            argv: Program and arguments
+            cwd: Working directory (defaults to current directory)
+            timeout: Timeout in seconds (default 60)
+
+        Returns:
+            BashResult with stdout, stderr, and exit code
+        """
+        return await self.execute(shlex.join(argv), cwd=cwd, timeout=timeout)
+
 
 class LocalBashExecutor(BaseBashExecutor):
     """Local subprocess-based bash executor.
 
-    Executes commands on the local machine using subprocess.run.
+    Executes commands on the local machine through asyncio subprocesses, so a
+    running command doesn't occupy a thread from the default executor.
+
+    The executor holds no per-call state, so callers normally share the
+    process-wide instance from ``LocalBashExecutor.default()``.
 
     Example:
-        executor = LocalBashExecutor()
+        executor = LocalBashExecutor.default()
         result = await executor.execute("ls -la", cwd=Path("/tmp"))
         print(result.combined_output)
     """
 
+    _instance: Optional["LocalBashExecutor"] = None
+
+    @classmethod
+    def default(cls) -> "LocalBashExecutor":
+        """Return the shared process-wide executor, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     async def execute(
         self,
         command: str,
-        cwd: Optional[Path] = None,
+        cwd: Optional[Union[str, Path]] = None,
         timeout: int = 60,
     ) -> BashResult:
-        """Execute a bash command using subprocess.
+        """Execute a bash command in an asyncio subprocess.
 
         Args:
             command: Shell command to execute
-            cwd: Working directory (defaults to current directory)
+            cwd: Working directory as a path or string (defaults to current directory)
             timeout: Timeout in seconds (default 60)
 
         Returns:
@@ -110,33 +189,86 @@ class LocalBashExecutor(BaseBashExecutor):
             subprocess.TimeoutExpired: If command times out
             Exception: For other execution errors
         """
+        cwd_str = os.fspath(cwd) if cwd else None
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            cwd=cwd_str,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Own process group, so a kill also reaches the shell's children
+            start_new_session=True,
+        )
+        return await self._collect(proc, command, cwd_str, timeout)
+
+    async def execute_argv(
+        self,
+        argv: list[str],
+        cwd: Optional[Union[str, Path]] = None,
+        timeout: int = 60,
+    ) -> BashResult:
+        """Execute a program directly, saving the shell's fork/exec.
+
+        Args:
+            argv: Program and arguments
+            cwd: Working directory as a path or string (defaults to current directory)
+            timeout: Timeout in seconds (default 60)
+
+        Returns:
+            BashResult with stdout, stderr, and exit code (127 if the program is missing)
+
+        Raises:
+            subprocess.TimeoutExpired: If command times out
+            Exception: For other execution errors
+        """
+        command = shlex.join(argv)
+        cwd_str = os.fspath(cwd) if cwd else None
         try:
-            # Run in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=str(cwd) if cwd else None,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                ),
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                cwd=cwd_str,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
             )
-
-            return BashResult(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.returncode,
+        except FileNotFoundError:
+            # Report a missing program the way the shell would
+            return BashResult.from_bytes(
+                stdout=b"",
+                stderr=f"{argv[0]}: command not found\n".encode(),
+                exit_code=127,
                 command=command,
-                cwd=str(cwd) if cwd else str(Path.cwd()),
+                cwd=cwd_str if cwd_str is not None else os.getcwd(),
             )
+        return await self._collect(proc, command, cwd_str, timeout)
 
-        except subprocess.TimeoutExpired as e:
-            raise subprocess.TimeoutExpired(
-                cmd=command, timeout=timeout, output=e.output, stderr=e.stderr
-            )
-        except Exception:
-            # Let other exceptions propagate
+    @staticmethod
+    async def _collect(
+        proc: asyncio.subprocess.Process, command: str, cwd_str: Optional[str], timeout: int
+    ) -> BashResult:
+        """Wait for ``proc`` and gather its output, killing it on timeout."""
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            _kill_process_group(proc)
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd=command, timeout=timeout)
+        except asyncio.CancelledError:
+            # Don't leave the command running if the caller gives up on us
+            _kill_process_group(proc)
             raise
+
+        return BashResult.from_bytes(
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=proc.returncode,
+            command=command,
+            cwd=cwd_str if cwd_str is not None else os.getcwd(),
+        )
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """SIGKILL the process group led by ``proc``, ignoring already-exited processes."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
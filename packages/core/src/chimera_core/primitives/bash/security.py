@@ -9,20 +9,231 @@ This module wraps BaseBashExecutor with security constraints:
 The security layer is where we enforce command safety boundaries.
 """
 
+import os
 import re
+import shlex
+import stat
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional
 
 from pydantic_ai.exceptions import ModelRetry
 
-from chimera_core.primitives.bash.executor import BaseBashExecutor, BashResult
+from chimera_core.primitives.bash.executor import (
+    BaseBashExecutor,
+    BashResult,
+    LocalBashExecutor,
+)
+
+# Patterns simple enough to check without the regex engine
+_EXACT_COMMAND = re.compile(r"\^([\w-]+)\$")  # ^pwd$
+_FIRST_TOKEN = re.compile(r"\^([\w-]+) ")  # ^git (literal trailing space)
+_BARE_WORD = re.compile(r"\w+")  # mkfs, reboot (matches anywhere)
+
+_REGEX_METACHARS = frozenset("\\.^$*+?{}[]()|")
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+# \s+, \s*, and their possessive forms, shown to the agent as a single space
+_WHITESPACE_RUN = re.compile(r"\\s[+*]\+?")
+# Commands containing these could chain a side effect onto a read-only prefix
+_SHELL_METACHARS = re.compile(r"[;&|<>`$\n]")
+
+# Numbered backreferences (\1, \g<1>) and conditionals ((?(1)...))
+_NUMBERED_GROUP_REF = re.compile(r"\\[1-9]|\\g<\d+>|\(\?\(\d")
+
+
+def _split_alternatives(pattern: str) -> list[str]:
+    """Split a regex on its top-level ``|``, ignoring escapes, classes and groups."""
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 1
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A ']' straight after '[' or '[^' is a literal member
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def _leading_literal(pattern: str) -> str:
+    """Return the literal text every match of ``pattern`` must start with."""
+    literal = []
+    i = 0
+    if pattern.startswith("^"):
+        i = 1
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            # \s, \d, \b and friends are classes or assertions, not literals
+            if not escaped or escaped.isalnum():
+                break
+            literal.append(escaped)
+            i += 2
+        elif char in _REGEX_METACHARS:
+            break
+        else:
+            literal.append(char)
+            i += 1
+    # A trailing '*', '?' or '{m,n}' may make the last character optional
+    if literal and pattern[i : i + 1] in _OPTIONAL_QUANTIFIERS:
+        literal.pop()
+    return "".join(literal)
+
+
+def _required_needles(patterns: list[str]) -> Optional[tuple[str, ...]]:
+    """Lowercased substrings of which any match of ``patterns`` contains one.
+
+    Returns None if some alternative has no usable literal prefix, in which
+    case the regex must always run.
+    """
+    needles = set()
+    for pattern in patterns:
+        for alternative in _split_alternatives(pattern):
+            needle = _leading_literal(alternative)
+            if not needle or not needle.isascii():
+                return None
+            needles.add(needle.lower())
+    return tuple(sorted(needles))
+
+
+def _compile_each(patterns: list[str]) -> tuple[re.Pattern, ...]:
+    """Compile each pattern on its own, as a standalone ``re.search`` would.
+
+    Raises:
+        ValueError: If a pattern is not a valid regular expression
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            raise ValueError(f"Invalid command pattern {pattern!r}: {e}") from e
+    return tuple(compiled)
+
+
+def _can_fuse(pattern: str, regex: re.Pattern, group_names: set[str]) -> bool:
+    """Whether ``pattern`` keeps its meaning inside a shared alternation.
+
+    Group numbers shift once patterns are wrapped and joined, so numbered
+    backreferences and conditionals are never fused (an escaped backslash
+    before a digit is a harmless false positive). Inline global flags such as ``(?i)`` must lead
+    the whole regex, and group names must be unique across the alternation.
+    """
+    if _NUMBERED_GROUP_REF.search(pattern) or not group_names.isdisjoint(regex.groupindex):
+        return False
+    try:
+        re.compile(f"(?:)|(?:{pattern})")
+    except re.error:
+        return False
+    return True
+
+
+def _combine_patterns(patterns: list[str]) -> Optional[re.Pattern]:
+    """Fuse patterns into one alternation so validation is a single search.
+
+    Each pattern is wrapped in a named group ``p<index>``; ``match.lastgroup``
+    identifies which pattern matched. Returns None when there are no patterns,
+    since an empty alternation would match every command.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns)),
+        re.IGNORECASE,
+    )
+
+
+class _CompiledPatterns(NamedTuple):
+    """Validation lookups built from a pattern list; shared, so never mutated."""
+
+    exact_commands: dict[str, str]
+    first_tokens: dict[str, str]
+    substrings: dict[str, str]
+    residual_patterns: list[str]
+    fused_patterns: list[str]
+    residual: Optional[re.Pattern]
+    unfused: tuple[tuple[str, re.Pattern], ...]
+    residual_needles: Optional[tuple[str, ...]]
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> _CompiledPatterns:
+    """Sort patterns into literal lookups and a residual regex.
+
+    ``^word$`` becomes an exact command lookup, ``^word `` a first-token
+    lookup, and a bare ``word`` a substring check. Keys are casefolded to
+    keep ``re.IGNORECASE`` semantics. Everything else is fused into one
+    alternation regex, except patterns that would change meaning there,
+    which are searched one by one. Cached so instances with the same
+    patterns (notably the default blacklist) compile them once per process.
+
+    Raises:
+        ValueError: If a pattern is not a valid regular expression
+    """
+    exact_commands: dict[str, str] = {}
+    first_tokens: dict[str, str] = {}
+    substrings: dict[str, str] = {}
+    residual_patterns: list[str] = []
+
+    for pattern in patterns:
+        if match := _EXACT_COMMAND.fullmatch(pattern):
+            exact_commands.setdefault(match[1].casefold(), pattern)
+        elif match := _FIRST_TOKEN.fullmatch(pattern):
+            first_tokens.setdefault(match[1].casefold(), pattern)
+        elif _BARE_WORD.fullmatch(pattern):
+            substrings.setdefault(pattern.casefold(), pattern)
+        else:
+            residual_patterns.append(pattern)
+
+    fused_patterns: list[str] = []
+    unfused: list[tuple[str, re.Pattern]] = []
+    group_names: set[str] = set()
+    for pattern, regex in zip(residual_patterns, _compile_each(residual_patterns)):
+        if _can_fuse(pattern, regex, group_names):
+            fused_patterns.append(pattern)
+            group_names.update(regex.groupindex)
+        else:
+            unfused.append((pattern, regex))
+
+    return _CompiledPatterns(
+        exact_commands,
+        first_tokens,
+        substrings,
+        residual_patterns,
+        fused_patterns,
+        _combine_patterns(fused_patterns),
+        tuple(unfused),
+        _required_needles(residual_patterns),
+    )
 
 
 class SecurityError(Exception):
     """Raised when a security validation fails.
 
-    This is an internal exception that gets converted to ModelRetry
-    for agent consumption.
+    Raised by direct validation; AgentBashTools.execute reports the same
+    message to the agent as ModelRetry.
     """
 
     pass
@@ -68,7 +279,7 @@ class AgentBashTools:
         tools = AgentBashTools(
             executor=executor,
             mode="blacklist",
-            patterns=[r"rm\s+-rf\s+/", r"mkfs", r"reboot"],
+            patterns=[r"rm\s++-rf\s++/", r"mkfs", r"reboot"],
             cwd=Path("/Users/me/project"),
             timeout=60
         )
@@ -80,26 +291,31 @@ class AgentBashTools:
         result = await tools.execute("rm -rf /")
     """
 
-    # Default dangerous command patterns (for blacklist mode)
+    # Default dangerous command patterns (for blacklist mode). Whitespace runs use
+    # possessive quantifiers (Python 3.11+) so they never backtrack; ``.*`` stays
+    # greedy because a possessive ``.*+`` would swallow the text that must follow.
     DEFAULT_BLACKLIST = [
-        r"rm\s+-rf\s+/",  # Recursive force delete from root
-        r"rm\s+-rf\s+~",  # Recursive force delete home
+        r"rm\s++-rf\s++/",  # Recursive force delete from root
+        r"rm\s++-rf\s++~",  # Recursive force delete home
         r"mkfs",  # Format filesystem
-        r"dd\s+.*of=/dev/",  # Write to block devices
+        r"dd\s++.*of=/dev/",  # Write to block devices
         r":(){ :|:& };:",  # Fork bomb
-        r"chmod\s+-R\s+777",  # Dangerous permissions
-        r"wget.*\|\s*sh",  # Download and execute
-        r"curl.*\|\s*sh",  # Download and execute
-        r">\s*/dev/sd[a-z]",  # Write to disk devices
+        r"chmod\s++-R\s++777",  # Dangerous permissions
+        r"wget.*\|\s*+sh",  # Download and execute
+        r"curl.*\|\s*+sh",  # Download and execute
+        r">\s*+/dev/sd[a-z]",  # Write to disk devices
         r"mkswap",  # Create swap
         r"swapon",  # Enable swap
         r"swapoff",  # Disable swap
         r"reboot",  # System reboot
         r"shutdown",  # System shutdown
-        r"init\s+[0-6]",  # Change runlevel
-        r"systemctl\s+(halt|poweroff|reboot)",  # Systemctl power commands
+        r"init\s++[0-6]",  # Change runlevel
+        r"systemctl\s++(halt|poweroff|reboot)",  # Systemctl power commands
     ]
 
+    # Read-only commands whose results may be reused when caching is enabled
+    DEFAULT_CACHEABLE_PREFIXES = ["git status", "git diff", "ls", "pwd", "cat"]
+
     def __init__(
         self,
         executor: BaseBashExecutor,
@@ -107,6 +323,8 @@ class AgentBashTools:
         patterns: list[str],
         cwd: Path,
         timeout: int = 60,
+        cache_ttl: float = 0,
+        cacheable_prefixes: Optional[list[str]] = None,
     ):
         """Initialize AgentBashTools with security constraints.
 
@@ -116,19 +334,132 @@ class AgentBashTools:
             patterns: List of regex patterns for validation
             cwd: Working directory for all executions
             timeout: Timeout in seconds (default 60)
+            cache_ttl: Seconds to reuse successful results of cacheable commands
+                (default 0 - caching disabled)
+            cacheable_prefixes: Commands eligible for caching (defaults to
+                DEFAULT_CACHEABLE_PREFIXES)
+
+        Raises:
+            ValueError: If the mode is unknown, a pattern is not a valid regex,
+                or cwd is not an existing directory
         """
         self.executor = executor
         self.mode = mode
         self.patterns = patterns
+        self._split_literal_patterns(patterns)
+        self._formatted_patterns = self._format_patterns_for_agent()
+        # Bind the mode's validator once instead of dispatching on every call
+        if mode == "whitelist":
+            self._check_command = self._check_whitelist
+        elif mode == "blacklist":
+            self._check_command = self._check_blacklist
+        else:
+            raise ValueError(f"Unknown security mode: {mode!r}")
+        # A whitelist of plain ``^cmd `` / ``^cmd$`` entries never needs shell
+        # syntax, so such commands run without a shell (and without its metachars)
+        self._force_no_shell = (
+            mode == "whitelist"
+            and bool(patterns)
+            and not self._substrings
+            and not self._residual_patterns
+        )
         self.cwd = Path(cwd).resolve()
+        self._cwd_str = str(self.cwd)
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cacheable_prefixes = tuple(
+            self.DEFAULT_CACHEABLE_PREFIXES if cacheable_prefixes is None else cacheable_prefixes
+        )
+        self._cache: dict[tuple[str, str], tuple[float, BashResult]] = {}
 
-        # Validate cwd exists
-        if not self.cwd.exists():
+        # Validate cwd exists, with a single stat call
+        try:
+            st = os.stat(self.cwd)
+        except FileNotFoundError:
             raise ValueError(f"Working directory does not exist: {cwd}")
-        if not self.cwd.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Working directory must be a directory: {cwd}")
 
+    def _split_literal_patterns(self, patterns: list[str]) -> None:
+        """Load the (shared, read-only) compiled form of ``patterns``."""
+        compiled = _compile_patterns(tuple(patterns))
+        self._exact_commands = compiled.exact_commands
+        self._first_tokens = compiled.first_tokens
+        self._substrings = compiled.substrings
+        self._residual_patterns = compiled.residual_patterns
+        self._fused_patterns = compiled.fused_patterns
+        self._residual = compiled.residual
+        self._unfused = compiled.unfused
+        self._residual_needles = compiled.residual_needles
+
+    def _match_pattern(self, cmd: str) -> Optional[str]:
+        """Return the first configured pattern matching ``cmd``, or None."""
+        folded = cmd.casefold()
+        if pattern := self._exact_commands.get(folded):
+            return pattern
+
+        first, sep, _ = folded.partition(" ")
+        if sep and (pattern := self._first_tokens.get(first)):
+            return pattern
+
+        for word, pattern in self._substrings.items():
+            if word in folded:
+                return pattern
+
+        if not self._residual_patterns:
+            return None
+        # Skip the regex when no required literal occurs. Only safe for ASCII:
+        # IGNORECASE also matches 'ı' and 'İ' against 'i', which casefold doesn't
+        needles = self._residual_needles
+        if needles is not None and cmd.isascii() and not any(n in folded for n in needles):
+            return None
+        if self._residual is not None and (match := self._residual.search(cmd)):
+            return self._fused_patterns[int(match.lastgroup[1:])]
+        for pattern, regex in self._unfused:
+            if regex.search(cmd):
+                return pattern
+        return None
+
+    def _check_whitelist(self, command: str) -> Optional[str]:
+        """Check command in whitelist mode: it must match at least one pattern.
+
+        Args:
+            command: Shell command to check
+
+        Returns:
+            Agent-facing error message if the command is not allowed, else None
+        """
+        cmd = command.strip()
+        if self._match_pattern(cmd) is None:
+            return (
+                f"Command not in whitelist: `{cmd}`\n\n"
+                f"This command is not on the allowed list. "
+                f"Please use one of the allowed command patterns:\n"
+                f"{self._formatted_patterns}\n\n"
+                f"If you need to run this command, please ask the user for approval."
+            )
+        return None
+
+    def _check_blacklist(self, command: str) -> Optional[str]:
+        """Check command in blacklist mode: it must not match any pattern.
+
+        Args:
+            command: Shell command to check
+
+        Returns:
+            Agent-facing error message if the command is blocked, else None
+        """
+        cmd = command.strip()
+        pattern = self._match_pattern(cmd)
+        if pattern is not None:
+            return (
+                f"Dangerous command blocked: `{cmd}`\n"
+                f"Matched blacklist pattern: {pattern}\n\n"
+                f"This command is blocked for safety. "
+                f"If you need to perform this operation, please ask the user."
+            )
+        return None
+
     def _validate_command(self, command: str) -> None:
         """Validate command against patterns based on mode.
 
@@ -138,33 +469,15 @@ class AgentBashTools:
         Raises:
             SecurityError: If command violates security policy
         """
-        cmd = command.strip()
-
-        if self.mode == "whitelist":
-            # Whitelist mode: command must match at least one pattern
-            matches = any(re.search(pattern, cmd, re.IGNORECASE) for pattern in self.patterns)
-            if not matches:
-                raise SecurityError(
-                    f"Command not in whitelist: `{cmd}`\n\n"
-                    f"This command is not on the allowed list. "
-                    f"Please use one of the allowed command patterns:\n"
-                    f"{self._format_patterns_for_agent()}\n\n"
-                    f"If you need to run this command, please ask the user for approval."
-                )
-
-        elif self.mode == "blacklist":
-            # Blacklist mode: command must not match any pattern
-            for pattern in self.patterns:
-                if re.search(pattern, cmd, re.IGNORECASE):
-                    raise SecurityError(
-                        f"Dangerous command blocked: `{cmd}`\n"
-                        f"Matched blacklist pattern: {pattern}\n\n"
-                        f"This command is blocked for safety. "
-                        f"If you need to perform this operation, please ask the user."
-                    )
+        error = self._check_command(command)
+        if error is not None:
+            raise SecurityError(error)
 
     def _format_patterns_for_agent(self) -> str:
-        """Format patterns in a human-readable way for agent feedback."""
+        """Format patterns in a human-readable way for agent feedback.
+
+        Patterns are fixed after construction, so this runs once in __init__.
+        """
         if not self.patterns:
             return "(no patterns configured)"
 
@@ -172,7 +485,7 @@ class AgentBashTools:
         readable = []
         for pattern in self.patterns[:10]:  # Limit to first 10
             # Clean up common regex patterns for readability
-            clean = pattern.replace("^", "").replace("$", "").replace("\\s+", " ")
+            clean = _WHITESPACE_RUN.sub(" ", pattern.replace("^", "").replace("$", ""))
             readable.append(f"  - {clean}")
 
         if len(self.patterns) > 10:
@@ -180,6 +493,15 @@ class AgentBashTools:
 
         return "\n".join(readable)
 
+    def _is_cacheable(self, command: str) -> bool:
+        """True if ``command`` is a plain invocation of a cacheable prefix."""
+        cmd = command.strip()
+        if _SHELL_METACHARS.search(cmd):
+            return False
+        return any(
+            cmd == prefix or cmd.startswith(prefix + " ") for prefix in self.cacheable_prefixes
+        )
+
     async def execute(self, command: str, timeout: Optional[int] = None) -> BashResult:
         """Execute a bash command with security checks.
 
@@ -193,71 +515,116 @@ class AgentBashTools:
         Raises:
             ModelRetry: If command violates security policy or execution fails
         """
-        # Validate command against patterns
-        try:
-            self._validate_command(command)
-        except SecurityError as e:
-            # Convert to ModelRetry for agent consumption
-            raise ModelRetry(str(e))
+        # Validate command against patterns; violations go straight to the agent
+        error = self._check_command(command)
+        if error is not None:
+            raise ModelRetry(error)
+
+        # Reuse a recent result for read-only commands
+        key = None
+        if self.cache_ttl > 0 and self._is_cacheable(command):
+            key = (command, self._cwd_str)
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
 
         # Execute with security constraints
         try:
-            result = await self.executor.execute(
-                command=command,
-                cwd=self.cwd,
-                timeout=timeout or self.timeout,
-            )
-            return result
-
+            if self._force_no_shell:
+                result = await self.executor.execute_argv(
+                    shlex.split(command),
+                    cwd=self._cwd_str,
+                    timeout=timeout or self.timeout,
+                )
+            else:
+                result = await self.executor.execute(
+                    command=command,
+                    cwd=self._cwd_str,
+                    timeout=timeout or self.timeout,
+                )
         except Exception as e:
             # Convert execution errors to ModelRetry
             raise ModelRetry(f"Command execution failed: {command}\nError: {str(e)}")
 
+        if key is not None and result.success:
+            self._cache[key] = (time.monotonic(), result)
+        return result
+
+    @classmethod
+    def _shared(
+        cls,
+        executor: Optional[BaseBashExecutor],
+        mode: Literal["whitelist", "blacklist"],
+        patterns: list[str],
+        cwd: Path,
+        timeout: int,
+        cache_ttl: float,
+    ) -> "AgentBashTools":
+        """Return a live instance with identical settings, or create one.
+
+        Widgets with the same configuration then share the compiled patterns
+        and the result cache.
+        """
+        executor = executor or LocalBashExecutor.default()
+        key = (cls, executor, mode, tuple(patterns), str(Path(cwd).resolve()), timeout, cache_ttl)
+        tools = _shared_tools.get(key)
+        if tools is None:
+            tools = cls(
+                executor=executor,
+                mode=mode,
+                patterns=patterns,
+                cwd=cwd,
+                timeout=timeout,
+                cache_ttl=cache_ttl,
+            )
+            _shared_tools[key] = tools
+        return tools
+
     @classmethod
     def create_whitelist(
         cls,
-        executor: BaseBashExecutor,
+        executor: Optional[BaseBashExecutor],
         allowed_patterns: list[str],
         cwd: Path,
         timeout: int = 60,
+        cache_ttl: float = 0,
     ) -> "AgentBashTools":
         """Convenience factory for whitelist mode.
 
         Args:
-            executor: BaseBashExecutor implementation
+            executor: BaseBashExecutor implementation (None for the shared local executor)
             allowed_patterns: List of allowed command patterns (regex)
             cwd: Working directory
             timeout: Timeout in seconds
+            cache_ttl: Seconds to reuse results of read-only commands (0 disables)
 
         Returns:
-            AgentBashTools configured in whitelist mode
+            AgentBashTools configured in whitelist mode, shared with any live
+            instance created with the same settings
         """
-        return cls(
-            executor=executor,
-            mode="whitelist",
-            patterns=allowed_patterns,
-            cwd=cwd,
-            timeout=timeout,
-        )
+        return cls._shared(executor, "whitelist", allowed_patterns, cwd, timeout, cache_ttl)
 
     @classmethod
     def create_blacklist(
         cls,
-        executor: BaseBashExecutor,
+        executor: Optional[BaseBashExecutor],
         blocked_patterns: Optional[list[str]] = None,
         cwd: Path = None,
         timeout: int = 60,
+        cache_ttl: float = 0,
     ) -> "AgentBashTools":
         """Convenience factory for blacklist mode.
 
         Args:
-            executor: BaseBashExecutor implementation
+            executor: BaseBashExecutor implementation (None for the shared local executor)
             blocked_patterns: List of blocked patterns (extends defaults if provided)
             cwd: Working directory (defaults to current directory)
             timeout: Timeout in seconds
+            cache_ttl: Seconds to reuse results of read-only commands (0 disables)
 
         Returns:
-            AgentBashTools configured in blacklist mode with default dangerous patterns
+            AgentBashTools configured in blacklist mode with default dangerous patterns,
+            shared with any live instance created with the same settings
         """
         # Start with default blacklist
         patterns = cls.DEFAULT_BLACKLIST.copy()
@@ -266,10 +633,11 @@ class AgentBashTools:
         if blocked_patterns:
             patterns.extend(blocked_patterns)
 
-        return cls(
-            executor=executor,
-            mode="blacklist",
-            patterns=patterns,
-            cwd=cwd or Path.cwd(),
-            timeout=timeout,
-        )
+        return cls._shared(executor, "blacklist", patterns, cwd or Path.cwd(), timeout, cache_ttl)
+
+
+# Compile the default blacklist once at import; every blacklist widget uses it
+_compile_patterns(tuple(AgentBashTools.DEFAULT_BLACKLIST))
+
+# Live factory-built instances keyed by their settings; see AgentBashTools._shared
+_shared_tools: "weakref.WeakValueDictionary[tuple, AgentBashTools]" = weakref.WeakValueDictionary()
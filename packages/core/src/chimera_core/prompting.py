@@ -15,12 +15,34 @@ Multimodal Support (2025-11):
 - Pydantic AI handles multimodal content natively via .iter()
 """
 
-from typing import List, Sequence, Union
+import weakref
+from typing import List, Sequence
 
 from pydantic_ai.messages import BinaryContent, UserContent
 
 from chimera_core.types import Attachment
 
+# id(attachment) -> (data_uri, decoded bytes, media type), dropped with the attachment
+_decoded_attachments: dict[int, tuple[str, bytes, str]] = {}
+
+
+def _binary_from_attachment(attachment: Attachment) -> BinaryContent:
+    """Build BinaryContent for an attachment, decoding its data URI only once.
+
+    Keyed by attachment identity so the multi-megabyte URI is never hashed.
+    Each call returns a new BinaryContent sharing the decoded bytes.
+    """
+    key = id(attachment)
+    cached = _decoded_attachments.get(key)
+    if cached is None or cached[0] is not attachment.data_uri:
+        binary = BinaryContent.from_data_uri(attachment.data_uri)
+        cached = (attachment.data_uri, binary.data, binary.media_type)
+        if key not in _decoded_attachments:
+            weakref.finalize(attachment, _decoded_attachments.pop, key, None)
+        _decoded_attachments[key] = cached
+    _, data, media_type = cached
+    return BinaryContent(data=data, media_type=media_type)
+
 
 def build_enhanced_user_message(
     user_input: str,
@@ -77,30 +99,15 @@ def build_enhanced_user_message(
     if not ambient_instructions:
         text_content = user_input
     else:
-        parts = []
-        # Add ambient instructions
-        parts.append("<ambient_context>")
-        parts.extend(ambient_instructions)
-        parts.append("</ambient_context>")
-
-        # Add user input section
-        parts.append("")  # Blank line for readability
-        parts.append("<user_input>")
-        parts.append(user_input)
-        parts.append("</user_input>")
-
-        text_content = "\n".join(parts)
+        ambient = "\n".join(ambient_instructions)
+        text_content = (
+            f"<ambient_context>\n{ambient}\n</ambient_context>\n\n"
+            f"<user_input>\n{user_input}\n</user_input>"
+        )
 
     # If no attachments, return plain string (backward compatible)
     if not attachments:
         return text_content
 
     # Build multimodal content: text first, then attachments
-    content_parts: List[Union[str, BinaryContent]] = [text_content]
-
-    for attachment in attachments:
-        # Convert data URI to BinaryContent using pydantic-ai's helper
-        binary_content = BinaryContent.from_data_uri(attachment.data_uri)
-        content_parts.append(binary_content)
-
-    return content_parts
+    return [text_content, *(_binary_from_attachment(a) for a in attachments)]
@@ -0,0 +1,16 @@
+"""Shared type-only imports for the protocol modules.
+
+Everything here is imported under TYPE_CHECKING, so importing this module at
+runtime costs nothing and pulls in no heavy dependencies. The names are
+never bound at runtime, so protocol modules must import them under their
+own TYPE_CHECKING guard.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pydantic_ai.messages import ModelMessage  # noqa: F401
+    from pydantic_ai.tools import DeferredToolResults  # noqa: F401
+
+    from chimera_core.types.user_input import UserInput  # noqa: F401
+    from chimera_core.widget import Widget  # noqa: F401
@@ -9,15 +9,15 @@ Key principle: "What's available wherever you are"
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from chimera_core.widget import Widget
+    from ._types import Widget
 
 
-@runtime_checkable
 class ActiveSpace(Protocol):
     """Minimal execution interface between thread.py and Space implementations.
 
@@ -70,7 +70,6 @@ class ActiveSpace(Protocol):
         ...
 
 
-@runtime_checkable
 class ActiveAgent(Protocol):
     """Read-only view of the active agent."""
 
@@ -109,27 +108,30 @@ class ActiveAgent(Protocol):
         ...
 
 
-@runtime_checkable
 class BlueprintView(Protocol):
-    """Read-only view of BlueprintProtocol."""
+    """Read-only view of BlueprintProtocol.
+
+    Turn 0 configuration never changes, so implementations should build these
+    sequences once (e.g. a tuple of ``types.MappingProxyType``) and return the
+    same object on every access. Consumers must not copy or mutate them.
+    """
 
     @property
-    def agents(self) -> list[dict]:
+    def agents(self) -> Sequence[Mapping[str, Any]]:
         """All agent definitions from blueprint."""
         ...
 
     @property
-    def tools(self) -> list[dict]:
+    def tools(self) -> Sequence[Mapping[str, Any]]:
         """Tool configurations from blueprint."""
         ...
 
     @property
-    def mcp_servers(self) -> list[dict]:
+    def mcp_servers(self) -> Sequence[Mapping[str, Any]]:
         """MCP server configurations from blueprint."""
         ...
 
 
-@runtime_checkable
 class ReadableThreadState(Protocol):
     """Read-only view of thread state during execution.
 
@@ -161,9 +163,9 @@ class ReadableThreadState(Protocol):
         """Read-only view of the BlueprintProtocol (Turn 0 configuration).
 
         BlueprintView exposes:
-        - agents: list[dict] (all agent definitions)
-        - tools: list[dict] (tool configurations)
-        - mcp_servers: list[dict] (MCP configurations)
+        - agents: Sequence[Mapping] (all agent definitions)
+        - tools: Sequence[Mapping] (tool configurations)
+        - mcp_servers: Sequence[Mapping] (MCP configurations)
 
         This is the blueprint field from Line 1 of the JSONL.
         """
@@ -207,7 +209,10 @@ class ReadableThreadState(Protocol):
         ...
 
     # ===== Usage Details =====
-    # Note: These are aggregated from Pydantic AI ModelResponse objects
+    # Note: These are aggregated from Pydantic AI ModelResponse objects.
+    # Hooks and widgets read them several times per turn, so implementations
+    # should accumulate them when usage is recorded and may expose them as plain
+    # attributes - read-only properties here accept either.
 
     @property
     def input_tokens(self) -> int:
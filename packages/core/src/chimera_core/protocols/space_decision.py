@@ -6,7 +6,7 @@ decision logic and next prompts.
 """
 
 from dataclasses import dataclass
-from typing import Literal, Protocol, TypeVar, runtime_checkable
+from typing import Final, Literal, Protocol, TypeVar
 
 # TODO: Properly constrain this type variable based on PAI's AgentOutputT implementation
 # For now, using unconstrained TypeVar to support str, int, float, Pydantic models, etc.
@@ -15,11 +15,19 @@ OutputT = TypeVar("OutputT")
 # Type for decision routing (matches pydantic-graph's type matching pattern)
 SpaceDecision = Literal["continue", "complete"]
 
+# Canonical decision values. Source literals are interned, so comparing a
+# decision built from these against them hits CPython's identity fast path.
+# Kept as strings (not an IntEnum) because the graph routes on the literal.
+CONTINUE: Final[SpaceDecision] = "continue"
+COMPLETE: Final[SpaceDecision] = "complete"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TurnDecision:
     """Decision from Space about whether to continue turns.
 
+    Created once per turn and never modified, so it is slotted and frozen.
+
     Attributes:
         decision: "continue" to loop back to turn_start, "complete" to end thread
         next_prompt: Message for the next turn (required if continuing)
@@ -29,7 +37,6 @@ class TurnDecision:
     next_prompt: str = ""
 
 
-@runtime_checkable
 class DecidableSpace(Protocol):
     """Protocol for spaces that control multi-turn execution.
 
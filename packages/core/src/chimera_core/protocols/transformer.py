@@ -7,17 +7,13 @@ DeferredToolResults for resuming agent runs after tool approvals.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from pydantic_ai.messages import ModelMessage
-    from pydantic_ai.tools import DeferredToolResults
+    from ._types import DeferredToolResults, ModelMessage, UserInput
 
-    from chimera_core.types.user_input import UserInput
 
-
-@runtime_checkable
 class ThreadProtocolTransformer(Protocol):
     """Transforms ThreadProtocol events to ModelMessages and DeferredToolResults."""
 
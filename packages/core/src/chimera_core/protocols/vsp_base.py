@@ -12,10 +12,14 @@ Example:
 """
 
 from abc import ABC
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+# Field names repeat across event types, so convert each one only once
+_cached_to_camel = lru_cache(maxsize=512)(to_camel)
+
 
 class VSPBaseModel(BaseModel, ABC):
     """Base model for VSP event types with automatic camelCase aliases.
@@ -53,11 +57,13 @@ class VSPBaseModel(BaseModel, ABC):
 
     model_config = ConfigDict(
         # Automatically generate camelCase aliases from snake_case field names
-        alias_generator=to_camel,
+        alias_generator=_cached_to_camel,
         # Accept both snake_case and camelCase during parsing
         # Useful for accepting data from various sources
         populate_by_name=True,
         # Reject unknown fields to catch errors early
         # VSP has strict schemas, extra fields should fail validation
         extra="forbid",
+        # Build each event schema on first use rather than at import time
+        defer_build=True,
     )
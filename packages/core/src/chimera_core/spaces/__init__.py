@@ -4,19 +4,39 @@ Spaces are execution environments for agents. They determine:
 - Which agent(s) are active
 - How message history is transformed (via transformers)
 - Multi-agent orchestration patterns (if any)
+
+Space modules are imported lazily on first attribute access (PEP 562), so
+loading one space doesn't pull in every other space's dependencies.
 """
 
-from .cron_summarizer_space import (
-    AgentEval,
-    CronSummarizerConfig,
-    CronSummarizerSpace,
-    SummaryOutput,
-    length_check,
-)
-from .factory import SpaceFactory
-from .generic_space import GenericSpace
-from .graph_space import GraphSpace
-from .roster_space import RosterSpace
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cron_summarizer_space import (
+        AgentEval,
+        CronSummarizerConfig,
+        CronSummarizerSpace,
+        SummaryOutput,
+        length_check,
+    )
+    from .factory import SpaceFactory
+    from .generic_space import GenericSpace
+    from .graph_space import GraphSpace
+    from .roster_space import RosterSpace
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "GenericSpace": ".generic_space",
+    "RosterSpace": ".roster_space",
+    "GraphSpace": ".graph_space",
+    "SpaceFactory": ".factory",
+    "CronSummarizerSpace": ".cron_summarizer_space",
+    "CronSummarizerConfig": ".cron_summarizer_space",
+    "SummaryOutput": ".cron_summarizer_space",
+    "AgentEval": ".cron_summarizer_space",
+    "length_check": ".cron_summarizer_space",
+}
 
 __all__ = [
     "GenericSpace",
@@ -29,3 +49,17 @@ __all__ = [
     "AgentEval",
     "length_check",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -30,7 +30,7 @@ from pydantic import BaseModel
 from pydantic_ai.output import ToolOutput
 
 from chimera_core.base_plugin import HookResult
-from chimera_core.protocols.space_decision import TurnDecision
+from chimera_core.protocols.space_decision import COMPLETE, CONTINUE, TurnDecision
 from chimera_core.spaces.generic_space import GenericSpace
 
 if TYPE_CHECKING:
@@ -294,10 +294,10 @@ class CronSummarizerSpace(GenericSpace):
             feedback = self._last_eval_failure
             self._last_eval_failure = None
             return TurnDecision(
-                decision="continue",
+                decision=CONTINUE,
                 next_prompt=f"Your output did not pass evaluation.\n\nFeedback: {feedback}\n\nPlease try again.",
             )
-        return TurnDecision(decision="complete")
+        return TurnDecision(decision=COMPLETE)
 
     # =========================================================================
     # Output Processing
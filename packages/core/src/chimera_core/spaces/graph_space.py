@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any, List, Literal
 
 from pydantic_graph.beta import Graph, GraphBuilder, StepContext
 
-from chimera_core.protocols.space_decision import TurnDecision
+from chimera_core.protocols.space_decision import COMPLETE, CONTINUE, TurnDecision
 from chimera_core.spaces.base import Space
 from chimera_core.threadprotocol.transformer import EmptyTransformer
 
@@ -173,19 +173,19 @@ class GraphSpace(Space):
         """
         # Check if we have a graph configured
         if not self._graph_config:
-            return TurnDecision(decision="complete")
+            return TurnDecision(decision=COMPLETE)
 
         # Check if current index is within bounds
         if self._current_node_index >= len(self._graph_config.nodes):
             # All nodes executed - reset for next user input
             self._current_node_index = 0
-            return TurnDecision(decision="complete")
+            return TurnDecision(decision=COMPLETE)
 
         # More nodes remain - provide the previous output as the next prompt
         # The actual node instructions get combined with this in run_stream()
         # We pass the output directly so run_stream() can apply templates correctly
         return TurnDecision(
-            decision="continue",
+            decision=CONTINUE,
             next_prompt=str(last_output),  # Pass the output value as the message
         )
 
@@ -38,7 +38,7 @@ from uuid import UUID
 from pydantic_graph.beta import GraphBuilder, StepContext, TypeExpression
 
 from chimera_core.base_plugin import ExecutionControl
-from chimera_core.protocols.space_decision import DecidableSpace
+from chimera_core.protocols.space_decision import CONTINUE
 from chimera_core.types import (
     UserInput,
     UserInputDeferredTools,
@@ -541,14 +541,16 @@ async def turn_complete(
                 # TODO: Handle BLOCK/HALT/AWAIT_HUMAN appropriately
 
     # Ask Space if it wants to continue (multi-turn orchestration)
-    # Spaces implementing DecidableSpace protocol can control turn flow
+    # Spaces implementing DecidableSpace protocol can control turn flow.
+    # Probe the one method directly rather than a runtime Protocol isinstance check.
     space = ctx.state.active_space  # type: ignore[attr-defined]
+    should_continue_turn = getattr(space, "should_continue_turn", None)
 
-    if isinstance(space, DecidableSpace):
+    if should_continue_turn is not None:
         # Space decides whether to continue
-        decision = space.should_continue_turn(agent_output.result.output)  # type: ignore[attr-defined]
+        decision = should_continue_turn(agent_output.result.output)  # type: ignore[attr-defined]
 
-        if decision.decision == "continue":
+        if decision.decision == CONTINUE:
             # Return the next prompt - it becomes ctx.inputs for turn_start
             return decision.next_prompt
         else:
@@ -1,13 +1,18 @@
 """Utilities for UI adapter infrastructure."""
 
 from abc import ABC
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict
 
 
+@lru_cache(maxsize=512)
 def to_camel(string: str) -> str:
     """Convert snake_case to camelCase.
 
+    Memoized: the same field names (tool_call_id, provider_metadata, ...)
+    recur across every event model.
+
     Examples:
         >>> to_camel("tool_call_id")
         "toolCallId"
@@ -9,6 +9,8 @@ meta/designdocs/threadprotocol/reference/concise_vsp.md
 
 from typing import Any, Literal, Optional
 
+from pydantic import ConfigDict
+
 from .utils import CamelBaseModel
 
 # ==================== BASE MODEL WITH THREAD SUPPORT ====================
@@ -20,11 +22,35 @@ class VSPBaseModel(CamelBaseModel):
     The thread_id field enables multi-thread streaming by allowing events
     to be annotated with their source thread. This is optional for backward
     compatibility with single-thread mode.
+
+    Schemas are built lazily (defer_build) so importing this module stays
+    cheap; call build_vsp_models() at startup to pay the build cost up front.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     thread_id: Optional[str] = None
 
 
+def build_vsp_models() -> int:
+    """Build the deferred schemas of every VSP event model.
+
+    Called once at server startup so the first streamed event of the first
+    request doesn't pay for schema construction.
+
+    Returns:
+        Number of event models built
+    """
+    built = 0
+    pending = list(VSPBaseModel.__subclasses__())
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        model.model_rebuild()
+        built += 1
+    return built
+
+
 # ==================== MESSAGE BOUNDARY EVENTS ====================
 
 
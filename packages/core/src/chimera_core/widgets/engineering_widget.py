@@ -123,7 +123,7 @@ class EngineeringWidget(Widget):
         self.editor = LocalFileEditor(base_path=str(cwd))
 
         # Initialize bash tools with blacklist mode
-        bash_executor = LocalBashExecutor()
+        bash_executor = LocalBashExecutor.default()
         self.bash_tools = AgentBashTools.create_blacklist(
             executor=bash_executor,
             blocked_patterns=self.bash_blacklist_patterns,  # Extends defaults
@@ -159,7 +159,7 @@ class EngineeringWidget(Widget):
             return self.bash_tools
 
         # Create temporary tools for this CWD
-        bash_executor = LocalBashExecutor()
+        bash_executor = LocalBashExecutor.default()
         return AgentBashTools.create_blacklist(
             executor=bash_executor,
             blocked_patterns=self.bash_blacklist_patterns,
@@ -19,6 +19,7 @@ This widget is designed to be subclassed for domain-specific use cases:
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
@@ -74,7 +75,7 @@ class FileSystemWidget(Widget[FileSystemConfig]):
             super().__init__(
                 base_path=f"/data/agent_memory/{agent_id}",
                 include_patterns=["*.txt", "*.md"],
-                exclude_patterns=["*/temp/*"]
+                exclude_patterns=["temp/"]
             )
 
         async def get_instructions(self, ctx):
@@ -87,7 +88,7 @@ class FileSystemWidget(Widget[FileSystemConfig]):
             base_path="/Users/me/agent_workspace",
             max_file_size=200_000,
             include_patterns=["*.txt", "*.md", "docs/*"],
-            exclude_patterns=["*/archive/*", ".git/*"]
+            exclude_patterns=["archive/", ".git/"]
         )
         agent.register_widget(widget)
     """
@@ -108,8 +109,8 @@ class FileSystemWidget(Widget[FileSystemConfig]):
         Args:
             base_path: Base directory for sandboxing (can be None for subclasses with computed base_path)
             max_file_size: Maximum file size in bytes (default 200KB)
-            include_patterns: Optional whitelist of glob patterns
-            exclude_patterns: Optional blacklist of glob patterns
+            include_patterns: Optional whitelist of gitignore-style patterns
+            exclude_patterns: Optional blacklist of gitignore-style patterns
         """
         super().__init__()
 
@@ -251,7 +252,7 @@ class FileSystemWidget(Widget[FileSystemConfig]):
                 read_file("docs/architecture.md")  # Read file in subdirectory
                 read_file("src/utils/helper.py")  # Read code file
             """
-            return self.file_tools.read_file(path)
+            return await asyncio.to_thread(self.file_tools.read_file, path)
 
         @toolset.tool
         async def list_all_paths(prefix: str = "") -> str:
@@ -273,7 +274,7 @@ class FileSystemWidget(Widget[FileSystemConfig]):
                 list_all_paths("docs")  # List only files/dirs under docs/
                 list_all_paths("src/utils")  # List only under src/utils/
             """
-            paths = self.file_tools.list_all_paths(recursive=True, prefix=prefix)
+            paths = await self.file_tools.list_all_paths_async(recursive=True, prefix=prefix)
 
             if not paths:
                 if prefix:
@@ -333,7 +334,7 @@ class FileSystemWidget(Widget[FileSystemConfig]):
                 write_file("notes.txt", "My notes here")
                 write_file("docs/readme.md", "# README\\n\\nProject documentation")
             """
-            return self.file_tools.write_file(path, content)
+            return await asyncio.to_thread(self.file_tools.write_file, path, content)
 
         @toolset.tool
         async def edit_file(path: str, old_string: str, new_string: str) -> str:
@@ -358,7 +359,9 @@ class FileSystemWidget(Widget[FileSystemConfig]):
                 edit_file("config.py", "DEBUG = False", "DEBUG = True")
                 edit_file("notes.txt", "TODO: review", "DONE: reviewed on 2025-11-05")
             """
-            return self.file_tools.edit_file(path, old_string, new_string, replace_all=False)
+            return await asyncio.to_thread(
+                self.file_tools.edit_file, path, old_string, new_string, replace_all=False
+            )
 
         return toolset
 
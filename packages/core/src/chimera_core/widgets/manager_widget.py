@@ -150,7 +150,7 @@ class ManagerWidget(StatefulWidget[ComponentConfig, ManagerMutation]):
         )
 
         # Bash execution via primitives layer (whitelist mode)
-        bash_executor = LocalBashExecutor()
+        bash_executor = LocalBashExecutor.default()
         self.bash_tools = AgentBashTools.create_whitelist(
             executor=bash_executor,
             allowed_patterns=self.SAFE_BASH_PATTERNS,
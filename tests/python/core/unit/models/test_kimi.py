@@ -0,0 +1,156 @@
+"""Tests for KimiChatModel tool ID normalization."""
+
+import asyncio
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from chimera_core.models.kimi import KimiChatModel
+
+normalize = KimiChatModel.normalize_tool_id_for_kimi
+PARAMS = ModelRequestParameters()
+
+
+class TestNormalizeToolId:
+    """Tests for normalize_tool_id_for_kimi."""
+
+    def test_formats(self):
+        """IDs are rewritten to functions.{tool_name}:{index}."""
+        assert normalize("functions.search:3", "search") == "functions.search:3"
+        assert normalize("search:2", "search") == "functions.search:2"
+        assert normalize("other:5", "search") == "functions.search:5"
+        assert normalize("call_abc123", "search") == "functions.search:0"
+
+    def test_cached(self):
+        """Repeated pairs are served from the cache."""
+        normalize("cache_probe:1", "cache_probe")
+        hits = normalize.cache_info().hits
+
+        normalize("cache_probe:1", "cache_probe")
+
+        assert normalize.cache_info().hits == hits + 1
+
+
+class TestMapMessages:
+    """Tests for incremental history mapping in _map_messages."""
+
+    async def test_maps_only_new_messages(self, monkeypatch):
+        """Messages already mapped on a previous call are not mapped again."""
+        mapped: list[ModelMessage] = []
+
+        async def fake_map_messages(self, messages, model_request_parameters):
+            mapped.extend(messages)
+            return [{"role": "tool", "tool_call_id": "search:1", "name": "search"}]
+
+        monkeypatch.setattr(OpenAIChatModel, "_map_messages", fake_map_messages)
+        model = KimiChatModel.__new__(KimiChatModel)
+        history: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelResponse(parts=[TextPart(content="hello")]),
+        ]
+
+        first = await model._map_messages(history, PARAMS)
+        history.append(ModelRequest(parts=[UserPromptPart(content="again")]))
+        second = await model._map_messages(history, PARAMS)
+
+        assert mapped == history
+        assert len(first) == 2
+        assert len(second) == 3
+        assert second[0]["tool_call_id"] == "functions.search:1"
+
+    async def test_remaps_changed_history(self, monkeypatch):
+        """A history that diverges from the cached one is mapped from the divergence."""
+        mapped: list[ModelMessage] = []
+
+        async def fake_map_messages(self, messages, model_request_parameters):
+            mapped.extend(messages)
+            return [{"role": "user", "content": "x"}]
+
+        monkeypatch.setattr(OpenAIChatModel, "_map_messages", fake_map_messages)
+        model = KimiChatModel.__new__(KimiChatModel)
+        first = ModelRequest(parts=[UserPromptPart(content="a")])
+        await model._map_messages([first, ModelResponse(parts=[TextPart(content="b")])], PARAMS)
+        replacement = ModelResponse(parts=[TextPart(content="c")])
+
+        await model._map_messages([first, replacement], PARAMS)
+
+        assert mapped[-1] is replacement
+        assert len(mapped) == 3
+
+    async def test_instructions_added_once(self, monkeypatch):
+        """Instructions are emitted once at the start of the mapped history."""
+
+        async def fake_map_messages(self, messages, model_request_parameters):
+            result = [{"role": "user", "content": "x"}]
+            if instructions := self._get_instructions(messages, model_request_parameters):
+                result.insert(0, {"role": "system", "content": instructions})
+            return result
+
+        monkeypatch.setattr(OpenAIChatModel, "_map_messages", fake_map_messages)
+        model = KimiChatModel.__new__(KimiChatModel)
+        history: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="a")], instructions="Be brief."),
+        ]
+
+        result = await model._map_messages(history, PARAMS)
+
+        assert result == [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "x"},
+        ]
+
+    async def test_normalizes_tool_call_and_result_ids(self):
+        """Through the real OpenAI mapping, a call and its result get the same Kimi ID."""
+        model = KimiChatModel("kimi-k2", provider=OpenAIProvider(api_key="test"))
+        history: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="find it")]),
+            ModelResponse(
+                parts=[ToolCallPart(tool_name="search", args={}, tool_call_id="search:1")]
+            ),
+            ModelRequest(
+                parts=[ToolReturnPart(tool_name="search", content="r", tool_call_id="search:1")]
+            ),
+        ]
+
+        result = await model._map_messages(history, PARAMS)
+
+        assert result[1]["tool_calls"][0]["id"] == "functions.search:1"
+        assert result[2]["tool_call_id"] == "functions.search:1"
+
+    async def test_concurrent_runs_keep_their_own_cache(self, monkeypatch):
+        """Runs interleaving on one model instance each reuse their own mapped history."""
+        mapped: list[ModelMessage] = []
+
+        async def fake_map_messages(self, messages, model_request_parameters):
+            mapped.extend(messages)
+            return [{"role": "user", "content": "x"}]
+
+        monkeypatch.setattr(OpenAIChatModel, "_map_messages", fake_map_messages)
+        model = KimiChatModel.__new__(KimiChatModel)
+        both_mapped = asyncio.Event()
+        done = 0
+
+        async def run(text: str) -> None:
+            nonlocal done
+            history: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content=text)])]
+            await model._map_messages(history, PARAMS)
+            done += 1
+            if done == 2:
+                both_mapped.set()
+            await both_mapped.wait()
+            history.append(ModelResponse(parts=[TextPart(content="reply")]))
+            await model._map_messages(history, PARAMS)
+
+        await asyncio.gather(run("a"), run("b"))
+
+        assert len(mapped) == 4
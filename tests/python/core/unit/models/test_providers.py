@@ -0,0 +1,211 @@
+"""Tests for provider adapters."""
+
+import httpx
+import pytest
+
+from chimera_core.models.providers import (
+    GeminiAdapter,
+    KimiAdapter,
+    OpenRouterAdapter,
+    close_shared_http_client,
+    gemini,
+    get_shared_http_client,
+    openrouter,
+)
+from chimera_core.models.providers.kimi import KIMI_MODELS
+from chimera_core.models.registry import Provider
+
+
+def json_client(payload: dict, requests: list[httpx.Request]) -> httpx.AsyncClient:
+    """Client whose transport records requests and answers with payload."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=payload)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestSharedHttpClient:
+    """Tests for get_shared_http_client."""
+
+    async def test_reused_within_loop(self):
+        """The same pooled client is returned on the same event loop."""
+        client = get_shared_http_client()
+        assert get_shared_http_client() is client
+
+    async def test_replaced_when_closed(self):
+        """A closed client is replaced with a fresh one."""
+        client = get_shared_http_client()
+        await client.aclose()
+        assert get_shared_http_client() is not client
+
+    async def test_close(self):
+        """Closing releases the client for the running loop."""
+        client = get_shared_http_client()
+        await close_shared_http_client()
+        assert client.is_closed
+        assert get_shared_http_client() is not client
+
+
+class TestGeminiAdapter:
+    """Tests for GeminiAdapter."""
+
+    async def test_uses_injected_client(self):
+        """Requests go through the injected client for every fetch."""
+        requests: list[httpx.Request] = []
+        payload = {
+            "models": [
+                {
+                    "name": "models/gemini-2.0-flash",
+                    "displayName": "Gemini 2.0 Flash",
+                    "inputTokenLimit": 1_000_000,
+                    "supportedGenerationMethods": ["generateContent"],
+                },
+                {"name": "models/text-embedding-004"},
+            ]
+        }
+        async with json_client(payload, requests) as client:
+            adapter = GeminiAdapter(api_key="test-key", http_client=client)
+
+            await adapter.fetch_models()
+            models = await adapter.fetch_models()
+
+        assert len(requests) == 2
+        assert requests[0].url.params["key"] == "test-key"
+        assert [m.id for m in models] == ["gemini:gemini-2.0-flash"]
+        assert models[0].provider == Provider.GEMINI
+        assert models[0].capabilities.image_output is True
+
+    async def test_no_api_key(self, monkeypatch):
+        """Without an API key no request is made."""
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+        requests: list[httpx.Request] = []
+        async with json_client({}, requests) as client:
+            adapter = GeminiAdapter(http_client=client)
+            assert await adapter.fetch_models() == []
+        assert requests == []
+
+    def test_capabilities_from_name(self):
+        """Capabilities are inferred from version and family markers in the name."""
+        adapter = GeminiAdapter(api_key="test-key")
+
+        flash = adapter._parse_capabilities("gemini-2.0-flash-exp", {})
+        pro = adapter._parse_capabilities("gemini-1.5-pro", {})
+        vision = adapter._parse_capabilities("gemini-pro-vision", {})
+        imagen = adapter._parse_capabilities("imagen-3.0", {})
+
+        assert (flash.image_input, flash.audio_input, flash.image_output) == (True, True, True)
+        assert (pro.image_input, pro.video_input, pro.image_output) == (True, True, False)
+        assert (vision.image_input, vision.audio_input) == (True, False)
+        assert (imagen.image_input, imagen.image_output) == (False, True)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_fetch_without_ijson(self, monkeypatch, use_orjson):
+        """Without ijson the response body is decoded in one go."""
+        monkeypatch.setattr(gemini, "ijson", None)
+        if not use_orjson:
+            monkeypatch.setattr(gemini, "orjson", None)
+        requests: list[httpx.Request] = []
+        payload = {"models": [{"name": "models/gemini-1.5-pro"}, {"name": ""}]}
+        async with json_client(payload, requests) as client:
+            models = await GeminiAdapter(api_key="test-key", http_client=client).fetch_models()
+
+        assert [m.id for m in models] == ["gemini:gemini-1.5-pro"]
+
+
+class TestOpenRouterAdapter:
+    """Tests for OpenRouterAdapter."""
+
+    async def test_uses_injected_client(self):
+        """Requests go through the injected client with the API key header."""
+        requests: list[httpx.Request] = []
+        payload = {"data": [{"id": "anthropic/claude-3.5-sonnet", "name": "Claude 3.5 Sonnet"}]}
+        async with json_client(payload, requests) as client:
+            adapter = OpenRouterAdapter(api_key="test-key", http_client=client)
+            models = await adapter.fetch_models()
+
+        assert requests[0].headers["Authorization"] == "Bearer test-key"
+        assert [m.provider_model_id for m in models] == ["anthropic/claude-3.5-sonnet"]
+
+    def test_infer_function_calling(self):
+        """Known model families are detected anywhere in the ID, ignoring case."""
+        adapter = OpenRouterAdapter(api_key="test-key")
+
+        assert adapter._infer_function_calling("anthropic/Claude-3.5-sonnet") is True
+        assert adapter._infer_function_calling("meta-llama/llama-3.1-70b") is True
+        assert adapter._infer_function_calling("openai/gpt-3.5-turbo") is True
+        assert adapter._infer_function_calling("openai/gpt-305") is False
+        assert adapter._infer_function_calling("meta-llama/llama-2-13b") is False
+
+    def test_parse_capabilities_from_modality(self):
+        """Input and output modalities map to capability flags."""
+        adapter = OpenRouterAdapter(api_key="test-key")
+
+        vision = adapter._parse_capabilities({"architecture": {"modality": "text+image->text"}})
+        imagegen = adapter._parse_capabilities({"architecture": {"modality": "text->text+image"}})
+        text = adapter._parse_capabilities({})
+
+        assert (vision.image_input, vision.image_output) == (True, False)
+        assert (imagegen.image_input, imagegen.image_output) == (False, True)
+        assert (text.image_input, text.audio_input, text.audio_output) == (False, False, False)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_decodes_with_or_without_orjson(self, monkeypatch, use_orjson):
+        """The response decodes the same with orjson or the json module."""
+        if not use_orjson:
+            monkeypatch.setattr(openrouter, "orjson", None)
+        requests: list[httpx.Request] = []
+        payload = {"data": [{"id": "mistralai/mistral-large", "name": "Mistral Large é"}]}
+        async with json_client(payload, requests) as client:
+            models = await OpenRouterAdapter(http_client=client).fetch_models()
+
+        assert [m.display_name for m in models] == ["Mistral Large é"]
+
+    async def test_conditional_get(self):
+        """A 304 for the stored ETag returns the previous models."""
+        requests: list[httpx.Request] = []
+        payload = {"data": [{"id": "openai/gpt-4o"}]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=payload, headers={"ETag": '"v1"'})
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            adapter = OpenRouterAdapter(http_client=client)
+            first = await adapter.fetch_models()
+            second = await adapter.fetch_models()
+
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert second == first
+        assert second is not first
+
+    async def test_models_share_fetch_timestamp(self):
+        """Every model from one fetch carries the same last_updated."""
+        requests: list[httpx.Request] = []
+        payload = {"data": [{"id": "openai/gpt-4o"}, {"id": "anthropic/claude-3.5-sonnet"}]}
+        async with json_client(payload, requests) as client:
+            models = await OpenRouterAdapter(http_client=client).fetch_models()
+
+        assert len(models) == 2
+        assert models[0].last_updated is models[1].last_updated
+
+
+class TestKimiAdapter:
+    """Tests for KimiAdapter."""
+
+    async def test_static_models_parsed_once(self):
+        """Each fetch returns a new list of the same parsed models."""
+        adapter = KimiAdapter()
+
+        first = await adapter.fetch_models()
+        second = await adapter.fetch_models()
+
+        assert first is not second
+        assert [m.id for m in first] == [f"kimi:{m['id']}" for m in KIMI_MODELS]
+        assert all(a is b for a, b in zip(first, second))
@@ -1,15 +1,19 @@
 """Tests for Model Registry data models and service."""
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
 
+from chimera_core.cache import CacheClient
+from chimera_core.models import factory, registry_service
 from chimera_core.models.registry import (
     ModelCapabilities,
     ModelMetadata,
     ModelPricing,
     Provider,
 )
+from chimera_core.models.registry_service import ModelRegistryService
 
 
 class TestModelCapabilities:
@@ -121,6 +125,7 @@ class TestModelMetadata:
         assert model.supports("function_calling") is True
         assert model.supports("audio_input") is False
         assert model.supports("nonexistent") is False
+        assert model.supports("model_dump") is False
 
     def test_model_with_pricing(self):
         """Model with full pricing information."""
@@ -171,3 +176,342 @@ class TestProvider:
         """Invalid provider string should raise."""
         with pytest.raises(ValueError):
             Provider("invalid")
+
+
+def make_model(id: str, provider_model_id: str, **kwargs) -> ModelMetadata:
+    return ModelMetadata(
+        id=id,
+        provider=kwargs.pop("provider", Provider.OPENROUTER),
+        provider_model_id=provider_model_id,
+        display_name=provider_model_id,
+        max_context_window=8192,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def service() -> ModelRegistryService:
+    cache = CacheClient()
+    cache._redis_url = None
+    return ModelRegistryService(cache_client=cache)
+
+
+class TestModelRegistryService:
+    """Tests for ModelRegistryService local lookups."""
+
+    async def test_get_model_by_either_id(self, service):
+        """Cached models resolve by full ID and by provider_model_id."""
+        model = make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")
+        service._update_local_cache([model])
+
+        assert await service.get_model("openrouter:openai/gpt-4o") is model
+        assert await service.get_model("openai/gpt-4o") is model
+
+    def test_first_provider_model_id_wins(self, service):
+        """A provider_model_id shared by providers resolves to the first model."""
+        first = make_model(
+            "openrouter:kimi-k2",
+            "kimi-k2",
+            capabilities=ModelCapabilities(image_input=True),
+        )
+        second = make_model("kimi:kimi-k2", "kimi-k2", provider=Provider.KIMI)
+        service._update_local_cache([first, second])
+
+        assert service.supports_capability("kimi-k2", "image_input") is True
+        assert service.supports_capability("kimi:kimi-k2", "image_input") is False
+
+    def test_factory_validation_uses_index(self, service, monkeypatch, caplog):
+        """create_model's registry check finds models by either ID without scanning."""
+        service._update_local_cache([make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")])
+        monkeypatch.setattr(registry_service, "_registry_service", service)
+
+        with caplog.at_level("WARNING", logger=factory.logger.name):
+            factory._validate_model_name("openrouter:openai/gpt-4o")
+            factory._validate_model_name("openai/gpt-4o")
+            assert not caplog.records
+
+            factory._validate_model_name("openai/unknown")
+        assert "not found in registry" in caplog.text
+
+    def test_refresh_drops_stale_entries(self, service):
+        """Updating the cache replaces both indexes."""
+        service._update_local_cache([make_model("openrouter:old/model", "old/model")])
+        service._update_local_cache([make_model("openrouter:new/model", "new/model")])
+
+        assert service._lookup_local("old/model") is None
+        assert service._lookup_local("new/model") is not None
+
+    def test_refresh_swaps_indexes(self, service):
+        """A refresh replaces the index dicts rather than mutating them."""
+        service._update_local_cache([make_model("openrouter:old/model", "old/model")])
+        previous = service._local_cache
+
+        service._update_local_cache([make_model("openrouter:new/model", "new/model")])
+
+        assert list(previous) == ["openrouter:old/model"]
+        assert list(service._local_cache) == ["openrouter:new/model"]
+
+    async def test_queries_served_from_fresh_indexes(self, service, monkeypatch):
+        """Provider and capability queries reload only when the indexes are stale."""
+        vision = make_model(
+            "openrouter:openai/gpt-4o",
+            "openai/gpt-4o",
+            capabilities=ModelCapabilities(image_input=True),
+        )
+        kimi = make_model("kimi:kimi-k2", "kimi-k2", provider=Provider.KIMI)
+        loads = 0
+
+        async def get_all_models(force_refresh: bool = False) -> list[ModelMetadata]:
+            nonlocal loads
+            loads += 1
+            service._update_local_cache([vision, kimi])
+            return [vision, kimi]
+
+        monkeypatch.setattr(service, "get_all_models", get_all_models)
+
+        assert await service.get_models_by_provider(Provider.KIMI) == [kimi]
+        assert await service.get_models_by_capability("image_input") == [vision]
+        assert loads == 1
+
+        service._indexed_at -= service._cache_ttl
+        assert await service.get_models_by_provider(Provider.OPENROUTER) == [vision]
+        assert loads == 2
+
+        service.invalidate_local_cache()
+        assert service._lookup_local("kimi-k2") is None
+        assert await service.get_models_by_capability("function_calling") == []
+        assert loads == 3
+
+    @pytest.mark.parametrize("cache_format", ["msgpack", "json"])
+    async def test_cache_hit_rebuilds_models(self, service, monkeypatch, cache_format):
+        """Models read back from the cache equal the models that were stored."""
+        monkeypatch.setattr(registry_service, "CACHE_FORMAT", cache_format)
+        models = [
+            make_model(
+                "openrouter:openai/gpt-4o",
+                "openai/gpt-4o",
+                capabilities=ModelCapabilities(image_input=True),
+                pricing=ModelPricing(input_cost_per_million=2.5, output_cost_per_million=10.0),
+            ),
+            make_model("kimi:kimi-k2", "kimi-k2", provider=Provider.KIMI),
+        ]
+        await service._write_cached_models(models)
+
+        cached = await service.get_all_models()
+
+        assert cached == models
+        assert cached[1].provider is Provider.KIMI
+        assert cached[0].supports("image_input") is True
+
+    async def test_undecodable_cache_refetches(self, service, monkeypatch):
+        """A corrupt msgpack payload is treated as a cache miss."""
+        monkeypatch.setattr(registry_service, "CACHE_FORMAT", "msgpack")
+        if registry_service.msgpack is None:
+            pytest.skip("msgpack not installed")
+        await service._cache.set(registry_service.CACHE_KEY_ALL_MODELS_MSGPACK, b"\xc1")
+
+        assert await service._read_cached_models() is None
+
+    def test_litellm_enrichment_fills_gaps(self, service):
+        """LiteLLM data fills missing pricing, capabilities and larger context."""
+        model = make_model("gemini:gemini-2.0-flash", "gemini-2.0-flash")
+
+        enriched = service._apply_litellm_enrichment(
+            model,
+            {
+                "input_cost_per_token": 1e-7,
+                "output_cost_per_token": 4e-7,
+                "supports_vision": True,
+                "max_input_tokens": 1_048_576,
+            },
+        )
+
+        assert enriched.pricing is not None
+        assert enriched.pricing.input_cost_per_million == pytest.approx(0.1)
+        assert enriched.capabilities.image_input is True
+        assert enriched.capabilities.function_calling is False
+        assert enriched.max_context_window == 1_048_576
+        assert model.pricing is None
+
+    def test_litellm_enrichment_without_changes(self, service):
+        """A model LiteLLM adds nothing to is returned as is."""
+        model = make_model("gemini:gemini-2.0-flash", "gemini-2.0-flash")
+
+        assert service._apply_litellm_enrichment(model, {"max_tokens": 10}) is model
+
+    async def test_fetch_all_providers_survives_failure(self, service, monkeypatch):
+        """A failing provider contributes no models; the others still do."""
+
+        class FailingAdapter:
+            provider = Provider.GEMINI
+
+            def get_provider_name(self) -> str:
+                return "Failing"
+
+            async def fetch_models(self) -> list[ModelMetadata]:
+                raise RuntimeError("boom")
+
+        class StaticAdapter(FailingAdapter):
+            async def fetch_models(self) -> list[ModelMetadata]:
+                return [make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")]
+
+        service._adapters = {
+            Provider.GEMINI: FailingAdapter(),
+            Provider.OPENROUTER: StaticAdapter(),
+        }
+        monkeypatch.setattr(registry_service, "_litellm_model_cost", lambda: None)
+
+        models = await service._fetch_all_providers()
+
+        assert [m.id for m in models] == ["openrouter:openai/gpt-4o"]
+
+    async def test_unchanged_payload_only_refreshes_ttl(self, service, monkeypatch):
+        """Writing the same model list again extends the TTL without a SET."""
+        calls: list[str] = []
+        cache = service._cache
+        original_set = cache.set
+
+        async def counting_set(key, value, ttl=None):
+            calls.append(key)
+            return await original_set(key, value, ttl)
+
+        monkeypatch.setattr(cache, "set", counting_set)
+        models = [make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")]
+
+        await service._write_cached_models(models)
+        await service._write_cached_models(models)
+        assert len(calls) == 1
+
+        await service._write_cached_models([*models, make_model("kimi:k2", "k2")])
+        assert len(calls) == 2
+
+    async def test_restamped_refresh_only_refreshes_ttl(self, service, monkeypatch):
+        """A refresh that only changes last_updated extends the TTL without a SET."""
+        calls: list[str] = []
+        cache = service._cache
+        original_set = cache.set
+
+        async def counting_set(key, value, ttl=None):
+            calls.append(key)
+            return await original_set(key, value, ttl)
+
+        class RestampingAdapter:
+            provider = Provider.GEMINI
+
+            def get_provider_name(self) -> str:
+                return "Restamping"
+
+            async def fetch_models(self) -> list[ModelMetadata]:
+                # Like the Gemini/OpenRouter adapters, stamp the fetch time
+                return [
+                    make_model(
+                        "gemini:gemini-pro", "gemini-pro", last_updated=datetime.now(timezone.utc)
+                    )
+                ]
+
+        monkeypatch.setattr(cache, "set", counting_set)
+        monkeypatch.setattr(registry_service, "_litellm_model_cost", lambda: None)
+        service._adapters = {Provider.GEMINI: RestampingAdapter()}
+
+        await service.refresh_cache()
+        await service.refresh_cache()
+
+        assert len(calls) == 1
+
+    async def test_unchanged_payload_rewritten_after_eviction(self, service):
+        """If the cached key vanished, an unchanged payload is written again."""
+        models = [make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")]
+        await service._write_cached_models(models)
+        await service._cache.delete(registry_service.CACHE_KEY_ALL_MODELS_MSGPACK)
+        await service._cache.delete(registry_service.CACHE_KEY_ALL_MODELS)
+
+        await service._write_cached_models(models)
+
+        assert await service._read_cached_models() is not None
+
+    async def test_concurrent_refreshes_share_one_fetch(self, service, monkeypatch):
+        """Concurrent forced refreshes fetch from providers once."""
+        fetches = 0
+
+        async def slow_fetch():
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.01)
+            return [make_model("openrouter:openai/gpt-4o", "openai/gpt-4o")]
+
+        monkeypatch.setattr(service, "_fetch_all_providers", slow_fetch)
+
+        results = await asyncio.gather(
+            *(service.get_all_models(force_refresh=True) for _ in range(5))
+        )
+
+        assert fetches == 1
+        assert all(r == results[0] for r in results)
+        assert service._refresh_future is None
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self, service, monkeypatch):
+        """Waiters run their own refresh when the leading call is cancelled."""
+        fetches = 0
+
+        async def slow_fetch():
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.01)
+            return []
+
+        monkeypatch.setattr(service, "_fetch_all_providers", slow_fetch)
+        leader = asyncio.create_task(service.get_all_models(force_refresh=True))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(service.get_all_models(force_refresh=True))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await waiter == []
+        assert fetches == 2
+
+    async def test_models_by_provider_and_capability(self, service, monkeypatch):
+        """Provider and capability queries return matching models in fetch order."""
+        vision = make_model(
+            "openrouter:openai/gpt-4o",
+            "openai/gpt-4o",
+            capabilities=ModelCapabilities(image_input=True, function_calling=True),
+        )
+        text = make_model("openrouter:meta/llama", "meta/llama")
+        kimi = make_model(
+            "kimi:k2",
+            "k2",
+            provider=Provider.KIMI,
+            capabilities=ModelCapabilities(function_calling=True),
+        )
+        await service._write_cached_models([vision, text, kimi])
+
+        assert await service.get_models_by_provider(Provider.OPENROUTER) == [vision, text]
+        assert await service.get_models_by_provider(Provider.GEMINI) == []
+        assert await service.get_models_by_capability("function_calling") == [vision, kimi]
+        assert await service.get_models_by_capability("image_input") == [vision]
+        assert await service.get_models_by_capability("nonexistent") == []
+
+    def test_litellm_enrichment_copies_once(self, service, monkeypatch):
+        """Pricing, capability and context updates are applied in a single copy."""
+        copies = 0
+        original_copy = ModelMetadata.model_copy
+
+        def counting_copy(self, *args, **kwargs):
+            nonlocal copies
+            copies += 1
+            return original_copy(self, *args, **kwargs)
+
+        monkeypatch.setattr(ModelMetadata, "model_copy", counting_copy)
+        model = make_model("gemini:gemini-2.0-flash", "gemini-2.0-flash")
+
+        service._apply_litellm_enrichment(
+            model,
+            {
+                "input_cost_per_token": 1e-7,
+                "supports_function_calling": True,
+                "max_tokens": 1_048_576,
+            },
+        )
+
+        assert copies == 1
@@ -186,3 +186,24 @@ class TestSpaceFactoryWithRealSpaces:
         space = SpaceFactory.from_blueprint_config(space_config)
 
         assert isinstance(space, CronSummarizerSpace)
+
+
+class TestLazySpaceImports:
+    """Tests for the lazily imported spaces package."""
+
+    def test_public_names_resolve(self):
+        """Every exported name resolves to the object in its submodule."""
+        import chimera_core.spaces as spaces
+        from chimera_core.spaces.graph_space import GraphSpace
+
+        assert spaces.GraphSpace is GraphSpace
+        for name in spaces.__all__:
+            assert getattr(spaces, name) is not None
+        assert set(spaces.__all__) <= set(dir(spaces))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown attributes still raise AttributeError."""
+        import chimera_core.spaces as spaces
+
+        with pytest.raises(AttributeError, match="NoSuchSpace"):
+            spaces.NoSuchSpace
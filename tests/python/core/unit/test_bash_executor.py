@@ -0,0 +1,83 @@
+"""Tests for LocalBashExecutor."""
+
+import subprocess
+
+import pytest
+
+from chimera_core.primitives.bash.executor import BashResult, LocalBashExecutor
+
+
+class TestLocalBashExecutor:
+    """Tests for local command execution."""
+
+    async def test_captures_output_and_exit_code(self, tmp_path):
+        """stdout, stderr and the exit code are captured separately."""
+        result = await LocalBashExecutor().execute("echo out; echo err >&2; exit 3", cwd=tmp_path)
+
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert result.exit_code == 3
+        assert not result.success
+        assert result.cwd == str(tmp_path)
+
+    async def test_runs_in_cwd(self, tmp_path):
+        """Commands run in the requested working directory."""
+        (tmp_path / "marker.txt").write_text("hello")
+
+        result = await LocalBashExecutor().execute("cat marker.txt", cwd=tmp_path)
+
+        assert result.success
+        assert result.stdout == "hello"
+
+    async def test_accepts_string_cwd(self, tmp_path):
+        """A pre-stringified working directory is used as-is."""
+        result = await LocalBashExecutor().execute("pwd", cwd=str(tmp_path))
+
+        assert result.stdout.strip() == str(tmp_path)
+        assert result.cwd == str(tmp_path)
+
+    async def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Undecodable output doesn't fail the command."""
+        result = await LocalBashExecutor().execute(r"printf 'a\377b'", cwd=tmp_path)
+
+        assert result.stdout == "a�b"
+
+    async def test_timeout_raises(self, tmp_path):
+        """Commands exceeding the timeout are killed and raise TimeoutExpired."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            await LocalBashExecutor().execute("sleep 5", cwd=tmp_path, timeout=0.2)
+
+    async def test_default_cwd(self, tmp_path, monkeypatch):
+        """Without a cwd the command runs, and is reported, in the process cwd."""
+        monkeypatch.chdir(tmp_path)
+
+        result = await LocalBashExecutor().execute("pwd")
+
+        assert result.stdout.strip() == str(tmp_path)
+        assert result.cwd == str(tmp_path)
+
+
+class TestBashResult:
+    """Tests for BashResult output handling."""
+
+    def test_from_bytes_decodes_lazily(self):
+        """Raw output is only decoded when stdout or stderr is read."""
+        result = BashResult.from_bytes(b"out\xff", b"", 0, "cmd", "/tmp")
+
+        assert result.success
+        assert "stdout" not in vars(result)
+        assert result.stdout == "out�"
+        assert result.stderr == ""
+
+    def test_from_bytes_matches_eager_result(self):
+        """Lazy and eager results expose and format output the same way."""
+        lazy = BashResult.from_bytes(b"out\n", b"err\n", 2, "cmd", "/tmp")
+        eager = BashResult(stdout="out\n", stderr="err\n", exit_code=2, command="cmd", cwd="/tmp")
+
+        assert lazy.combined_output == eager.combined_output
+        assert lazy.combined_output == "[Exit code: 2]\nout\n\n[STDERR]\nerr"
+        assert (lazy.stdout, lazy.stderr) == (eager.stdout, eager.stderr)
+
+    def test_empty_output(self):
+        """Empty output is reported explicitly."""
+        assert BashResult.from_bytes(b"", b"", 0, "true", "/tmp").combined_output == "(no output)"
@@ -0,0 +1,391 @@
+"""Tests for the cache client and in-memory backend."""
+
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from chimera_core.cache import CacheClient, redis_client
+from chimera_core.cache.redis_client import InMemoryCache, RedisCache
+
+
+class CountingCache(InMemoryCache):
+    """In-memory backend that counts and delays get() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        await asyncio.sleep(0.01)
+        return await super().get(key)
+
+
+def make_client(backend: InMemoryCache) -> CacheClient:
+    client = CacheClient()
+    client._redis_url = None
+    client._fallback = backend
+    return client
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent reads in CacheClient."""
+
+    async def test_concurrent_gets_share_backend_call(self):
+        """Concurrent get() for the same key hits the backend once."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("k", "v")
+
+        results = await asyncio.gather(*(client.get("k") for _ in range(10)))
+
+        assert results == ["v"] * 10
+        assert backend.get_calls == 1
+
+    async def test_concurrent_get_json_shares_decode(self):
+        """Concurrent get_json() callers receive the same decoded object."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("k", '{"a": 1}')
+
+        results = await asyncio.gather(*(client.get_json("k") for _ in range(5)))
+
+        assert all(r == {"a": 1} for r in results)
+        assert all(r is results[0] for r in results)
+        assert backend.get_calls == 1
+
+    async def test_distinct_keys_not_coalesced(self):
+        """Different keys are fetched independently."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("a", "1")
+        await client.set("b", "2")
+
+        results = await asyncio.gather(client.get("a"), client.get("b"))
+
+        assert results == ["1", "2"]
+        assert backend.get_calls == 2
+
+    async def test_inflight_cleared_after_completion(self):
+        """Sequential gets each reach the backend."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("k", "v")
+
+        await client.get("k")
+        await client.get("k")
+
+        assert backend.get_calls == 2
+        assert client._inflight == {}
+
+
+class TestInMemoryKeys:
+    """Tests for InMemoryCache.keys pattern matching."""
+
+    async def test_glob_patterns(self):
+        """Glob wildcards match like fnmatch."""
+        cache = InMemoryCache()
+        for key in ("models:all", "models:meta:a", "models:meta:b", "other"):
+            await cache.set(key, b"x")
+
+        assert sorted(await cache.keys("models:meta:*")) == ["models:meta:a", "models:meta:b"]
+        assert await cache.keys("models:meta:?") == ["models:meta:a", "models:meta:b"]
+        assert await cache.keys("nothing*") == []
+
+    async def test_expired_keys_excluded(self, monkeypatch):
+        """Expired entries are not returned even before they are purged."""
+        cache = InMemoryCache()
+        await cache.set("live", b"x")
+        await cache.set("dead", b"x", ttl=1)
+        later = time.monotonic_ns() + 2_000_000_000
+        monkeypatch.setattr(redis_client.time, "monotonic_ns", lambda: later)
+
+        assert await cache.keys("*") == ["live"]
+        await cache.close()
+
+    async def test_hyperscan_path_matches_regex_path(self, monkeypatch):
+        """Hyperscan matching agrees with the compiled-regex path."""
+        pytest.importorskip("hyperscan")
+        monkeypatch.setattr(redis_client, "HYPERSCAN_MIN_KEYS", 0)
+        cache = InMemoryCache()
+        keys = ["models:meta:a", "models:meta:bb", "models:all", "x:é", "a\nb"]
+        for key in keys:
+            await cache.set(key, b"x")
+
+        for pattern in ("models:meta:*", "models:meta:?", "*:é", "a*b", "*", "none*"):
+            expected = [k for k in keys if fnmatch.fnmatchcase(k, pattern)]
+            assert await cache.keys(pattern) == expected
+
+    async def test_key_type_filter(self):
+        """Only the string type matches in-memory entries."""
+        cache = InMemoryCache()
+        await cache.set("k", b"v")
+
+        assert await cache.keys("*", key_type="string") == ["k"]
+        assert await cache.keys("*", key_type="hash") == []
+
+
+class TestInMemoryExpiry:
+    """Tests for InMemoryCache TTL handling."""
+
+    async def test_ttl_expires(self, monkeypatch):
+        """Entries disappear once their TTL has elapsed."""
+        cache = InMemoryCache()
+        await cache.set("k", b"v", ttl=5)
+        assert await cache.get("k") == b"v"
+
+        later = time.monotonic_ns() + 6_000_000_000
+        monkeypatch.setattr(redis_client.time, "monotonic_ns", lambda: later)
+
+        assert await cache.get("k") is None
+        assert await cache.exists("k") is False
+        await cache.close()
+
+    async def test_overwrite_without_ttl_survives_old_expiry(self, monkeypatch):
+        """A stale heap entry doesn't evict a newer value for the same key."""
+        cache = InMemoryCache()
+        await cache.set("k", b"old", ttl=1)
+        await cache.set("k", b"new")
+
+        later = time.monotonic_ns() + 2_000_000_000
+        cache._purge_expired(later, cache.EXPIRY_BATCH)
+
+        assert await cache.get("k") == b"new"
+        await cache.close()
+
+    async def test_background_purge(self, monkeypatch):
+        """The expiry task removes expired entries without any reads."""
+        monkeypatch.setattr(InMemoryCache, "EXPIRY_INTERVAL", 0.01)
+        monkeypatch.setattr(InMemoryCache, "EXPIRY_BATCH", 2)
+        cache = InMemoryCache()
+        for i in range(5):
+            await cache.set(f"k{i}", b"v", ttl=1)
+        await cache.set("keep", b"v")
+
+        later = time.monotonic_ns() + 2_000_000_000
+        monkeypatch.setattr(redis_client.time, "monotonic_ns", lambda: later)
+        await asyncio.sleep(0.05)
+
+        assert list(cache._store) == ["keep"]
+        assert cache._expiry == []
+        # Nothing left to expire, so the task has stopped
+        assert cache._expiry_task is None
+
+        await cache.set("again", b"v", ttl=1)
+        assert cache._expiry_task is not None
+        await cache.close()
+        assert cache._expiry_task is None
+
+    async def test_expire_extends_ttl(self, monkeypatch):
+        """expire() resets the TTL of a live key and reports missing keys."""
+        cache = InMemoryCache()
+        await cache.set("k", b"v", ttl=5)
+
+        assert await cache.expire("k", 60) is True
+        assert await cache.expire("missing", 60) is False
+
+        later = time.monotonic_ns() + 10_000_000_000
+        monkeypatch.setattr(redis_client.time, "monotonic_ns", lambda: later)
+        assert await cache.get("k") == b"v"
+        await cache.close()
+
+    async def test_heap_compacts_after_overwrites(self):
+        """Repeated overwrites don't grow the expiry heap without bound."""
+        cache = InMemoryCache()
+        for _ in range(1000):
+            await cache.set("k", b"v", ttl=60)
+
+        cache._compact_expiry()
+
+        assert cache._expiry == [(cache._store["k"][1], "k")]
+        await cache.close()
+
+
+class FakeScanRedis:
+    """Minimal async Redis stand-in that pages SCAN results."""
+
+    def __init__(self, pages: list[list[str]]):
+        self.pages = pages
+        self.calls: list[int] = []
+
+    async def scan(self, cursor, match=None, count=None, _type=None):
+        self.calls.append(cursor)
+        await asyncio.sleep(0)
+        next_cursor = cursor + 1 if cursor + 1 < len(self.pages) else 0
+        return next_cursor, [key.encode() for key in self.pages[cursor]]
+
+
+class TestRedisScan:
+    """Tests for RedisCache SCAN iteration."""
+
+    def make_cache(self, pages: list[list[str]]) -> RedisCache:
+        cache = RedisCache("redis://localhost:6379")
+        cache._redis = FakeScanRedis(pages)
+        cache._connected = True
+        return cache
+
+    async def test_keys_collects_all_pages(self):
+        """keys() follows the cursor until SCAN returns 0."""
+        cache = self.make_cache([["a", "b"], [], ["c"]])
+
+        assert await cache.keys("*") == ["a", "b", "c"]
+        assert cache._redis.calls == [0, 1, 2]
+
+    async def test_next_page_prefetched(self):
+        """The next SCAN is issued before the current page is consumed."""
+        cache = self.make_cache([["a"], ["b"]])
+        keys = cache.scan_iter("*")
+
+        assert await keys.__anext__() == "a"
+        await asyncio.sleep(0)
+        assert cache._redis.calls == [0, 1]
+        await keys.aclose()
+
+
+class TestRedisReconnect:
+    """Tests for RedisCache reconnect serialization and backoff."""
+
+    async def test_concurrent_reconnects_share_one_attempt(self):
+        """Only one connection attempt runs for concurrent callers."""
+        cache = RedisCache("redis://localhost:6379")
+        attempts = 0
+
+        async def fake_connect():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            cache._redis = object()
+            cache._connected = True
+            return True
+
+        cache._connect = fake_connect
+
+        results = await asyncio.gather(*(cache._ensure_connection() for _ in range(10)))
+
+        assert all(results)
+        assert attempts == 1
+
+    async def test_failed_connect_backs_off(self):
+        """After a failure, attempts are skipped until the backoff elapses."""
+        cache = RedisCache("redis://localhost:6379")
+        attempts = 0
+
+        async def failing_connect():
+            nonlocal attempts
+            attempts += 1
+            return False
+
+        cache._connect = failing_connect
+
+        assert await cache._ensure_connection() is False
+        assert await cache._ensure_connection() is False
+        assert attempts == 1
+
+        cache._last_fail_ns -= cache._backoff_ns
+        assert await cache._ensure_connection() is False
+        assert attempts == 2
+        assert cache._backoff_ns == 2 * redis_client.RECONNECT_BACKOFF_INITIAL_NS
+
+
+class TestClientEncoding:
+    """Tests for CacheClient str/bytes boundaries."""
+
+    async def test_backend_stores_bytes(self):
+        """Strings are encoded once on set and decoded on get."""
+        backend = InMemoryCache()
+        client = make_client(backend)
+        await client.set("k", "héllo")
+
+        assert await backend.get("k") == "héllo".encode()
+        assert await client.get("k") == "héllo"
+        assert await client.get_bytes("k") == "héllo".encode()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_json_round_trip(self, monkeypatch, use_orjson):
+        """set_json/get_json round-trip with or without orjson installed."""
+        if not use_orjson:
+            monkeypatch.setattr(redis_client, "orjson", None)
+        client = make_client(InMemoryCache())
+        value = {"a": [1, 2.5, None], 3: {"nested": "é"}, "s": (1, 2), "o": {7}}
+
+        await client.set_json("k", value)
+        client.invalidate()
+
+        assert await client.get_json("k") == {
+            "a": [1, 2.5, None],
+            "3": {"nested": "é"},
+            "s": [1, 2],
+            "o": "{7}",
+        }
+
+    async def test_get_json_invalid_payload(self):
+        """Undecodable payloads read back as None."""
+        client = make_client(InMemoryCache())
+        await client.set("bad", b"\xff\xfe{")
+
+        assert await client.get_json("bad") is None
+
+
+class TestLocalJsonCache:
+    """Tests for CacheClient's in-process get_json cache."""
+
+    async def test_repeat_reads_skip_backend(self):
+        """A hot key is decoded once and then served locally."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("k", '{"a": 1}')
+
+        first = await client.get_json("k")
+        second = await client.get_json("k")
+
+        assert second is first
+        assert backend.get_calls == 1
+
+    async def test_expires_after_ttl(self):
+        """Entries past their local expiry are fetched again."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set("k", '{"a": 1}')
+        await client.get_json("k")
+
+        expires_at, value = client._jsoncache["k"]
+        client._jsoncache["k"] = (expires_at - redis_client.JSON_LOCAL_CACHE_TTL - 1, value)
+        await client.get_json("k")
+
+        assert backend.get_calls == 2
+
+    async def test_set_json_populates_round_tripped_value(self):
+        """set_json caches the value as it decodes, without a backend read."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set_json("k", {"t": (1, 2)})
+
+        assert await client.get_json("k") == {"t": [1, 2]}
+        assert backend.get_calls == 0
+
+    async def test_writes_and_invalidate_clear_entry(self):
+        """set, delete and invalidate drop the locally cached value."""
+        backend = CountingCache()
+        client = make_client(backend)
+        await client.set_json("k", {"v": 1})
+
+        await client.set("k", '{"v": 2}')
+        assert await client.get_json("k") == {"v": 2}
+
+        await client.delete("k")
+        assert await client.get_json("k") is None
+
+        await backend.set("k", b'{"v": 3}')
+        client.invalidate("k")
+        assert await client.get_json("k") == {"v": 3}
+
+    async def test_bounded_size(self, monkeypatch):
+        """The least recently used entry is evicted past the size limit."""
+        monkeypatch.setattr(redis_client, "JSON_LOCAL_CACHE_SIZE", 2)
+        client = make_client(InMemoryCache())
+        for key in ("a", "b", "c"):
+            await client.set_json(key, key)
+
+        assert list(client._jsoncache) == ["b", "c"]
@@ -0,0 +1,442 @@
+"""Tests for LocalFileEditor."""
+
+import difflib
+import os
+import re
+
+import pytest
+
+from chimera_core.filesystem.editor import FileTooLargeError, LocalFileEditor
+
+
+@pytest.fixture
+def editor(tmp_path):
+    return LocalFileEditor(str(tmp_path))
+
+
+class TestReadWrite:
+    """Tests for read_file and write_file."""
+
+    def test_roundtrip_reports_byte_sizes(self, editor, tmp_path):
+        """Sizes are UTF-8 byte counts, not character counts."""
+        result = editor.write_file("sub/a.txt", "héllo\n")
+
+        assert result.was_created is True
+        assert result.bytes_written == 7
+        assert (tmp_path / "sub" / "a.txt").read_bytes() == "héllo\n".encode()
+
+        read = editor.read_file("sub/a.txt")
+        assert read.content == "héllo\n"
+        assert read.size_bytes == 7
+
+    def test_overwrite_not_created(self, editor):
+        """Overwriting an existing file reports was_created=False."""
+        editor.write_file("a.txt", "one")
+
+        assert editor.write_file("a.txt", "two").was_created is False
+        assert editor.read_file("a.txt").content == "two"
+
+    def test_read_normalizes_newlines(self, editor, tmp_path):
+        """CRLF and CR line endings read back as LF."""
+        (tmp_path / "crlf.txt").write_bytes(b"a\r\nb\rc\n")
+
+        assert editor.read_file("crlf.txt").content == "a\nb\nc\n"
+
+    def test_large_file_read_via_mmap(self, editor, tmp_path, monkeypatch):
+        """Files above the mmap threshold decode the same as small ones."""
+        monkeypatch.setattr(LocalFileEditor, "MMAP_THRESHOLD", 8)
+        (tmp_path / "big.txt").write_bytes("héllo\r\nwörld\n".encode() * 10)
+
+        result = editor.read_file("big.txt")
+
+        assert result.content == "héllo\nwörld\n" * 10
+        assert result.size_bytes == len("héllo\r\nwörld\n".encode()) * 10
+
+    def test_read_missing_file(self, editor):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            editor.read_file("missing.txt")
+
+    def test_read_directory_rejected(self, editor, tmp_path):
+        """Directories are not readable as files."""
+        (tmp_path / "d").mkdir()
+
+        with pytest.raises(ValueError):
+            editor.read_file("d")
+
+    def test_read_binary_file(self, editor, tmp_path):
+        """Non-UTF-8 content raises UnicodeDecodeError."""
+        (tmp_path / "bin").write_bytes(b"\xff\xfe\x00")
+
+        with pytest.raises(UnicodeDecodeError):
+            editor.read_file("bin")
+
+    def test_read_large_binary_file(self, editor, tmp_path, monkeypatch):
+        """The mmap path also rejects non-UTF-8 content."""
+        monkeypatch.setattr(LocalFileEditor, "MMAP_THRESHOLD", 1)
+        (tmp_path / "bin").write_bytes(b"\xff\xfe\x00\x01")
+
+        with pytest.raises(UnicodeDecodeError):
+            editor.read_file("bin")
+
+
+class TestListPaths:
+    """Tests for list_paths."""
+
+    def make_tree(self, tmp_path):
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "x.py").write_text("x")
+        (tmp_path / "a" / "deep").mkdir()
+        (tmp_path / "a" / "deep" / "y.py").write_text("y")
+
+    def test_non_recursive(self, editor, tmp_path):
+        """Only direct children are listed, sorted by path."""
+        self.make_tree(tmp_path)
+
+        items = editor.list_paths(".")
+
+        assert [(i.path, i.type) for i in items] == [("a", "directory"), ("b.txt", "file")]
+        assert all(i.last_modified == "just now" for i in items)
+
+    def test_recursive(self, editor, tmp_path):
+        """Recursive listing returns paths relative to the base."""
+        self.make_tree(tmp_path)
+
+        paths = [i.path for i in editor.list_paths(".", recursive=True)]
+
+        assert paths == ["a", "a/deep", "a/deep/y.py", "a/x.py", "b.txt"]
+
+    def test_symlinked_dir_not_descended(self, editor, tmp_path):
+        """Symlinked directories are listed but not walked."""
+        self.make_tree(tmp_path)
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+
+        items = {i.path: i.type for i in editor.list_paths(".", recursive=True)}
+
+        assert items["link"] == "directory"
+        assert not any(p.startswith("link/") for p in items)
+
+    def test_wide_tree_parallel_walk(self, editor, tmp_path, monkeypatch):
+        """The threaded walk finds every entry across many subtrees."""
+        monkeypatch.setattr(LocalFileEditor, "LIST_WORKERS", 2)
+        expected = []
+        for i in range(6):
+            for j in range(3):
+                (tmp_path / f"d{i}" / f"s{j}").mkdir(parents=True)
+                (tmp_path / f"d{i}" / f"s{j}" / "f.txt").write_text("x")
+                expected += [f"d{i}/s{j}", f"d{i}/s{j}/f.txt"]
+            expected.append(f"d{i}")
+
+        paths = [i.path for i in editor.list_paths(".", recursive=True)]
+
+        assert paths == sorted(expected)
+
+    def test_missing_base(self, editor):
+        """A missing base directory lists as empty."""
+        assert editor.list_paths("nope") == []
+
+
+class TestRelativeTime:
+    """Tests for relative modification-time labels."""
+
+    @pytest.mark.parametrize(
+        ("age", "label"),
+        [
+            (-5, "just now"),
+            (59.9, "just now"),
+            (60, "1 minute ago"),
+            (3599, "59 minutes ago"),
+            (3600, "1 hour ago"),
+            (86400 * 2, "2 days ago"),
+            (604800, "1 week ago"),
+            (2592000 * 3, "3 months ago"),
+            (31536000 * 2 + 5, "2 years ago"),
+        ],
+    )
+    def test_labels(self, editor, age, label):
+        """Each age maps to the expected unit and plural form."""
+        assert editor._format_relative_time(1_000_000_000.0, 1_000_000_000.0 - age) == label
+
+
+class TestEditFile:
+    """Tests for edit_file replacement and diff output."""
+
+    def reference_diff(self, old: str, new: str, filename: str) -> str:
+        return "".join(
+            difflib.unified_diff(
+                old.splitlines(keepends=True),
+                new.splitlines(keepends=True),
+                fromfile=f"a/{filename}",
+                tofile=f"b/{filename}",
+                lineterm="",
+                n=2,
+            )
+        )
+
+    def apply_diff(self, old: str, diff: str) -> str:
+        """Apply a diff as emitted by edit_file (lineterm="" headers) to old."""
+        lines = old.splitlines(keepends=True)
+        hunks = re.split(r"@@ -(\d+)(?:,\d+)? \+\d+(?:,\d+)? @@", diff)[1:]
+        offset = 0
+        for start, body in zip(hunks[::2], hunks[1::2]):
+            body_lines = body.splitlines(keepends=True)
+            before = [ln[1:] for ln in body_lines if ln[0] in " -"]
+            after = [ln[1:] for ln in body_lines if ln[0] in " +"]
+            index = max(int(start) - 1, 0) + offset
+            assert lines[index : index + len(before)] == before
+            lines[index : index + len(before)] = after
+            offset += len(after) - len(before)
+        return "".join(lines)
+
+    def test_single_replacement(self, editor, tmp_path):
+        """A unique match is replaced and the diff matches difflib's."""
+        original = "".join(f"line {i}\n" for i in range(20))
+        target = tmp_path / "f.txt"
+        target.write_text(original)
+
+        diff = editor.edit_file("f.txt", "line 7\n", "line seven\n")
+
+        expected = original.replace("line 7\n", "line seven\n")
+        assert target.read_text() == expected
+        assert diff == self.reference_diff(original, expected, str(target))
+
+    def test_replace_all_multiple_hunks(self, editor, tmp_path):
+        """Distant matches produce separate hunks; nearby ones share one."""
+        original = "".join(f"{'x' if i in (1, 2, 15) else 'line'} {i}\n" for i in range(20))
+        target = tmp_path / "f.txt"
+        target.write_text(original)
+
+        diff = editor.edit_file("f.txt", "x ", "y ", replace_all=True)
+
+        expected = original.replace("x ", "y ")
+        assert target.read_text() == expected
+        assert diff.count("@@ -") == 2
+        assert diff == self.reference_diff(original, expected, str(target))
+        assert self.apply_diff(original, diff) == expected
+
+    def test_multiline_replacement(self, editor, tmp_path):
+        """Replacements spanning and adding lines are applied correctly."""
+        target = tmp_path / "f.txt"
+        target.write_text("a\nb\nc\nd\n")
+
+        diff = editor.edit_file("f.txt", "b\nc\n", "B\n")
+
+        assert target.read_text() == "a\nB\nd\n"
+        assert "@@ -1,4 +1,3 @@" in diff
+        assert self.apply_diff("a\nb\nc\nd\n", diff) == "a\nB\nd\n"
+
+    def test_diff_applies_but_may_differ_from_difflib(self, editor, tmp_path):
+        """Region diffs don't keep unchanged inner lines as context, but still apply."""
+        original = "".join(f"line {i}\n" for i in range(10))
+        target = tmp_path / "f.txt"
+        target.write_text(original)
+
+        diff = editor.edit_file("f.txt", "line 3\nline 4\nline 5\n", "LINE 3\nline 4\nLINE 5\n")
+
+        expected = original.replace("line 3\n", "LINE 3\n").replace("line 5\n", "LINE 5\n")
+        assert target.read_text() == expected
+        assert "-line 4\n" in diff and "+line 4\n" in diff
+        assert diff != self.reference_diff(original, expected, str(target))
+        assert self.apply_diff(original, diff) == expected
+
+    def test_not_found(self, editor, tmp_path):
+        """A missing old_string raises ValueError."""
+        (tmp_path / "f.txt").write_text("abc")
+
+        with pytest.raises(ValueError, match="not found"):
+            editor.edit_file("f.txt", "zzz", "y")
+
+    def test_ambiguous_reports_total_count(self, editor, tmp_path):
+        """Without replace_all, multiple matches are rejected with the full count."""
+        (tmp_path / "f.txt").write_text("a a a a\n")
+
+        with pytest.raises(ValueError, match="appears 4 times"):
+            editor.edit_file("f.txt", "a", "b")
+        assert (tmp_path / "f.txt").read_text() == "a a a a\n"
+
+
+class TestAtomicWrite:
+    """Tests for temp-file-and-rename writes."""
+
+    def test_no_temp_files_left(self, editor, tmp_path):
+        """Writes and edits leave only the target file behind."""
+        editor.write_file("f.txt", "one\n")
+        editor.edit_file("f.txt", "one", "two")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["f.txt"]
+        assert (tmp_path / "f.txt").read_text() == "two\n"
+
+    def test_preserves_mode(self, editor, tmp_path):
+        """Overwriting keeps the existing file's permissions."""
+        target = tmp_path / "run.sh"
+        target.write_text("echo hi\n")
+        target.chmod(0o755)
+
+        editor.write_file("run.sh", "echo bye\n")
+
+        assert target.stat().st_mode & 0o777 == 0o755
+
+    def test_new_file_mode_follows_umask(self, editor, tmp_path):
+        """A new file gets 0o666 minus the umask, like open() would give it."""
+        old_umask = os.umask(0o027)
+        try:
+            editor.write_file("new.txt", "data")
+        finally:
+            os.umask(old_umask)
+
+        assert (tmp_path / "new.txt").stat().st_mode & 0o777 == 0o640
+
+    def test_keeps_hard_links(self, editor, tmp_path):
+        """A hard-linked file is rewritten in place, so every link sees the new content."""
+        target = tmp_path / "f.txt"
+        target.write_text("old")
+        os.link(target, tmp_path / "alias.txt")
+
+        assert editor.write_file("f.txt", "new").was_created is False
+
+        assert (tmp_path / "alias.txt").read_text() == "new"
+        assert target.stat().st_ino == (tmp_path / "alias.txt").stat().st_ino
+
+    def test_writes_through_symlink(self, editor, tmp_path):
+        """Writing to a symlink updates its target and keeps the link."""
+        real = tmp_path / "real.txt"
+        real.write_text("old")
+        (tmp_path / "link.txt").symlink_to(real)
+
+        result = editor.write_file("link.txt", "new")
+
+        assert result.was_created is False
+        assert (tmp_path / "link.txt").is_symlink()
+        assert real.read_text() == "new"
+
+    def test_fsync_option(self, tmp_path):
+        """The fsync option still produces the written content."""
+        editor = LocalFileEditor(str(tmp_path), fsync=True)
+
+        editor.write_file("f.txt", "data")
+
+        assert (tmp_path / "f.txt").read_text() == "data"
+
+
+class TestContentCache:
+    """Tests for reusing file content across reads and edits."""
+
+    def test_sequential_edits_reuse_cache(self, editor, tmp_path, monkeypatch):
+        """Edits after a write don't re-read the file from disk."""
+        editor.write_file("f.txt", "a\nb\nc\n")
+        monkeypatch.setattr("builtins.open", None)
+
+        editor.edit_file("f.txt", "a", "A")
+        editor.edit_file("f.txt", "b", "B")
+
+        monkeypatch.undo()
+        assert (tmp_path / "f.txt").read_text() == "A\nB\nc\n"
+
+    def test_external_change_invalidates(self, editor, tmp_path):
+        """A file replaced outside the editor is read fresh."""
+        target = tmp_path / "f.txt"
+        editor.write_file("f.txt", "one\n")
+        assert editor.read_file("f.txt").content == "one\n"
+
+        tmp = tmp_path / "other"
+        tmp.write_text("external\n")
+        tmp.replace(target)
+
+        assert editor.read_file("f.txt").content == "external\n"
+
+    def test_cache_bounded(self, editor, monkeypatch):
+        """Least recently used entries are evicted past the size limit."""
+        monkeypatch.setattr(LocalFileEditor, "CONTENT_CACHE_SIZE", 2)
+        for name in ("a", "b", "c"):
+            editor.write_file(name, name)
+
+        assert [k.rsplit("/", 1)[-1] for k in editor._content_cache] == ["b", "c"]
+
+    def test_cached_crlf_matches_read(self, editor):
+        """Text written with CRLF is cached as a read would return it."""
+        editor.write_file("f.txt", "a\r\nb\r\n")
+
+        assert editor.read_file("f.txt").content == "a\nb\n"
+
+
+class TestWriteBytes:
+    """Tests for the raw-bytes write path."""
+
+    def test_bytes_and_memoryview(self, editor, tmp_path):
+        """Bytes and memoryviews are written verbatim and measured in bytes."""
+        result = editor.write_bytes("a.bin", b"\x00\xff")
+        view = editor.write_bytes("b.bin", memoryview(bytearray(b"abcdef"))[2:])
+
+        assert result.bytes_written == 2
+        assert result.was_created is True
+        assert (tmp_path / "a.bin").read_bytes() == b"\x00\xff"
+        assert view.bytes_written == 4
+        assert (tmp_path / "b.bin").read_bytes() == b"cdef"
+
+    def test_invalidates_cached_text(self, editor):
+        """Raw writes replace any cached text for the path."""
+        editor.write_file("f.txt", "old\n")
+
+        editor.write_bytes("f.txt", b"new\n")
+
+        assert editor.read_file("f.txt").content == "new\n"
+
+
+class TestReadFileLimited:
+    """Tests for read_file_limited."""
+
+    def test_reads_within_limit_with_one_stat(self, editor, tmp_path, monkeypatch):
+        """Existence, type and size all come from the same stat as the read."""
+        (tmp_path / "a.txt").write_text("hello")
+        stats = []
+        original_stat = type(tmp_path).stat
+
+        def counting_stat(self, *args, **kwargs):
+            stats.append(self.name)
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(tmp_path), "stat", counting_stat)
+
+        assert editor.read_file_limited("a.txt", max_size=5).content == "hello"
+        assert stats == ["a.txt"]
+
+    def test_too_large(self, editor, tmp_path):
+        """Files over the limit raise FileTooLargeError with their size."""
+        (tmp_path / "big.txt").write_text("x" * 100)
+
+        with pytest.raises(FileTooLargeError) as exc_info:
+            editor.read_file_limited("big.txt", max_size=10)
+        assert exc_info.value.size_bytes == 100
+
+    def test_missing_and_directory(self, editor, tmp_path):
+        """Missing paths and directories are reported as not found."""
+        (tmp_path / "d").mkdir()
+
+        for path in ("missing.txt", "d", "missing.txt/child"):
+            with pytest.raises(FileNotFoundError):
+                editor.read_file_limited(path, max_size=10)
+
+
+class TestTryStat:
+    """Tests for try_stat and file_exists."""
+
+    def test_file_directory_and_missing(self, editor, tmp_path):
+        """One call reports existence, type and byte size."""
+        (tmp_path / "d").mkdir()
+        (tmp_path / "f.txt").write_bytes(b"12345")
+
+        file_stat = editor.try_stat("f.txt")
+        assert (file_stat.size_bytes, file_stat.is_file) == (5, True)
+        assert editor.try_stat("d").is_file is False
+        assert editor.try_stat("missing.txt") is None
+        assert editor.try_stat("f.txt/child") is None
+
+    def test_file_exists(self, editor, tmp_path):
+        """Only regular files exist for file_exists."""
+        (tmp_path / "d").mkdir()
+        (tmp_path / "f.txt").write_text("f")
+
+        assert editor.file_exists("f.txt") is True
+        assert editor.file_exists("d") is False
+        assert editor.file_exists("missing.txt") is False
@@ -0,0 +1,399 @@
+"""Tests for AgentFileTools."""
+
+import errno
+import os
+import threading
+import time
+
+import pytest
+from pydantic_ai.exceptions import ModelRetry
+
+from chimera_core.filesystem.editor import LocalFileEditor
+from chimera_core.filesystem.security import AgentFileTools, SecurityError, _openat2_beneath
+
+
+def make_tools(tmp_path, **kwargs):
+    return AgentFileTools(LocalFileEditor(), str(tmp_path), **kwargs)
+
+
+class TestCheckPatterns:
+    """Tests for include/exclude pattern filtering."""
+
+    def test_exclude_reports_matching_pattern(self, tmp_path):
+        """The error names the exclude pattern that matched."""
+        tools = make_tools(tmp_path, exclude_patterns=["*.exe", "build/*"])
+
+        with pytest.raises(SecurityError, match="exclude pattern 'build/\\*'"):
+            tools._check_patterns("build/out.txt")
+        tools._check_patterns("src/main.py")
+
+    def test_include_whitelist(self, tmp_path):
+        """Only paths matching some include pattern pass."""
+        tools = make_tools(tmp_path, include_patterns=["*.txt", "docs/*"])
+
+        tools._check_patterns("notes.txt")
+        tools._check_patterns("docs/guide.rst")
+        with pytest.raises(SecurityError, match="does not match any include pattern"):
+            tools._check_patterns("binary.exe")
+
+    def test_exclude_takes_precedence(self, tmp_path):
+        """A path matching both lists is rejected."""
+        tools = make_tools(tmp_path, include_patterns=["*.txt"], exclude_patterns=["secret*"])
+
+        with pytest.raises(SecurityError, match="exclude"):
+            tools._check_patterns("secret.txt")
+
+    def test_directory_only_patterns(self, tmp_path):
+        """Patterns with a trailing slash match directories and their contents."""
+        tools = make_tools(tmp_path, exclude_patterns=["cache/"])
+
+        with pytest.raises(SecurityError, match="exclude pattern 'cache/'"):
+            tools._check_patterns("cache", is_dir=True)
+        with pytest.raises(SecurityError):
+            tools._check_patterns("cache/entry.bin")
+        tools._check_patterns("cache")
+
+    def test_gitignore_negation_cannot_reinclude(self, tmp_path):
+        """A .gitignore negation doesn't override an explicit exclude."""
+        (tmp_path / ".gitignore").write_text("!*.key\n")
+        tools = make_tools(tmp_path, exclude_patterns=["*.key"])
+
+        with pytest.raises(SecurityError, match="exclude pattern"):
+            tools._check_patterns("id.key")
+
+    def test_unnormalized_paths_still_match(self, tmp_path):
+        """Redundant separators and dot segments can't sidestep a pattern."""
+        tools = make_tools(tmp_path, exclude_patterns=["docs/private/"])
+
+        for path in ("docs//private/x.md", "./docs/private/x.md", "docs/a/../private/x.md"):
+            with pytest.raises(SecurityError, match="exclude pattern"):
+                tools._check_patterns(path)
+
+    def test_gitignore(self, tmp_path):
+        """Paths ignored by .gitignore are rejected."""
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        tools = make_tools(tmp_path)
+
+        with pytest.raises(SecurityError, match=".gitignore"):
+            tools._check_patterns("debug.log")
+        tools._check_patterns("debug.txt")
+
+    def test_extension_and_name_patterns(self, tmp_path):
+        """Set-matched patterns follow gitignore rules at any depth."""
+        tools = make_tools(tmp_path, exclude_patterns=["*.log", "node_modules", "tmp/"])
+
+        for path in ("app.log", "a/b/app.log", "logs.log/x.txt", "web/node_modules/x.js"):
+            with pytest.raises(SecurityError):
+                tools._check_patterns(path)
+        with pytest.raises(SecurityError, match="exclude pattern 'tmp/'"):
+            tools._check_patterns("tmp/scratch.txt")
+        tools._check_patterns("app.logs")
+        tools._check_patterns("tmp")  # a file named tmp, not the directory
+
+    def test_no_filters_allows_everything(self, tmp_path):
+        """Without patterns or .gitignore files, every path passes."""
+        tools = make_tools(tmp_path)
+
+        tools._check_patterns("anything.exe")
+        tools._check_patterns("dir", is_dir=True)
+        tools._check_patterns("dir/nested/file.log")
+
+    def test_results_are_memoized(self, tmp_path):
+        """Repeat checks of a path reuse the cached result, including rejections."""
+        tools = make_tools(tmp_path, exclude_patterns=["*.exe"])
+
+        for _ in range(3):
+            tools._check_patterns("ok.txt")
+            with pytest.raises(SecurityError):
+                tools._check_patterns("bad.exe")
+
+        info = tools._pattern_error.cache_info()
+        assert (info.misses, info.hits) == (2, 4)
+
+
+class TestGitignore:
+    """Tests for .gitignore handling."""
+
+    def test_nested_gitignore_without_root(self, tmp_path):
+        """A nested .gitignore applies even when base_path has none."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / ".gitignore").write_text("*.tmp\n")
+        tools = make_tools(tmp_path)
+
+        assert tools.gitignore_spec is None
+        with pytest.raises(SecurityError, match=".gitignore"):
+            tools._check_patterns("sub/a.tmp")
+        tools._check_patterns("a.tmp")
+        tools._check_patterns("sub/a.txt")
+
+    def test_nested_gitignore(self, tmp_path):
+        """Nested .gitignore files apply below their directory and can re-include."""
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / ".gitignore").write_text("*.tmp\n!keep.log\n")
+        tools = make_tools(tmp_path)
+
+        with pytest.raises(SecurityError, match=".gitignore"):
+            tools._check_patterns("sub/scratch.tmp")
+        with pytest.raises(SecurityError, match=".gitignore"):
+            tools._check_patterns("sub/app.log")
+        tools._check_patterns("scratch.tmp")
+        tools._check_patterns("sub/keep.log")
+
+    def test_ignored_directory_contents_stay_ignored(self, tmp_path):
+        """A negation can't re-include a file whose directory is ignored."""
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / ".gitignore").write_text("!keep.txt\n")
+        tools = make_tools(tmp_path)
+
+        with pytest.raises(SecurityError, match=".gitignore"):
+            tools._check_patterns("build/keep.txt")
+
+    def test_parsed_spec_shared_until_modified(self, tmp_path):
+        """Instances reuse the parsed .gitignore until its mtime changes."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.log\n")
+        first = make_tools(tmp_path).gitignore_spec
+
+        assert make_tools(tmp_path).gitignore_spec is first
+
+        gitignore.write_text("*.tmp\n")
+        stat = gitignore.stat()
+        os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        tools = make_tools(tmp_path)
+
+        assert tools.gitignore_spec is not first
+        tools._check_patterns("app.log")
+
+
+class TestResolvePath:
+    """Tests for sandbox path validation."""
+
+    def test_plain_paths(self, tmp_path):
+        """Existing and not-yet-created paths resolve inside base_path."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "f.txt").write_text("f")
+        tools = make_tools(tmp_path)
+        base = tmp_path.resolve()
+
+        assert tools._resolve_and_validate_path("a/f.txt") == base / "a" / "f.txt"
+        assert tools._resolve_and_validate_path("a/./new.txt") == base / "a" / "new.txt"
+        assert tools._resolve_and_validate_path("new/dir/x.txt") == base / "new" / "dir" / "x.txt"
+        assert tools._resolve_and_validate_path(".") == base
+
+    def test_traversal_rejected(self, tmp_path):
+        """Paths escaping base_path via '..' or absolute paths are rejected."""
+        tools = make_tools(tmp_path)
+
+        for path in ("../outside.txt", "a/../../outside.txt", "/etc/passwd"):
+            with pytest.raises(SecurityError, match="outside allowed base path"):
+                tools._resolve_and_validate_path(path)
+
+    def test_symlinks_rejected(self, tmp_path):
+        """Symlinks aren't followed, whether they point inside base_path or not."""
+        base = tmp_path / "base"
+        outside = tmp_path / "outside"
+        base.mkdir()
+        outside.mkdir()
+        (outside / "secret.txt").write_text("s")
+        (base / "real").mkdir()
+        (base / "file_link").symlink_to(outside / "secret.txt")
+        (base / "dir_link").symlink_to(outside)
+        (base / "inner_link").symlink_to(base / "real")
+        tools = make_tools(base)
+
+        with pytest.raises(SecurityError, match="is a symlink"):
+            tools._resolve_and_validate_path("file_link")
+        for path in ("dir_link/secret.txt", "inner_link/new.txt", "real/../inner_link/x"):
+            with pytest.raises(SecurityError, match="symlinked directory"):
+                tools._resolve_and_validate_path(path)
+
+    def test_kernel_check(self, tmp_path):
+        """Where openat2 is available, it validates existing paths beneath base_path."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "f.txt").write_text("f")
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+        tools = make_tools(tmp_path)
+        if tools._base_fd is None:
+            pytest.skip("openat2 not available")
+
+        assert _openat2_beneath(tools._base_fd, "a/f.txt") == 0
+        assert _openat2_beneath(tools._base_fd, "link/f.txt") == errno.ELOOP
+        assert _openat2_beneath(tools._base_fd, "../x") == errno.EXDEV
+        assert tools._resolve_and_validate_path("a/f.txt") == tmp_path.resolve() / "a" / "f.txt"
+        with pytest.raises(SecurityError, match="symlinked directory"):
+            tools._resolve_and_validate_path("link/f.txt")
+
+    def test_kernel_check_new_paths(self, tmp_path, monkeypatch):
+        """Paths not created yet are checked by the kernel via their nearest existing ancestor."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+        tools = make_tools(tmp_path)
+        if tools._base_fd is None:
+            pytest.skip("openat2 not available")
+        # Take the realpath fallback out so only the kernel decides
+        monkeypatch.setattr(tools, "_is_real_dir", lambda dir_path: True)
+
+        assert (
+            tools._resolve_and_validate_path("a/new/deep.txt")
+            == tmp_path.resolve() / "a" / "new" / "deep.txt"
+        )
+        with pytest.raises(SecurityError, match="symlink"):
+            tools._resolve_and_validate_path("link/new/deep.txt")
+
+    @pytest.mark.parametrize("kernel_check", [True, False])
+    def test_swapped_ancestor_rejected(self, tmp_path, kernel_check):
+        """Replacing a checked directory's ancestor with a symlink is caught on the next write."""
+        base = tmp_path / "base"
+        outside = tmp_path / "outside"
+        base.mkdir()
+        outside.mkdir()
+        tools = make_tools(base)
+        if not kernel_check:
+            tools._base_fd = None
+        elif tools._base_fd is None:
+            pytest.skip("openat2 not available")
+
+        tools.write_file("a/b/x.txt", "x")
+        tools.write_file("a/b/y.txt", "y")  # a/b now exists when it is checked
+        (base / "a").rename(outside / "a")
+        (base / "a").symlink_to(outside / "a")
+
+        with pytest.raises(ModelRetry, match="symlinked directory"):
+            tools.write_file("a/b/new.txt", "escaped")
+        assert not (outside / "a" / "b" / "new.txt").exists()
+
+    def test_read_through_symlink_denied(self, tmp_path):
+        """read_file surfaces a rejected symlink as ModelRetry."""
+        (tmp_path / "target.txt").write_text("t")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "target.txt")
+        tools = make_tools(tmp_path)
+
+        with pytest.raises(ModelRetry, match="Access denied"):
+            tools.read_file("link.txt")
+        assert tools.read_file("target.txt") == "t"
+
+
+class TestReadFile:
+    """Tests for read_file checks."""
+
+    def test_too_large_rejected_before_reading(self, tmp_path, monkeypatch):
+        """Oversized files are refused from their stat, without being read."""
+        (tmp_path / "big.txt").write_text("x" * 100)
+        tools = make_tools(tmp_path, max_file_size=10)
+        monkeypatch.setattr(
+            tools.editor, "_read_text", lambda *args: pytest.fail("file should not be read")
+        )
+
+        with pytest.raises(ModelRetry, match="too large \\(100 bytes\\)"):
+            tools.read_file("big.txt")
+
+    def test_missing_and_directory(self, tmp_path):
+        """Missing paths and directories are reported as not found."""
+        (tmp_path / "d").mkdir()
+        tools = make_tools(tmp_path)
+
+        for path in ("missing.txt", "d"):
+            with pytest.raises(ModelRetry, match="File not found"):
+                tools.read_file(path)
+
+
+class TestListAllPaths:
+    """Tests for list_all_paths filtering."""
+
+    def test_filters_by_patterns(self, tmp_path):
+        """Excluded files are left out of the listing."""
+        (tmp_path / "keep.txt").write_text("k")
+        (tmp_path / "drop.exe").write_text("d")
+        tools = make_tools(tmp_path, exclude_patterns=["*.exe"])
+
+        assert [p.path for p in tools.list_all_paths()] == ["keep.txt"]
+
+    def test_nested_files_match_include_patterns(self, tmp_path):
+        """Directories are walked even when they don't match include patterns."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.txt").write_text("a")
+        (tmp_path / "docs" / "b.py").write_text("b")
+        tools = make_tools(tmp_path, include_patterns=["*.txt"])
+
+        assert [p.path for p in tools.list_all_paths()] == ["docs/a.txt"]
+
+    def test_excluded_directories_are_pruned(self, tmp_path):
+        """Excluded directories are not descended, so their contents are skipped."""
+        (tmp_path / ".gitignore").write_text("node_modules/\n")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.txt").write_text("o")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("m")
+        tools = make_tools(tmp_path, exclude_patterns=["build"])
+
+        listed = [p.path for p in tools.list_all_paths()]
+
+        assert listed == [".gitignore", "src", "src/main.py"]
+
+    def test_symlinked_directories_not_followed(self, tmp_path):
+        """A directory symlink is listed but not descended into."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "f.txt").write_text("f")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        tools = make_tools(tmp_path)
+
+        listed = [p.path for p in tools.list_all_paths()]
+
+        assert listed == ["link", "real", "real/f.txt"]
+
+    def test_prefix(self, tmp_path):
+        """Paths under a prefix are reported relative to base_path."""
+        (tmp_path / "docs" / "api").mkdir(parents=True)
+        (tmp_path / "docs" / "api" / "ref.md").write_text("r")
+        (tmp_path / "other.md").write_text("o")
+        tools = make_tools(tmp_path)
+
+        for prefix in ("docs", "docs/", "./docs"):
+            listed = [p.path for p in tools.list_all_paths(prefix=prefix)]
+
+            assert listed == ["docs/api", "docs/api/ref.md"]
+
+    async def test_async_matches_sync(self, tmp_path):
+        """The concurrent async walk returns the same listing."""
+        (tmp_path / ".gitignore").write_text("skip/\n")
+        for d in ("a/b/c", "a/d", "e", "skip/x"):
+            (tmp_path / d).mkdir(parents=True)
+            (tmp_path / d / "f.txt").write_text("f")
+        tools = make_tools(tmp_path)
+
+        listed = await tools.list_all_paths_async()
+
+        assert listed == tools.list_all_paths()
+        assert "a/b/c/f.txt" in [p.path for p in listed]
+        assert not any(p.path.startswith("skip/") for p in listed)
+
+    async def test_sibling_directories_listed_concurrently(self, tmp_path):
+        """With a slow editor, the async walk overlaps sibling directory listings."""
+
+        class SlowEditor(LocalFileEditor):
+            active = 0
+            max_active = 0
+            lock = threading.Lock()
+
+            def list_paths(self, base_path, recursive=False):
+                with self.lock:
+                    SlowEditor.active += 1
+                    SlowEditor.max_active = max(SlowEditor.max_active, SlowEditor.active)
+                time.sleep(0.05)
+                with self.lock:
+                    SlowEditor.active -= 1
+                return super().list_paths(base_path, recursive)
+
+        for i in range(4):
+            (tmp_path / f"d{i}").mkdir()
+            (tmp_path / f"d{i}" / "f.txt").write_text("f")
+        tools = AgentFileTools(SlowEditor(), str(tmp_path))
+
+        listed = [p.path for p in await tools.list_all_paths_async()]
+
+        assert len(listed) == 8
+        assert SlowEditor.max_active > 1
@@ -135,6 +135,18 @@ class TestBuildEnhancedUserMessage:
         assert "<user_input>" in result
         assert "What's the weather?" in result
 
+    def test_ambient_layout(self):
+        """Test the exact layout of the enhanced message."""
+        result = build_enhanced_user_message(
+            user_input="Hi",
+            ambient_instructions=["First rule.", "Second rule."],
+        )
+
+        assert result == (
+            "<ambient_context>\nFirst rule.\nSecond rule.\n</ambient_context>\n\n"
+            "<user_input>\nHi\n</user_input>"
+        )
+
     def test_message_with_attachments_returns_list(self):
         """Test message with attachments returns list of content parts."""
         # Create a minimal valid base64 data URI (1x1 red PNG pixel)
@@ -215,6 +227,18 @@ class TestBuildEnhancedUserMessage:
         assert isinstance(result[1], BinaryContent)
         assert isinstance(result[2], BinaryContent)
 
+    def test_repeated_attachment_decoded_once(self):
+        """Test that re-sending an attachment reuses the decoded content."""
+        png_data_uri = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+        attachment = Attachment(data_uri=png_data_uri, media_type="image/png")
+
+        first = build_enhanced_user_message("Turn one", attachments=[attachment])
+        second = build_enhanced_user_message("Turn two", attachments=[attachment])
+
+        assert second[1] is not first[1]
+        assert second[1].data is first[1].data
+        assert second[1].media_type == "image/png"
+
     def test_empty_attachments_list_returns_string(self):
         """Test that empty attachments list returns string (not list)."""
         result = build_enhanced_user_message(
@@ -0,0 +1,37 @@
+"""Tests for the space decision protocol types."""
+
+import dataclasses
+from typing import get_args
+
+import pytest
+
+from chimera_core.protocols.space_decision import (
+    COMPLETE,
+    CONTINUE,
+    SpaceDecision,
+    TurnDecision,
+)
+
+
+class TestTurnDecision:
+    """Tests for TurnDecision."""
+
+    def test_defaults(self):
+        """next_prompt defaults to an empty string."""
+        decision = TurnDecision(decision="complete")
+
+        assert decision.decision == "complete"
+        assert decision.next_prompt == ""
+
+    def test_immutable_and_slotted(self):
+        """Decisions can't be modified and carry no per-instance __dict__."""
+        decision = TurnDecision(decision="continue", next_prompt="next")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.next_prompt = "other"
+        assert not hasattr(decision, "__dict__")
+
+    def test_decision_constants_match_literal(self):
+        """CONTINUE/COMPLETE are exactly the SpaceDecision literal values."""
+        assert get_args(SpaceDecision) == (CONTINUE, COMPLETE)
+        assert TurnDecision(decision=CONTINUE).decision is CONTINUE
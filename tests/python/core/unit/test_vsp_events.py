@@ -0,0 +1,53 @@
+"""Tests for camelCase VSP event models."""
+
+from chimera_core.ui.utils import to_camel
+from chimera_core.ui.vsp_events import (
+    TextDeltaEvent,
+    ToolInputAvailableEvent,
+    VSPBaseModel,
+    build_vsp_models,
+)
+
+
+class TestCamelAliases:
+    """Tests for snake_case to camelCase aliasing."""
+
+    def test_to_camel(self):
+        """Snake case names convert to camelCase."""
+        assert to_camel("tool_call_id") == "toolCallId"
+        assert to_camel("type") == "type"
+
+    def test_to_camel_is_memoized(self):
+        """Repeated field names are served from the cache."""
+        to_camel("provider_metadata")
+        hits = to_camel.cache_info().hits
+
+        assert to_camel("provider_metadata") == "providerMetadata"
+        assert to_camel.cache_info().hits == hits + 1
+
+    def test_event_round_trip(self):
+        """Events serialize camelCase and parse from either casing."""
+        event = ToolInputAvailableEvent(
+            tool_call_id="call-1", tool_name="weather", input={}, timestamp="2025-01-01T00:00:00Z"
+        )
+
+        data = event.model_dump(by_alias=True, exclude_none=True)
+
+        assert data["toolCallId"] == "call-1"
+        assert ToolInputAvailableEvent.model_validate(data) == event
+
+
+class TestDeferredBuild:
+    """Tests for deferred VSP schema construction."""
+
+    def test_build_vsp_models(self):
+        """Warm-up builds every event model's schema."""
+        assert build_vsp_models() >= len(VSPBaseModel.__subclasses__())
+        assert all(model.__pydantic_complete__ for model in VSPBaseModel.__subclasses__())
+
+    def test_aliases_survive_deferred_build(self):
+        """Models built lazily still alias and validate by name."""
+        event = TextDeltaEvent.model_validate({"id": "t1", "delta": "hi", "threadId": "th"})
+
+        assert event.thread_id == "th"
+        assert event.model_dump(by_alias=True)["threadId"] == "th"